@@ -0,0 +1,22 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+_file_map = {
+
+    "clients.baml": "// Learn more about clients at https://docs.boundaryml.com/docs/snippets/clients/overview\n\nclient<llm> CustomGPT4o {\n  provider openai\n  options {\n    model \"gpt-4o\"\n    api_key env.OPENAI_API_KEY\n  }\n}\n\nclient<llm> CustomGPT4oMini {\n  provider openai\n  retry_policy Exponential\n  options {\n    model \"gpt-4o-mini\"\n    api_key env.OPENAI_API_KEY\n  }\n}\n\nclient<llm> CustomSonnet {\n  provider anthropic\n  retry_policy RateLimitRetry\n  options {\n    model \"claude-sonnet-4-20250514\"\n    api_key env.ANTHROPIC_API_KEY\n  }\n}\n\n\nclient<llm> CustomHaiku {\n  provider anthropic\n  retry_policy Constant\n  options {\n    model \"claude-3-haiku-20240307\"\n    api_key env.ANTHROPIC_API_KEY\n  }\n}\n\n// https://docs.boundaryml.com/docs/snippets/clients/round-robin\nclient<llm> CustomFast {\n  provider round-robin\n  options {\n    // This will alternate between the two clients\n    strategy [CustomGPT4oMini, CustomHaiku]\n  }\n}\n\n// https://docs.boundaryml.com/docs/snippets/clients/fallback\nclient<llm> OpenaiFallback {\n  provider fallback\n  options {\n    // This will try the clients in order until one succeeds\n    strategy [CustomGPT4oMini, CustomGPT4oMini]\n  }\n}\n\n// Rate limit aware fallback strategy - tries Sonnet first, falls back to cheaper models\nclient<llm> RateLimitAware {\n  provider fallback\n  options {\n    // Try Sonnet first, then fall back to cheaper models if rate limited\n    strategy [CustomSonnet, CustomHaiku, CustomGPT4oMini]\n  }\n}\n\n// https://docs.boundaryml.com/docs/snippets/clients/retry\nretry_policy Constant {\n  max_retries 3\n  // Strategy is optional\n  strategy {\n    type constant_delay\n    delay_ms 200\n  }\n}\n\nretry_policy Exponential {\n  max_retries 2\n  // Strategy is optional\n  strategy {\n    type exponential_backoff\n    delay_ms 300\n    multiplier 1.5\n    max_delay_ms 10000\n  }\n}\n\n// Special retry policy for rate limiting with longer delays\nretry_policy RateLimitRetry {\n  max_retries 3\n  strategy {\n    type exponential_backoff\n    delay_ms 1000  // Start with 1 second delay\n    multiplier 2.0  // Double the delay each time\n    max_delay_ms 60000  // Max 1 minute delay\n  }\n}",
+    "generators.baml": "// This helps use auto generate libraries you can use in the language of\n// your choice. You can have multiple generators if you use multiple languages.\n// Just ensure that the output_dir is different for each generator.\ngenerator target {\n    // Valid values: \"python/pydantic\", \"typescript\", \"ruby/sorbet\", \"rest/openapi\"\n    output_type \"python/pydantic\"\n\n    // Where the generated code will be saved (relative to baml_src/)\n    output_dir \"../\"\n\n    // The version of the BAML package you have installed (e.g. same version as your baml-py or @boundaryml/baml).\n    // The BAML VSCode extension version should also match this version.\n    version \"0.204.0\"\n\n    // Valid values: \"sync\", \"async\"\n    // This controls what `b.FunctionName()` will be (sync or async).\n    default_client_mode sync\n}\n",
+    "rulectl.baml": "function Hi(name: string) -> string {\n  client CustomGPT4o\n  prompt #\"\n    Say hello to the world.\n  \"#\n}\n\ntest HelloWorld {\n  functions [Hi]\n  args {\n    name \"World\"\n  }\n}\n\nfunction ReviewSkippedFiles(project_info: string, skipped_files: FileInfo[]) -> SkippedFilesAnalysis {\n  client CustomSonnet\n  prompt #\"\n    You are analyzing a software project to determine which configuration/non-source files might contain useful coding patterns or conventions.\n\n    Project context: {{ project_info }}\n\n    These files were skipped from analysis because they appear to be configuration files:\n    {% for file in skipped_files %}\n    File: {{ file.path }}\n    Extension: {{ file.extension }}\n    Content preview (first 500 chars):\n    {{ file.content }}\n    ---\n    {% endfor %}\n\n    Determine which of these files might contain useful coding patterns, conventions, or architectural decisions that would be valuable for generating cursor rules.\n\n    Files worth analyzing typically contain:\n    - Custom configuration patterns (like next.config.js with complex webpack config)\n    - ESLint/Prettier configs that show style preferences\n    - Build scripts with custom logic\n    - Schema definitions or type definitions in JSON\n    - Docker configs with specific patterns\n    - Custom tooling configurations\n\n    Files NOT worth analyzing:\n    - Simple package.json dependency lists\n    - Basic tsconfig.json files\n    - Lock files (package-lock.json, yarn.lock)\n    - Generated files\n    - Simple key-value config files\n\n    Return:\n    {{ctx.output_format}}\n  \"#\n}",
+    "schema.baml": "// Core types for repository analysis\nclass FileInfo {\n    path string\n    content string\n    extension string\n}\n\nclass CodePattern {\n    name string\n    description string\n    confidence float\n    examples string[]\n}\n\nclass RuleCandidate {\n    name string\n    description string\n    pattern string\n    confidence float\n    examples string[]\n    suggested_category string  // The category file this rule should go in (e.g. \"style\", \"build\", etc)\n}\n\n// New types for static analysis\nclass StaticAnalysisRule {\n    slug string  // lowercase-kebab-case ≤ 5 words\n    description string  // 1-sentence summary (≤ 120 chars)\n    scope_glob string  // default to the file's dir if unsure\n    bullets string[]  // 1-5 actionable bullets, each ≤ 120 chars\n    evidence_lines int[]  // array of line numbers that justify the rule\n}\n\nclass StaticAnalysisResult {\n    file string  // relative path\n    rules StaticAnalysisRule[]  // max 5 candidates\n}\n\nclass BatchAnalysis {\n    files FileInfo[]\n    patterns CodePattern[]\n    suggested_rules RuleCandidate[]\n}\n\n// Static analysis function for single file inspection\nfunction AnalyzeFileForConventions(file: FileInfo) -> StaticAnalysisResult {\n    client CustomSonnet\n    prompt #\"\n    You are a static-analysis assistant.\n    Your job is to inspect ONE source file and emit **JSON** describing *project-specific* conventions\n    that could become Cursor .mdc rules.\n    DO NOT output explanations, markdown, or code – JSON only.\n\n    Guidelines\n    1. Capture only **non-obvious, repo-specific guidance** (e.g. \"use Tailwind + shadcn/ui\"),\n       not generic style advice.\n    2. Each candidate must include:\n       • slug    -  lowercase-kebab-case ≤ 5 words  \n       • description - 1-sentence summary (≤ 120 chars)  \n       • scope_glob  -  default to the file's dir (`src/components/**/*`) if unsure  \n       • bullets     -  1-5 actionable bullets, each ≤ 120 chars  \n       • evidence_lines  -  array of line numbers (no code) that justify the rule\n    3. Max **5** candidates. Return `\"rules\": []` when no valid conventions exist.\n    4. Output must fit in ≤ 2 000 tokens.\n\n    {{ ctx.output_format }}\n\n    File to analyze: {{ file.path }}\n    \n    <--- BEGIN FILE CONTENT (truncated to ≤ 1 500 lines with 1-based numbering) --->\n    {{ file.content }}\n    <--- END FILE CONTENT --->\n    \"#\n}\n\n// Updated synthesis function for static analysis results\nfunction SynthesizeRules(analyses: StaticAnalysisResult[]) -> RuleCandidate[] {\n    client CustomSonnet\n    prompt #\"\n    You are an expert at creating Cursor rules based on static analysis results.\n    Review the following file analyses and synthesize them into a cohesive set of rules.\n    Focus on patterns that appear across multiple files and have high confidence based on evidence.\n\n    For each synthesized rule, recommend a category file it should be placed in. Categories should be high-level groupings like:\n    - style (coding style and formatting)\n    - build (build system and dependencies)\n    - security (security practices)\n    - testing (testing practices)\n    - performance (performance optimizations)\n    - architecture (code organization)\n    etc.\n\n    The category should reflect the primary purpose of the rule and will determine which .mdc file it goes in.\n\n    Look for:\n    1. Rules that appear across multiple files with similar patterns\n    2. Consistent conventions that could be automated\n    3. Project-specific patterns worth codifying\n\n    {{ ctx.output_format }}\n\n    Static Analysis Results:\n    {% for analysis in analyses %}\n    --- File: {{ analysis.file }} ---\n    Rules found: {{ analysis.rules|length }}\n    {% for rule in analysis.rules %}\n    - {{ rule.slug }}: {{ rule.description }}\n      Scope: {{ rule.scope_glob }}\n      Evidence lines: {{ rule.evidence_lines }}\n      Bullets: {{ rule.bullets }}\n    {% endfor %}\n\n    {% endfor %}\n    \"#\n}\n\n// Main analysis functions (kept for backward compatibility)\nfunction AnalyzeCodeBatch(files: FileInfo[]) -> BatchAnalysis {\n    client CustomSonnet\n    prompt #\"\n    You are an expert code analyzer focusing on identifying patterns and generating Cursor rules.\n    Analyze the following code files and identify:\n    1. Common coding patterns\n    2. Style conventions\n    3. Potential Cursor rules that could be automated\n\n    For each pattern, suggest a category for the rule. Categories should be high-level groupings like:\n    - style (coding style and formatting)\n    - build (build system and dependencies)\n    - security (security practices)\n    - testing (testing practices)\n    - performance (performance optimizations)\n    - architecture (code organization)\n    - etc.\n\n    {{ ctx.output_format }}\n\n    Files to analyze:\n    {% for file in files %}\n    --- {{ file.path }} ---\n    {{ file.content }}\n\n    {% endfor %}\n    \"#\n}\n\n// Optional: Specialized analyzers for different file types\nfunction AnalyzeTypeScript(file: FileInfo) -> CodePattern[] {\n    client CustomSonnet\n    prompt #\"\n    You are an expert TypeScript analyzer. Analyze this TypeScript file and identify:\n    1. TypeScript-specific patterns\n    2. Type usage patterns\n    3. React patterns (if applicable)\n    4. Import/export patterns\n\n    {{ ctx.output_format }}\n\n    File: {{ file.path }}\n    Content:\n    {{ file.content }}\n    \"#\n}\n\nfunction AnalyzePython(file: FileInfo) -> CodePattern[] {\n    client CustomSonnet\n    prompt #\"\n    You are an expert Python analyzer. Analyze this Python file and identify:\n    1. Python-specific idioms\n    2. Type hint usage\n    3. Import patterns\n    4. Common Python conventions\n\n    {{ ctx.output_format }}\n\n    File: {{ file.path }}\n    Content:\n    {{ file.content }}\n    \"#\n}\n\n// Rule auditing and improvement function\nfunction AuditMergedRule(\n    cluster_key: string,\n    merged_rule: StaticAnalysisRule,\n    original_rules: StaticAnalysisRule[]\n) -> StaticAnalysisRule {\n    client CustomSonnet\n    prompt #\"\n    You are a code rule auditor. Your job is to clean up a merged coding rule that was created \n    by clustering similar rules together. The merge may have created nonsensical combinations.\n\n    TASK: Audit and improve the merged rule by:\n    1. Removing bullets that don't fit the cluster theme\n    2. Keeping only coherent, related bullets (max 5)\n    3. Improving the description to match the actual bullets\n    4. Ensuring the scope_glob makes sense for the rule content\n    5. Making sure the slug is appropriate\n\n    CLUSTER THEME: {{ cluster_key }}\n    \n    MERGED RULE TO AUDIT:\n    - Slug: {{ merged_rule.slug }}\n    - Description: {{ merged_rule.description }}\n    - Scope: {{ merged_rule.scope_glob }}\n    - Bullets: {{ merged_rule.bullets }}\n    \n    ORIGINAL RULES THAT WERE MERGED:\n    {% for rule in original_rules %}\n    Rule {{ loop.index }}:\n    - From file: (evidence lines {{ rule.evidence_lines }})\n    - Slug: {{ rule.slug }}\n    - Description: {{ rule.description }}\n    - Bullets: {{ rule.bullets }}\n    \n    {% endfor %}\n\n    OUTPUT REQUIREMENTS:\n    - Return a clean, coherent rule with bullets that actually relate to each other\n    - If the merge doesn't make sense, focus on the most represented theme\n    - Bullets should be actionable and specific to the cluster theme\n    - Description should accurately reflect what the bullets actually do\n    - Scope should target the right file types/directories for this rule\n    - Keep slug concise and descriptive (kebab-case, ≤5 words)\n\n    {{ ctx.output_format }}\n    \"#\n}\n\n// Rule categorization function\nclass RuleCategory {\n    category_name string  // Concise name like \"architecture\", \"testing\", etc\n    description string    // Brief description of what this category covers\n    rules StaticAnalysisRule[]  // Rules that belong in this category\n}\n\nfunction CategorizeAcceptedRules(accepted_rules: StaticAnalysisRule[]) -> RuleCategory[] {\n    client CustomSonnet\n    prompt #\"\n    You are a code organization expert. Your job is to categorize accepted coding rules \n    into logical, concise categories suitable for .mdc filenames.\n\n    TASK: Group the provided rules into 3-7 logical categories with:\n    1. Concise category names (1-2 words, lowercase, no hyphens)\n    2. Clear descriptions of what each category covers\n    3. Logical grouping of related rules\n\n    GOOD CATEGORY NAMES:\n    - architecture (code organization, patterns, structure)\n    - testing (test patterns, mocking, fixtures)\n    - configuration (env vars, setup, config files)\n    - security (API keys, credentials, validation)\n    - build (compilation, packaging, deployment)\n    - style (naming, formatting, conventions)\n    - performance (optimization, efficiency)\n    - tooling (CLI patterns, utilities, scripts)\n\n    AVOID:\n    - Long names, hyphens, or technical jargon\n    - Too many categories (keep it manageable)\n    - Overly specific categories (group related concepts)\n\n    RULES TO CATEGORIZE:\n    {% for rule in accepted_rules %}\n    Rule {{ loop.index }}:\n    - Slug: {{ rule.slug }}\n    - Description: {{ rule.description }}\n    - Scope: {{ rule.scope_glob }}\n    - Bullets: {{ rule.bullets }}\n    \n    {% endfor %}\n\n    OUTPUT: Return categories that make logical sense for organizing these specific rules.\n    Each rule should appear in exactly one category.\n\n    {{ ctx.output_format }}\n    \"#\n}\n\ntest TestName {\n  functions [AnalyzeFileForConventions]\n  args {\n    file {\n      path \"test.py\"\n      content \"print('Hello, world!')\"\n      extension \".py\"\n    }\n  }\n}\n\nfunction TestHelloWorld(name: string) -> string {\n  client CustomSonnet\n  prompt #\"\n  Say hello to the world.\n  \"#\n}\n\ntest TestHelloWorld {\n  functions [TestHelloWorld]\n  args {\n    name \"World\"\n  }\n}\n\n// Types for reviewing skipped files\nclass SkippedFileReview {\n    file_path string\n    should_analyze bool\n    reasoning string\n    potential_patterns string[]\n}\n\nclass SkippedFilesAnalysis {\n    files_to_analyze string[]\n    reasoning string\n}",
+}
+
+def get_baml_files():
+    return _file_map
\ No newline at end of file
@@ -0,0 +1,153 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+
+from . import stream_types, types
+from .runtime import DoNotUseDirectlyCallManager, BamlCallOptions
+
+class LlmResponseParser:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def AnalyzeCodeBatch(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.BatchAnalysis:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AnalyzeCodeBatch", llm_response=llm_response, mode="request")
+        return typing.cast(types.BatchAnalysis, result)
+
+    def AnalyzeFileForConventions(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.StaticAnalysisResult:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AnalyzeFileForConventions", llm_response=llm_response, mode="request")
+        return typing.cast(types.StaticAnalysisResult, result)
+
+    def AnalyzePython(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.CodePattern"]:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AnalyzePython", llm_response=llm_response, mode="request")
+        return typing.cast(typing.List["types.CodePattern"], result)
+
+    def AnalyzeTypeScript(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.CodePattern"]:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AnalyzeTypeScript", llm_response=llm_response, mode="request")
+        return typing.cast(typing.List["types.CodePattern"], result)
+
+    def AuditMergedRule(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.StaticAnalysisRule:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AuditMergedRule", llm_response=llm_response, mode="request")
+        return typing.cast(types.StaticAnalysisRule, result)
+
+    def CategorizeAcceptedRules(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.RuleCategory"]:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="CategorizeAcceptedRules", llm_response=llm_response, mode="request")
+        return typing.cast(typing.List["types.RuleCategory"], result)
+
+    def Hi(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="Hi", llm_response=llm_response, mode="request")
+        return typing.cast(str, result)
+
+    def ReviewSkippedFiles(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.SkippedFilesAnalysis:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="ReviewSkippedFiles", llm_response=llm_response, mode="request")
+        return typing.cast(types.SkippedFilesAnalysis, result)
+
+    def SynthesizeRules(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.RuleCandidate"]:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="SynthesizeRules", llm_response=llm_response, mode="request")
+        return typing.cast(typing.List["types.RuleCandidate"], result)
+
+    def TestHelloWorld(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="TestHelloWorld", llm_response=llm_response, mode="request")
+        return typing.cast(str, result)
+
+    
+
+class LlmStreamParser:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def AnalyzeCodeBatch(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.BatchAnalysis:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AnalyzeCodeBatch", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.BatchAnalysis, result)
+
+    def AnalyzeFileForConventions(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.StaticAnalysisResult:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AnalyzeFileForConventions", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.StaticAnalysisResult, result)
+
+    def AnalyzePython(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["stream_types.CodePattern"]:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AnalyzePython", llm_response=llm_response, mode="stream")
+        return typing.cast(typing.List["stream_types.CodePattern"], result)
+
+    def AnalyzeTypeScript(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["stream_types.CodePattern"]:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AnalyzeTypeScript", llm_response=llm_response, mode="stream")
+        return typing.cast(typing.List["stream_types.CodePattern"], result)
+
+    def AuditMergedRule(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.StaticAnalysisRule:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="AuditMergedRule", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.StaticAnalysisRule, result)
+
+    def CategorizeAcceptedRules(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["stream_types.RuleCategory"]:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="CategorizeAcceptedRules", llm_response=llm_response, mode="stream")
+        return typing.cast(typing.List["stream_types.RuleCategory"], result)
+
+    def Hi(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="Hi", llm_response=llm_response, mode="stream")
+        return typing.cast(str, result)
+
+    def ReviewSkippedFiles(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.SkippedFilesAnalysis:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="ReviewSkippedFiles", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.SkippedFilesAnalysis, result)
+
+    def SynthesizeRules(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> typing.List["stream_types.RuleCandidate"]:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="SynthesizeRules", llm_response=llm_response, mode="stream")
+        return typing.cast(typing.List["stream_types.RuleCandidate"], result)
+
+    def TestHelloWorld(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="TestHelloWorld", llm_response=llm_response, mode="stream")
+        return typing.cast(str, result)
+
+    
\ No newline at end of file
@@ -0,0 +1,81 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+from pydantic import BaseModel, ConfigDict
+
+import baml_py
+
+from . import types
+
+StreamStateValueT = typing.TypeVar('StreamStateValueT')
+class StreamState(BaseModel, typing.Generic[StreamStateValueT]):
+    value: StreamStateValueT
+    state: typing_extensions.Literal["Pending", "Incomplete", "Complete"]
+# #########################################################################
+# Generated classes (9)
+# #########################################################################
+
+class BatchAnalysis(BaseModel):
+    files: typing.List["FileInfo"]
+    patterns: typing.List["CodePattern"]
+    suggested_rules: typing.List["RuleCandidate"]
+
+class CodePattern(BaseModel):
+    name: typing.Optional[str] = None
+    description: typing.Optional[str] = None
+    confidence: typing.Optional[float] = None
+    examples: typing.List[str]
+
+class FileInfo(BaseModel):
+    path: typing.Optional[str] = None
+    content: typing.Optional[str] = None
+    extension: typing.Optional[str] = None
+
+class RuleCandidate(BaseModel):
+    name: typing.Optional[str] = None
+    description: typing.Optional[str] = None
+    pattern: typing.Optional[str] = None
+    confidence: typing.Optional[float] = None
+    examples: typing.List[str]
+    suggested_category: typing.Optional[str] = None
+
+class RuleCategory(BaseModel):
+    category_name: typing.Optional[str] = None
+    description: typing.Optional[str] = None
+    rules: typing.List["StaticAnalysisRule"]
+
+class SkippedFileReview(BaseModel):
+    file_path: typing.Optional[str] = None
+    should_analyze: typing.Optional[bool] = None
+    reasoning: typing.Optional[str] = None
+    potential_patterns: typing.List[str]
+
+class SkippedFilesAnalysis(BaseModel):
+    files_to_analyze: typing.List[str]
+    reasoning: typing.Optional[str] = None
+
+class StaticAnalysisResult(BaseModel):
+    file: typing.Optional[str] = None
+    rules: typing.List["StaticAnalysisRule"]
+
+class StaticAnalysisRule(BaseModel):
+    slug: typing.Optional[str] = None
+    description: typing.Optional[str] = None
+    scope_glob: typing.Optional[str] = None
+    bullets: typing.List[str]
+    evidence_lines: typing.List[int]
+
+# #########################################################################
+# Generated type aliases (0)
+# #########################################################################
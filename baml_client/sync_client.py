@@ -0,0 +1,445 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+import baml_py
+
+from . import stream_types, types, type_builder
+from .parser import LlmResponseParser, LlmStreamParser
+from .runtime import DoNotUseDirectlyCallManager, BamlCallOptions
+from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME as __runtime__
+
+class BamlSyncClient:
+    __options: DoNotUseDirectlyCallManager
+    __stream_client: "BamlStreamClient"
+    __http_request: "BamlHttpRequestClient"
+    __http_stream_request: "BamlHttpStreamRequestClient"
+    __llm_response_parser: LlmResponseParser
+    __llm_stream_parser: LlmStreamParser
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+        self.__stream_client = BamlStreamClient(options)
+        self.__http_request = BamlHttpRequestClient(options)
+        self.__http_stream_request = BamlHttpStreamRequestClient(options)
+        self.__llm_response_parser = LlmResponseParser(options)
+        self.__llm_stream_parser = LlmStreamParser(options)
+
+    def __getstate__(self):
+        # Return state needed for pickling
+        return {"options": self.__options}
+
+    def __setstate__(self, state):
+        # Restore state from pickling
+        self.__options = state["options"]
+        self.__stream_client = BamlStreamClient(self.__options)
+        self.__http_request = BamlHttpRequestClient(self.__options)
+        self.__http_stream_request = BamlHttpStreamRequestClient(self.__options)
+        self.__llm_response_parser = LlmResponseParser(self.__options)
+        self.__llm_stream_parser = LlmStreamParser(self.__options)
+
+    def with_options(self,
+        tb: typing.Optional[type_builder.TypeBuilder] = None,
+        client_registry: typing.Optional[baml_py.baml_py.ClientRegistry] = None,
+        collector: typing.Optional[typing.Union[baml_py.baml_py.Collector, typing.List[baml_py.baml_py.Collector]]] = None,
+        env: typing.Optional[typing.Dict[str, typing.Optional[str]]] = None,
+    ) -> "BamlSyncClient":
+        options: BamlCallOptions = {}
+        if tb is not None:
+            options["tb"] = tb
+        if client_registry is not None:
+            options["client_registry"] = client_registry
+        if collector is not None:
+            options["collector"] = collector
+        if env is not None:
+            options["env"] = env
+        return BamlSyncClient(self.__options.merge_options(options))
+
+    @property
+    def stream(self):
+      return self.__stream_client
+
+    @property
+    def request(self):
+      return self.__http_request
+
+    @property
+    def stream_request(self):
+      return self.__http_stream_request
+
+    @property
+    def parse(self):
+      return self.__llm_response_parser
+
+    @property
+    def parse_stream(self):
+      return self.__llm_stream_parser
+    
+    def AnalyzeCodeBatch(self, files: typing.List["types.FileInfo"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.BatchAnalysis:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="AnalyzeCodeBatch", args={
+            "files": files,
+        })
+        return typing.cast(types.BatchAnalysis, result.cast_to(types, types, stream_types, False, __runtime__))
+    def AnalyzeFileForConventions(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> types.StaticAnalysisResult:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="AnalyzeFileForConventions", args={
+            "file": file,
+        })
+        return typing.cast(types.StaticAnalysisResult, result.cast_to(types, types, stream_types, False, __runtime__))
+    def AnalyzePython(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.CodePattern"]:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="AnalyzePython", args={
+            "file": file,
+        })
+        return typing.cast(typing.List["types.CodePattern"], result.cast_to(types, types, stream_types, False, __runtime__))
+    def AnalyzeTypeScript(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.CodePattern"]:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="AnalyzeTypeScript", args={
+            "file": file,
+        })
+        return typing.cast(typing.List["types.CodePattern"], result.cast_to(types, types, stream_types, False, __runtime__))
+    def AuditMergedRule(self, cluster_key: str,merged_rule: types.StaticAnalysisRule,original_rules: typing.List["types.StaticAnalysisRule"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.StaticAnalysisRule:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="AuditMergedRule", args={
+            "cluster_key": cluster_key,"merged_rule": merged_rule,"original_rules": original_rules,
+        })
+        return typing.cast(types.StaticAnalysisRule, result.cast_to(types, types, stream_types, False, __runtime__))
+    def CategorizeAcceptedRules(self, accepted_rules: typing.List["types.StaticAnalysisRule"],
+        baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.RuleCategory"]:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="CategorizeAcceptedRules", args={
+            "accepted_rules": accepted_rules,
+        })
+        return typing.cast(typing.List["types.RuleCategory"], result.cast_to(types, types, stream_types, False, __runtime__))
+    def Hi(self, name: str,
+        baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="Hi", args={
+            "name": name,
+        })
+        return typing.cast(str, result.cast_to(types, types, stream_types, False, __runtime__))
+    def ReviewSkippedFiles(self, project_info: str,skipped_files: typing.List["types.FileInfo"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.SkippedFilesAnalysis:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="ReviewSkippedFiles", args={
+            "project_info": project_info,"skipped_files": skipped_files,
+        })
+        return typing.cast(types.SkippedFilesAnalysis, result.cast_to(types, types, stream_types, False, __runtime__))
+    def SynthesizeRules(self, analyses: typing.List["types.StaticAnalysisResult"],
+        baml_options: BamlCallOptions = {},
+    ) -> typing.List["types.RuleCandidate"]:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="SynthesizeRules", args={
+            "analyses": analyses,
+        })
+        return typing.cast(typing.List["types.RuleCandidate"], result.cast_to(types, types, stream_types, False, __runtime__))
+    def TestHelloWorld(self, name: str,
+        baml_options: BamlCallOptions = {},
+    ) -> str:
+        result = self.__options.merge_options(baml_options).call_function_sync(function_name="TestHelloWorld", args={
+            "name": name,
+        })
+        return typing.cast(str, result.cast_to(types, types, stream_types, False, __runtime__))
+    
+
+
+class BamlStreamClient:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def AnalyzeCodeBatch(self, files: typing.List["types.FileInfo"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[stream_types.BatchAnalysis, types.BatchAnalysis]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="AnalyzeCodeBatch", args={
+            "files": files,
+        })
+        return baml_py.BamlSyncStream[stream_types.BatchAnalysis, types.BatchAnalysis](
+          result,
+          lambda x: typing.cast(stream_types.BatchAnalysis, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.BatchAnalysis, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def AnalyzeFileForConventions(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[stream_types.StaticAnalysisResult, types.StaticAnalysisResult]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="AnalyzeFileForConventions", args={
+            "file": file,
+        })
+        return baml_py.BamlSyncStream[stream_types.StaticAnalysisResult, types.StaticAnalysisResult](
+          result,
+          lambda x: typing.cast(stream_types.StaticAnalysisResult, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.StaticAnalysisResult, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def AnalyzePython(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[typing.List["stream_types.CodePattern"], typing.List["types.CodePattern"]]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="AnalyzePython", args={
+            "file": file,
+        })
+        return baml_py.BamlSyncStream[typing.List["stream_types.CodePattern"], typing.List["types.CodePattern"]](
+          result,
+          lambda x: typing.cast(typing.List["stream_types.CodePattern"], x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(typing.List["types.CodePattern"], x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def AnalyzeTypeScript(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[typing.List["stream_types.CodePattern"], typing.List["types.CodePattern"]]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="AnalyzeTypeScript", args={
+            "file": file,
+        })
+        return baml_py.BamlSyncStream[typing.List["stream_types.CodePattern"], typing.List["types.CodePattern"]](
+          result,
+          lambda x: typing.cast(typing.List["stream_types.CodePattern"], x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(typing.List["types.CodePattern"], x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def AuditMergedRule(self, cluster_key: str,merged_rule: types.StaticAnalysisRule,original_rules: typing.List["types.StaticAnalysisRule"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[stream_types.StaticAnalysisRule, types.StaticAnalysisRule]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="AuditMergedRule", args={
+            "cluster_key": cluster_key,"merged_rule": merged_rule,"original_rules": original_rules,
+        })
+        return baml_py.BamlSyncStream[stream_types.StaticAnalysisRule, types.StaticAnalysisRule](
+          result,
+          lambda x: typing.cast(stream_types.StaticAnalysisRule, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.StaticAnalysisRule, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def CategorizeAcceptedRules(self, accepted_rules: typing.List["types.StaticAnalysisRule"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[typing.List["stream_types.RuleCategory"], typing.List["types.RuleCategory"]]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="CategorizeAcceptedRules", args={
+            "accepted_rules": accepted_rules,
+        })
+        return baml_py.BamlSyncStream[typing.List["stream_types.RuleCategory"], typing.List["types.RuleCategory"]](
+          result,
+          lambda x: typing.cast(typing.List["stream_types.RuleCategory"], x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(typing.List["types.RuleCategory"], x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def Hi(self, name: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[str, str]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="Hi", args={
+            "name": name,
+        })
+        return baml_py.BamlSyncStream[str, str](
+          result,
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def ReviewSkippedFiles(self, project_info: str,skipped_files: typing.List["types.FileInfo"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[stream_types.SkippedFilesAnalysis, types.SkippedFilesAnalysis]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="ReviewSkippedFiles", args={
+            "project_info": project_info,"skipped_files": skipped_files,
+        })
+        return baml_py.BamlSyncStream[stream_types.SkippedFilesAnalysis, types.SkippedFilesAnalysis](
+          result,
+          lambda x: typing.cast(stream_types.SkippedFilesAnalysis, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.SkippedFilesAnalysis, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def SynthesizeRules(self, analyses: typing.List["types.StaticAnalysisResult"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[typing.List["stream_types.RuleCandidate"], typing.List["types.RuleCandidate"]]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="SynthesizeRules", args={
+            "analyses": analyses,
+        })
+        return baml_py.BamlSyncStream[typing.List["stream_types.RuleCandidate"], typing.List["types.RuleCandidate"]](
+          result,
+          lambda x: typing.cast(typing.List["stream_types.RuleCandidate"], x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(typing.List["types.RuleCandidate"], x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def TestHelloWorld(self, name: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[str, str]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="TestHelloWorld", args={
+            "name": name,
+        })
+        return baml_py.BamlSyncStream[str, str](
+          result,
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(str, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    
+
+class BamlHttpRequestClient:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def AnalyzeCodeBatch(self, files: typing.List["types.FileInfo"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AnalyzeCodeBatch", args={
+            "files": files,
+        }, mode="request")
+        return result
+    def AnalyzeFileForConventions(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AnalyzeFileForConventions", args={
+            "file": file,
+        }, mode="request")
+        return result
+    def AnalyzePython(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AnalyzePython", args={
+            "file": file,
+        }, mode="request")
+        return result
+    def AnalyzeTypeScript(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AnalyzeTypeScript", args={
+            "file": file,
+        }, mode="request")
+        return result
+    def AuditMergedRule(self, cluster_key: str,merged_rule: types.StaticAnalysisRule,original_rules: typing.List["types.StaticAnalysisRule"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AuditMergedRule", args={
+            "cluster_key": cluster_key,"merged_rule": merged_rule,"original_rules": original_rules,
+        }, mode="request")
+        return result
+    def CategorizeAcceptedRules(self, accepted_rules: typing.List["types.StaticAnalysisRule"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="CategorizeAcceptedRules", args={
+            "accepted_rules": accepted_rules,
+        }, mode="request")
+        return result
+    def Hi(self, name: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="Hi", args={
+            "name": name,
+        }, mode="request")
+        return result
+    def ReviewSkippedFiles(self, project_info: str,skipped_files: typing.List["types.FileInfo"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="ReviewSkippedFiles", args={
+            "project_info": project_info,"skipped_files": skipped_files,
+        }, mode="request")
+        return result
+    def SynthesizeRules(self, analyses: typing.List["types.StaticAnalysisResult"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="SynthesizeRules", args={
+            "analyses": analyses,
+        }, mode="request")
+        return result
+    def TestHelloWorld(self, name: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="TestHelloWorld", args={
+            "name": name,
+        }, mode="request")
+        return result
+    
+
+class BamlHttpStreamRequestClient:
+    __options: DoNotUseDirectlyCallManager
+
+    def __init__(self, options: DoNotUseDirectlyCallManager):
+        self.__options = options
+
+    def AnalyzeCodeBatch(self, files: typing.List["types.FileInfo"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AnalyzeCodeBatch", args={
+            "files": files,
+        }, mode="stream")
+        return result
+    def AnalyzeFileForConventions(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AnalyzeFileForConventions", args={
+            "file": file,
+        }, mode="stream")
+        return result
+    def AnalyzePython(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AnalyzePython", args={
+            "file": file,
+        }, mode="stream")
+        return result
+    def AnalyzeTypeScript(self, file: types.FileInfo,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AnalyzeTypeScript", args={
+            "file": file,
+        }, mode="stream")
+        return result
+    def AuditMergedRule(self, cluster_key: str,merged_rule: types.StaticAnalysisRule,original_rules: typing.List["types.StaticAnalysisRule"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="AuditMergedRule", args={
+            "cluster_key": cluster_key,"merged_rule": merged_rule,"original_rules": original_rules,
+        }, mode="stream")
+        return result
+    def CategorizeAcceptedRules(self, accepted_rules: typing.List["types.StaticAnalysisRule"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="CategorizeAcceptedRules", args={
+            "accepted_rules": accepted_rules,
+        }, mode="stream")
+        return result
+    def Hi(self, name: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="Hi", args={
+            "name": name,
+        }, mode="stream")
+        return result
+    def ReviewSkippedFiles(self, project_info: str,skipped_files: typing.List["types.FileInfo"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="ReviewSkippedFiles", args={
+            "project_info": project_info,"skipped_files": skipped_files,
+        }, mode="stream")
+        return result
+    def SynthesizeRules(self, analyses: typing.List["types.StaticAnalysisResult"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="SynthesizeRules", args={
+            "analyses": analyses,
+        }, mode="stream")
+        return result
+    def TestHelloWorld(self, name: str,
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="TestHelloWorld", args={
+            "name": name,
+        }, mode="stream")
+        return result
+    
+
+b = BamlSyncClient(DoNotUseDirectlyCallManager({}))
\ No newline at end of file
@@ -0,0 +1,47 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+from . import types
+from . import stream_types
+
+
+type_map = {
+
+    "types.BatchAnalysis": types.BatchAnalysis,
+    "stream_types.BatchAnalysis": stream_types.BatchAnalysis,
+
+    "types.CodePattern": types.CodePattern,
+    "stream_types.CodePattern": stream_types.CodePattern,
+
+    "types.FileInfo": types.FileInfo,
+    "stream_types.FileInfo": stream_types.FileInfo,
+
+    "types.RuleCandidate": types.RuleCandidate,
+    "stream_types.RuleCandidate": stream_types.RuleCandidate,
+
+    "types.RuleCategory": types.RuleCategory,
+    "stream_types.RuleCategory": stream_types.RuleCategory,
+
+    "types.SkippedFileReview": types.SkippedFileReview,
+    "stream_types.SkippedFileReview": stream_types.SkippedFileReview,
+
+    "types.SkippedFilesAnalysis": types.SkippedFilesAnalysis,
+    "stream_types.SkippedFilesAnalysis": stream_types.SkippedFilesAnalysis,
+
+    "types.StaticAnalysisResult": types.StaticAnalysisResult,
+    "stream_types.StaticAnalysisResult": stream_types.StaticAnalysisResult,
+
+    "types.StaticAnalysisRule": types.StaticAnalysisRule,
+    "stream_types.StaticAnalysisRule": stream_types.StaticAnalysisRule,
+
+
+}
\ No newline at end of file
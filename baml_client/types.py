@@ -0,0 +1,99 @@
+# ----------------------------------------------------------------------------
+#
+#  Welcome to Baml! To use this generated code, please run the following:
+#
+#  $ pip install baml
+#
+# ----------------------------------------------------------------------------
+
+# This file was generated by BAML: please do not edit it. Instead, edit the
+# BAML files and re-generate this code using: baml-cli generate
+# baml-cli is available with the baml package.
+
+import typing
+import typing_extensions
+from enum import Enum
+
+
+from pydantic import BaseModel, ConfigDict
+
+
+import baml_py
+
+CheckT = typing_extensions.TypeVar('CheckT')
+CheckName = typing_extensions.TypeVar('CheckName', bound=str)
+
+class Check(BaseModel):
+    name: str
+    expression: str
+    status: str
+class Checked(BaseModel, typing.Generic[CheckT, CheckName]):
+    value: CheckT
+    checks: typing.Dict[CheckName, Check]
+
+def get_checks(checks: typing.Dict[CheckName, Check]) -> typing.List[Check]:
+    return list(checks.values())
+
+def all_succeeded(checks: typing.Dict[CheckName, Check]) -> bool:
+    return all(check.status == "succeeded" for check in get_checks(checks))
+# #########################################################################
+# Generated enums (0)
+# #########################################################################
+
+# #########################################################################
+# Generated classes (9)
+# #########################################################################
+
+class BatchAnalysis(BaseModel):
+    files: typing.List["FileInfo"]
+    patterns: typing.List["CodePattern"]
+    suggested_rules: typing.List["RuleCandidate"]
+
+class CodePattern(BaseModel):
+    name: str
+    description: str
+    confidence: float
+    examples: typing.List[str]
+
+class FileInfo(BaseModel):
+    path: str
+    content: str
+    extension: str
+
+class RuleCandidate(BaseModel):
+    name: str
+    description: str
+    pattern: str
+    confidence: float
+    examples: typing.List[str]
+    suggested_category: str
+
+class RuleCategory(BaseModel):
+    category_name: str
+    description: str
+    rules: typing.List["StaticAnalysisRule"]
+
+class SkippedFileReview(BaseModel):
+    file_path: str
+    should_analyze: bool
+    reasoning: str
+    potential_patterns: typing.List[str]
+
+class SkippedFilesAnalysis(BaseModel):
+    files_to_analyze: typing.List[str]
+    reasoning: str
+
+class StaticAnalysisResult(BaseModel):
+    file: str
+    rules: typing.List["StaticAnalysisRule"]
+
+class StaticAnalysisRule(BaseModel):
+    slug: str
+    description: str
+    scope_glob: str
+    bullets: typing.List[str]
+    evidence_lines: typing.List[int]
+
+# #########################################################################
+# Generated type aliases (0)
+# #########################################################################
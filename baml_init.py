@@ -6,48 +6,120 @@ This script helps users initialize BAML without needing the VSCode extension.
 
 import os
 import sys
+import hashlib
 import subprocess
-from pathlib import Path
 
-# Fix Unicode output on Windows
-if sys.platform == "win32":
+# Fix Unicode output on Windows (build.py already does this when importing us)
+if sys.platform == "win32" and __name__ == "__main__":
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.detach(), encoding='utf-8', errors='replace')
 
+def _detect_docker():
+    """Check if we're running inside a Docker (or other containerd) container."""
+    # Cheapest checks first
+    if os.environ.get('container') == 'docker' or os.path.exists('/.dockerenv'):
+        return True
+    # Alternative Docker detection; /proc/1/cgroup exists on every Linux
+    # system, so its contents have to be checked
+    try:
+        with open('/proc/1/cgroup') as f:
+            cgroup = f.read()
+    except OSError:
+        return False
+    return 'docker' in cgroup or 'containerd' in cgroup
+
+def _detect_isolation():
+    """Check if we're in a virtual environment, Docker container, or CI environment."""
+    is_venv = hasattr(sys, 'real_prefix') or sys.base_prefix != sys.prefix
+    is_docker = _detect_docker()
+    is_ci = any(key in os.environ for key in ['CI', 'GITHUB_ACTIONS', 'GITLAB_CI', 'JENKINS_URL'])
+    return is_venv or is_docker or is_ci
+
+# The environment doesn't change during the process, so detect it once
+_IS_ISOLATED = _detect_isolation()
+
+# Check for debug mode once; the environment doesn't change during the process
+DEBUG_MODE = os.environ.get('BUILD_DEBUG', '').lower() in {'1', 'true', 'yes'}
+
+# Resolved baml-cli path, cached for the lifetime of the process
+_BAML_CLI_PATH = None
+
+def _cli_cache_file():
+    """Get the on-disk cache file for the baml-cli path of this environment."""
+    cache_key = hashlib.blake2b(sys.prefix.encode()).hexdigest()[:16]
+    return os.path.join(os.path.expanduser('~'), '.cache', 'rulectl', f'baml-cli-{cache_key}.txt')
+
+def _read_cached_cli_path():
+    """Return the cached baml-cli path if it's still valid, otherwise None."""
+    try:
+        with open(_cli_cache_file(), encoding='utf-8') as f:
+            cli_path, mtime = f.read().strip().split('\t')
+        if os.stat(cli_path).st_mtime_ns == int(mtime):
+            return cli_path
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_cached_cli_path(cli_path):
+    """Persist the resolved baml-cli path so later runs can skip the lookup."""
+    cache_file = _cli_cache_file()
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(f"{cli_path}\t{os.stat(cli_path).st_mtime_ns}")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Caching is best effort only
+        pass
+
 def find_baml_cli():
-    """Find the baml-cli executable in the virtual environment."""
+    """Find the baml-cli executable in the virtual environment.
+
+    The result is cached in memory and in ~/.cache/rulectl (keyed by
+    sys.prefix and the executable's mtime). Set RULECTL_REFRESH_CLI=1 to
+    force the lookup to run again.
+    """
+    global _BAML_CLI_PATH
+    # Build mode can be switched on mid-run (build.py sets it), so check it live
+    is_build = os.environ.get('RULECTL_BUILD') == '1'
+    
+    # Allow if any isolation method is detected. Checked before the cache, so
+    # a path cached during an earlier build doesn't bypass it
+    if not (_IS_ISOLATED or is_build):
+        print("Error: This script should be run in an isolated environment (virtual environment, Docker, CI, or build mode)")
+        print("To bypass this check, set RULECTL_BUILD=1")
+        sys.exit(1)
+
+    refresh = os.environ.get('RULECTL_REFRESH_CLI') == '1'
+    if not refresh:
+        if _BAML_CLI_PATH is None:
+            _BAML_CLI_PATH = _read_cached_cli_path()
+        if _BAML_CLI_PATH is not None:
+            return _BAML_CLI_PATH
+
     try:
         # Get the virtual environment base directory
         venv_base = sys.prefix
         
-        # Check if we're in a virtual environment, Docker container, or CI environment
-        is_venv = hasattr(sys, 'real_prefix') or sys.base_prefix != sys.prefix
-        is_docker = (os.path.exists('/.dockerenv') or 
-                     os.environ.get('container') == 'docker' or
-                     os.path.exists('/proc/1/cgroup'))  # Alternative Docker detection
-        is_ci = any(key in os.environ for key in ['CI', 'GITHUB_ACTIONS', 'GITLAB_CI', 'JENKINS_URL'])
-        is_build = os.environ.get('RULECTL_BUILD') == '1'
-        
-        # Allow if any isolation method is detected
-        if not (is_venv or is_docker or is_ci or is_build):
-            print("Error: This script should be run in an isolated environment (virtual environment, Docker, CI, or build mode)")
-            print("To bypass this check, set RULECTL_BUILD=1")
-            sys.exit(1)
-        
-        # Determine the bin directory name based on platform
-        bin_dir = 'Scripts' if sys.platform == 'win32' else 'bin'
-        cli_path = Path(venv_base) / bin_dir / 'baml-cli'
-        
-        # Add .exe extension for Windows
+        # Determine the bin directory and executable name based on platform
         if sys.platform == 'win32':
-            cli_path = cli_path.with_suffix('.exe')
+            bin_dir, exe_name = 'Scripts', 'baml-cli.exe'
+        else:
+            bin_dir, exe_name = 'bin', 'baml-cli'
+        cli_path = os.path.join(venv_base, bin_dir, exe_name)
             
-        if not cli_path.exists():
-            print("Error: baml-cli not found. Please ensure baml-py is installed in your virtual environment")
+        if not os.access(cli_path, os.X_OK):
+            if os.path.isfile(cli_path):
+                print(f"Error: baml-cli at {cli_path} is not executable")
+            else:
+                print("Error: baml-cli not found. Please ensure baml-py is installed in your virtual environment")
             sys.exit(1)
             
-        return str(cli_path)
+        _BAML_CLI_PATH = cli_path
+        _write_cached_cli_path(cli_path)
+        return _BAML_CLI_PATH
     except Exception as e:
         print(f"Error finding baml-cli: {e}")
         sys.exit(1)
@@ -62,31 +134,29 @@ def generate_baml(verbose=True):
         bool: True if successful, False otherwise
     """
     try:
-        # Check for debug mode
-        debug_mode = os.environ.get('BUILD_DEBUG', '').lower() in ['1', 'true', 'yes']
-        
         # Find the baml-cli executable
         baml_cli_path = find_baml_cli()
-        if verbose and debug_mode:
+        if verbose and DEBUG_MODE:
             print(f"Found baml-cli at: {baml_cli_path}")
         
         # Run baml-cli generate
-        if verbose and debug_mode:
+        if verbose and DEBUG_MODE:
             print("Running baml-cli generate...")
             result = subprocess.run(
                 [baml_cli_path, "generate"],
                 check=True
             )
         else:
-            # Suppress output unless there's an error
+            # Suppress output; only stderr is kept for error reporting
             result = subprocess.run(
                 [baml_cli_path, "generate"],
                 check=True,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True
             )
         
-        if verbose and not debug_mode:
+        if verbose and not DEBUG_MODE:
             print("  ✅ BAML client generated")  # Unicode fix in calling scripts handles Windows encoding
         elif verbose:
             print("BAML initialization completed successfully!")
@@ -94,7 +164,7 @@ def generate_baml(verbose=True):
     except subprocess.CalledProcessError as e:
         if verbose:
             print(f"Error running baml-cli generate: {e}")
-            if hasattr(e, 'stderr') and e.stderr:
+            if getattr(e, 'stderr', None):
                 print(f"Error output: {e.stderr}")
         return False
     except Exception as e:
@@ -103,7 +173,17 @@ def generate_baml(verbose=True):
         return False
 
 def main():
-    """Main function to run baml-cli generate."""
+    """Main function to run baml-cli generate.
+
+    On Unix the script process is replaced by baml-cli directly, so its exit
+    status becomes ours. Windows keeps the subprocess path because execv
+    does not replace the process there.
+    """
+    if sys.platform != 'win32':
+        baml_cli_path = find_baml_cli()
+        sys.stdout.flush()
+        os.execv(baml_cli_path, [baml_cli_path, "generate"])
+
     success = generate_baml(verbose=True)
     if not success:
         sys.exit(1)
@@ -5,139 +5,451 @@ Build script to create standalone executables using PyInstaller.
 
 import os
 import sys
+import io
+import hashlib
+import contextlib
+import logging
 import platform
+import re
+import subprocess
 
 # Fix Unicode output on Windows
 if sys.platform == "win32":
-    import io
     sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.detach(), encoding='utf-8', errors='replace')
-import PyInstaller.__main__
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-try:
-    from baml_init import generate_baml
-except ImportError:
-    print("Warning: Could not import baml_init module")
-    generate_baml = None
-
-def clean_build_dirs():
-    """Clean up build directories before building."""
-    dirs_to_clean = ['build', 'dist']
+
+# Keywords that flag a line of PyInstaller output as an error or a warning
+BUILD_ERROR_PATTERN = re.compile(r'ERROR|FAILED|CRITICAL', re.IGNORECASE)
+BUILD_WARNING_PATTERN = re.compile(r'WARNING', re.IGNORECASE)
+
+class BuildOutputFilter(io.TextIOBase):
+    """Text stream that keeps only build warnings/errors and a short tail.
+
+    Output is processed line by line as it is written, so memory stays
+    bounded however much PyInstaller logs.
+    """
+
+    def __init__(self, tail_lines=200, max_issue_lines=200):
+        super().__init__()
+        self._partial = ''
+        self.tail = deque(maxlen=tail_lines)
+        self.issue_lines = deque(maxlen=max_issue_lines)
+        self.has_errors = False
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            self._process_line(line)
+        return len(text)
+
+    def finish(self):
+        """Process any trailing output that didn't end with a newline."""
+        if self._partial:
+            self._process_line(self._partial)
+            self._partial = ''
+
+    def _process_line(self, line):
+        self.tail.append(line)
+        if BUILD_ERROR_PATTERN.search(line):
+            self.issue_lines.append(line)
+            self.has_errors = True
+        elif BUILD_WARNING_PATTERN.search(line):
+            self.issue_lines.append(line)
+
+# The platform doesn't change during the build, so detect it once
+_SYSTEM = platform.system()
+_IS_WIN = _SYSTEM == "Windows"
+
+# Whether to show full debug output; the environment is read once at startup
+DEBUG_MODE = os.environ.get('BUILD_DEBUG', '').lower() in {'1', 'true', 'yes'}
+
+# Whether to throw away PyInstaller's work cache (build/) and do a full rebuild
+FORCE_CLEAN = os.environ.get('FORCE_CLEAN') == '1' or '--clean' in sys.argv[1:]
+
+# Environment variables applied for the dependency fix and PyInstaller run
+BUILD_ENV = {
+    "BAML_LOG": "OFF",
+    "RULECTL_BUILD": "1",  # Indicate we're in build mode
+}
+
+# PyInstaller configuration, rendered into SPEC_FILE
+SPEC_FILE = Path('rulectl.spec')
+ENTRY_POINT = 'rulectl/cli.py'
+HIDDEN_IMPORTS = [
+    'click',  # Ensure click is included
+    'dotenv',
+    'baml_client',  # BAML client for API calls
+    'baml_client.async_client',
+    'baml_client.sync_client',
+    'baml_client.types',
+    'baml_client.runtime',
+    'baml_client.tracing',
+    'baml_py',  # Core BAML package
+    'baml_py.internal_monkeypatch',  # Fix for missing internal module
+    'pathspec',
+    'importlib.metadata',  # Modern replacement for pkg_resources
+    'typing_extensions',  # Fix for Pydantic compatibility
+    'pydantic',
+    'pydantic_core',
+]
+COLLECT_SUBMODULES = [
+    'baml_py',  # Include all baml_py submodules
+    'rulectl',  # Include all submodules
+]
+DATA_FILES = [
+    ('baml_client', 'baml_client'),  # Include pre-generated BAML client
+    ('config', 'config'),  # Include configuration files (model pricing, etc.)
+]
+RUNTIME_HOOKS = ['suppress_warnings.py']  # Add warning suppression
+# Bytecode optimization level: 1 strips asserts but keeps docstrings, which
+# click uses for the command help text
+OPTIMIZE_LEVEL = 1
+EXCLUDED_MODULES = [
+    'tkinter',  # No GUI
+    'IPython',
+    'pytest',
+    'test',  # CPython's own test suite
+    'pydoc_data',  # Only used by interactive help()
+    'baml_py.tests',
+]
+
+# PyInstaller command line; everything else lives in the spec file
+PYINSTALLER_ARGS = (
+    str(SPEC_FILE),
+    '--noconfirm',  # Replace output directory without asking
+    '--log-level=WARN',  # Only show warnings and errors from PyInstaller
+)
+
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by build.py - edit build.py instead of this file.
+from PyInstaller.utils.hooks import collect_submodules
+
+hiddenimports = {hidden_imports!r}
+for package in {collect_submodules!r}:
+    hiddenimports += collect_submodules(package)
+
+a = Analysis(
+    [{entry_point!r}],
+    pathex=['.'],
+    binaries=[],
+    datas={datas!r},
+    hiddenimports=hiddenimports,
+    hookspath=['.'],
+    hooksconfig={{}},
+    runtime_hooks={runtime_hooks!r},
+    excludes={excludes!r},
+    noarchive=False,
+    optimize={optimize!r},
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name={exe_name!r},
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+"""
+
+# Inputs that only affect the build tooling; if these change the PyInstaller
+# cache can't be trusted and we do a clean build
+BUILD_TOOLING_FILES = ['build.py', 'baml_init.py', 'fix_dependencies.py', 'requirements.txt']
+# Inputs that end up in the executable
+BUILD_SOURCE_PATTERNS = ['rulectl/**/*.py', 'baml_src/**/*', 'config/**/*', 'suppress_warnings.py']
+BUILD_SIGNATURE_FILE = Path('dist') / '.build-sig'
+# Executables from previous builds, keyed by a hash of the file contents above
+ARTIFACT_CACHE_DIR = Path.home() / '.cache' / 'rulectl-build'
+
+def get_exe_name():
+    """Get the executable name for the current platform."""
+    return "rulectl.exe" if _IS_WIN else "rulectl"
+
+def write_spec_file(exe_name):
+    """Write the PyInstaller spec file unless it's newer than build.py.
+
+    Args:
+        exe_name (str): Name of the executable to produce
+    """
+    build_script = Path(__file__)
+    if SPEC_FILE.exists() and SPEC_FILE.stat().st_mtime >= build_script.stat().st_mtime:
+        return
+    SPEC_FILE.write_text(SPEC_TEMPLATE.format(
+        hidden_imports=HIDDEN_IMPORTS,
+        collect_submodules=COLLECT_SUBMODULES,
+        entry_point=ENTRY_POINT,
+        datas=DATA_FILES,
+        runtime_hooks=RUNTIME_HOOKS,
+        excludes=EXCLUDED_MODULES,
+        optimize=OPTIMIZE_LEVEL,
+        exe_name=exe_name,
+    ), encoding='utf-8')
+
+def compute_build_signature(patterns):
+    """Hash the path, mtime and size of every file matching the given patterns."""
+    signature = hashlib.blake2b(digest_size=16)
+    for pattern in patterns:
+        for path in sorted(Path('.').glob(pattern)):
+            if path.is_file():
+                stat = path.stat()
+                signature.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return signature.hexdigest()
+
+def compute_dependency_signature():
+    """Hash the name and version of every installed distribution.
+
+    The executable bundles whatever versions are installed, so upgrading a
+    dependency (e.g. pip install -U baml-py) has to invalidate earlier builds.
+    """
+    from importlib.metadata import distributions
+    installed = sorted(f"{dist.name}=={dist.version}" for dist in distributions())
+    return hashlib.blake2b('\n'.join(installed).encode(), digest_size=16).hexdigest()
+
+def get_build_signature():
+    """Get the current signature of the build tooling, sources and dependencies."""
+    return {
+        'tooling': compute_build_signature(BUILD_TOOLING_FILES),
+        'sources': compute_build_signature(BUILD_SOURCE_PATTERNS),
+        'dependencies': compute_dependency_signature(),
+    }
+
+def compute_artifact_key(dependency_signature):
+    """Hash the contents of every build input into a cache key.
+
+    Unlike the build signature this ignores mtimes, so a fresh checkout of
+    the same sources maps to the same cached executable.
+
+    Args:
+        dependency_signature (str): compute_dependency_signature() of the
+            packages that will be bundled
+    """
+    key = hashlib.sha256()
+    for pattern in BUILD_TOOLING_FILES + BUILD_SOURCE_PATTERNS:
+        for path in sorted(Path('.').glob(pattern)):
+            if path.is_file():
+                key.update(f"{path.as_posix()}\0{path.stat().st_size}\0".encode())
+                with open(path, 'rb') as f:
+                    key.update(f.read())
+    key.update(f"{sys.version}\0{platform.machine()}\0{dependency_signature}".encode())
+    return key.hexdigest()
+
+def restore_cached_executable(key, exe_name):
+    """Copy a cached executable into dist/ if one exists for the key.
+
+    Returns:
+        bool: True if the executable was restored from the cache
+    """
+    cached_exe = ARTIFACT_CACHE_DIR / key / exe_name
+    if not cached_exe.is_file():
+        return False
+    dist_dir = Path('dist')
+    dist_dir.mkdir(exist_ok=True)
+    shutil.copy2(cached_exe, dist_dir / exe_name)
+    return True
+
+def store_cached_executable(key, exe_name):
+    """Copy the freshly built executable into the artifact cache."""
+    cache_dir = ARTIFACT_CACHE_DIR / key
+    tmp_exe = cache_dir / f"{exe_name}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(Path('dist') / exe_name, tmp_exe)
+        os.replace(tmp_exe, cache_dir / exe_name)
+    except OSError as e:
+        # Caching is best effort only
+        print(f"⚠️  Could not cache executable: {e}")
+
+def read_build_signature():
+    """Read the signature stored by the last successful build, if any."""
+    try:
+        lines = BUILD_SIGNATURE_FILE.read_text(encoding='utf-8').splitlines()
+        return dict(line.split(' ', 1) for line in lines if ' ' in line)
+    except OSError:
+        return {}
+
+def write_build_signature(signature):
+    """Store the signature of a successful build next to the executable."""
+    BUILD_SIGNATURE_FILE.write_text(
+        ''.join(f"{key} {value}\n" for key, value in signature.items()),
+        encoding='utf-8'
+    )
+
+def fast_rmtree(path, max_workers=4):
+    """Recursively delete a directory tree.
+
+    Uses the entry type reported by os.scandir, so unlike shutil.rmtree no
+    extra stat call is needed per entry. Files are unlinked on a small thread
+    pool, which helps on slow or network filesystems; directories are removed
+    deepest first once their contents are gone.
+    """
+    directories = []
+    pending = [path]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        unlinks = []
+        while pending:
+            directory = pending.pop()
+            directories.append(directory)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        unlinks.append(executor.submit(os.unlink, entry.path))
+        for unlink in unlinks:
+            unlink.result()  # Re-raise the first OSError, if any
+    # Children are always discovered after their parent
+    for directory in reversed(directories):
+        os.rmdir(directory)
+
+def clean_build_dirs(keep_work_dir=True):
+    """Clean up build directories before building.
+
+    Args:
+        keep_work_dir (bool): Keep build/, which PyInstaller uses as its
+            work cache, and only remove dist/
+    """
+    dirs_to_clean = ['dist'] if keep_work_dir else ['build', 'dist']
     for dir_name in dirs_to_clean:
         if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
+            try:
+                fast_rmtree(dir_name)
+            except OSError:
+                # e.g. read-only files on Windows; shutil knows how to handle these
+                shutil.rmtree(dir_name)
             print(f"Cleaned {dir_name}/")
 
-def build_executable():
-    """Build the standalone executable."""
-    import subprocess
-    import logging
-    
+@contextlib.contextmanager
+def capture_output(stdout, stderr):
+    """Redirect stdout/stderr, including already-configured logging handlers."""
+    # PyInstaller configures root logging handlers at import time, bound to
+    # the real stderr, so redirecting sys.stderr alone would not capture them.
+    handlers = [h for h in logging.getLogger().handlers if isinstance(h, logging.StreamHandler)]
+    previous_streams = [h.stream for h in handlers]
+    for handler in handlers:
+        handler.setStream(stderr)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            yield
+    finally:
+        for handler, stream in zip(handlers, previous_streams):
+            handler.setStream(stream)
+
+def run_pyinstaller(args, output=None):
+    """Run PyInstaller in this interpreter instead of spawning a new one.
+
+    Args:
+        args (list): PyInstaller command line arguments
+        output (BuildOutputFilter): Stream that receives all output as it is
+            produced. If None, output goes straight to the terminal.
+
+    Returns:
+        subprocess.CompletedProcess: Mirrors what subprocess.run would return
+    """
+    # Imported here so that merely importing build.py stays cheap
+    import PyInstaller.__main__
+
+    error_stream = output if output is not None else sys.stderr
+    returncode = 0
+    try:
+        if output is not None:
+            with capture_output(output, output):
+                PyInstaller.__main__.run(args)
+        else:
+            PyInstaller.__main__.run(args)
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            returncode = e.code
+        elif e.code is not None:
+            error_stream.write(f"{e.code}\n")
+            returncode = 1
+    except Exception as e:
+        error_stream.write(f"{e}\n")
+        returncode = 1
+    finally:
+        if output is not None:
+            output.finish()
+    return subprocess.CompletedProcess(args, returncode)
+
+def build_executable(exe_name, incremental=False):
+    """Build the standalone executable.
+
+    Args:
+        exe_name (str): Name of the executable to produce
+        incremental (bool): Reuse PyInstaller's cache instead of passing --clean
+    """
     # Set environment variables for build
-    os.environ["BAML_LOG"] = "OFF"
-    os.environ["RULECTL_BUILD"] = "1"  # Indicate we're in build mode
+    os.environ.update(BUILD_ENV)
     
-    # Determine the executable name based on platform
-    if platform.system() == "Windows":
-        exe_name = "rulectl.exe"
-    else:
-        exe_name = "rulectl"
-
-    # PyInstaller arguments
-    args = [
-        sys.executable, '-m', 'PyInstaller',
-        'rulectl/cli.py',  # Your entry point
-        '--name=%s' % exe_name,
-        '--onefile',  # Create a single executable
-        '--clean',  # Clean PyInstaller cache
-        '--hidden-import=click',  # Ensure click is included
-        '--hidden-import=dotenv',
-        '--hidden-import=baml_client',  # BAML client for API calls
-        '--hidden-import=baml_client.async_client',
-        '--hidden-import=baml_client.sync_client', 
-        '--hidden-import=baml_client.types',
-        '--hidden-import=baml_client.runtime',
-        '--hidden-import=baml_client.tracing',
-        '--hidden-import=baml_py',  # Core BAML package
-        '--hidden-import=baml_py.internal_monkeypatch',  # Fix for missing internal module
-        '--collect-submodules=baml_py',  # Include all baml_py submodules
-        '--hidden-import=pathspec',
-        '--hidden-import=importlib.metadata',  # Modern replacement for pkg_resources
-        '--hidden-import=typing_extensions',  # Fix for Pydantic compatibility
-        '--hidden-import=pydantic',
-        '--hidden-import=pydantic_core',
-        '--noconfirm',  # Replace output directory without asking
-        '--paths=.',  # Add current directory to Python path
-        '--additional-hooks-dir=.',  # Look for hooks in current directory
-        '--collect-submodules=rulectl',  # Include all submodules
-        '--runtime-hook=suppress_warnings.py',  # Add warning suppression
-        '--add-data=baml_client:baml_client',  # Include pre-generated BAML client
-        '--add-data=config:config',  # Include configuration files (model pricing, etc.)
-        '--log-level=WARN',  # Only show warnings and errors from PyInstaller
-    ]
-
-    # Add platform-specific options
-    if platform.system() == "Darwin":  # macOS
-        args.extend([
-            '--codesign-identity=',  # Skip code signing
-            '--osx-bundle-identifier=dev.rulectl.cli'  # Add bundle identifier
-        ])
+    # Generate the spec file if it's missing or build.py changed
+    write_spec_file(exe_name)
+
+    args = list(PYINSTALLER_ARGS)
+    if not incremental:
+        args.append('--clean')  # Clean PyInstaller cache
 
     print("🔨 Building executable (this may take a minute)...")
     
-    # Check if we should show debug output
-    debug_mode = os.environ.get('BUILD_DEBUG', '').lower() in ['1', 'true', 'yes']
-    
     try:
-        if debug_mode:
+        if DEBUG_MODE:
             print("📋 Debug mode enabled. Showing full PyInstaller output...")
-            result = subprocess.run(args, check=True)
+            result = run_pyinstaller(args)
+            result.check_returncode()
         else:
-            # Run PyInstaller and capture output with proper encoding
-            result = subprocess.run(args, capture_output=True, text=True, encoding='utf-8', errors='replace')
+            # Run PyInstaller in-process, filtering its output as it streams
+            output = BuildOutputFilter()
+            result = run_pyinstaller(args, output=output)
             
             # Check for actual failure (don't rely only on exceptions)
             if result.returncode != 0:
                 print("❌ PyInstaller failed!")
-                print("\nStdout:")
-                print(result.stdout)
-                print("\nStderr:")
-                print(result.stderr)
+                print(f"\nOutput (last {len(output.tail)} lines):")
+                print('\n'.join(output.tail))
                 return False
             
             # Check for errors in output even if exit code was 0
-            has_errors = False
-            if result.stderr:
-                error_lines = []
-                for line in result.stderr.split('\n'):
-                    if any(keyword in line.upper() for keyword in ['ERROR', 'FAILED', 'CRITICAL']):
-                        error_lines.append(line)
-                        has_errors = True
-                    elif 'WARNING' in line.upper():
-                        error_lines.append(line)
-                
-                if error_lines:
-                    print("⚠️  Build warnings/errors:")
-                    for line in error_lines:
-                        print(f"  {line}")
-                
-                if has_errors:
-                    print("❌ Build failed due to errors in PyInstaller output!")
-                    return False
+            if output.issue_lines:
+                sys.stdout.write("⚠️  Build warnings/errors:\n" +
+                                 ''.join(f"  {line}\n" for line in output.issue_lines))
+            
+            if output.has_errors:
+                print("❌ Build failed due to errors in PyInstaller output!")
+                return False
             
             # Show a simple progress indicator
-            print("  📦 Packaging application...")
-            print("  🔗 Bundling dependencies...")
-            print("  ✨ Creating standalone executable...")
+            sys.stdout.write(
+                "  📦 Packaging application...\n"
+                "  🔗 Bundling dependencies...\n"
+                "  ✨ Creating standalone executable...\n"
+            )
     except subprocess.CalledProcessError as e:
         print("❌ Build failed!")
-        if not debug_mode:
+        if not DEBUG_MODE:
             print("\nRun with BUILD_DEBUG=1 to see detailed output:")
             print("  BUILD_DEBUG=1 python build.py")
         print("\nError output:")
-        print("Stdout:", e.stdout if hasattr(e, 'stdout') and e.stdout else "None")
-        print("Stderr:", e.stderr if hasattr(e, 'stderr') and e.stderr else "None")
+        print("Stdout:", getattr(e, 'stdout', None) or "None")
+        print("Stderr:", getattr(e, 'stderr', None) or "None")
         return False
     
     # Get the path to the created executable
@@ -169,39 +481,46 @@ def build_executable():
         return False
     
     # Verify the file is actually executable and has reasonable size
-    file_size = exe_path.stat().st_size
+    exe_stat = exe_path.stat()
+    file_size = exe_stat.st_size
+    lines = []
     if file_size < 1024:  # Less than 1KB is suspicious
-        print(f"\n⚠️  Warning: Executable is very small ({file_size} bytes)")
-        print("This might indicate a problem with the build process.")
+        lines.append(f"\n⚠️  Warning: Executable is very small ({file_size} bytes)")
+        lines.append("This might indicate a problem with the build process.")
     
-    print(f"\n✅ Build successful! Executable created at: {exe_path.absolute()}")
-    print(f"📊 File size: {file_size:,} bytes")
-    print("\nTo run the executable:")
-    if platform.system() == "Windows":
-        print(f"  {exe_path.absolute()}")
-    else:
-        print(f"  {exe_path.absolute()}")
+    lines.append(f"\n✅ Build successful! Executable created at: {exe_path.absolute()}")
+    lines.append(f"📊 File size: {file_size:,} bytes")
+    lines.append("\nTo run the executable:")
+    lines.append(f"  {exe_path.absolute()}")
         
     # Make the file executable on Unix systems
-    if platform.system() != "Windows":
-        exe_path.chmod(exe_path.stat().st_mode | 0o755)
-        print("\nMade executable with chmod +x")
+    if not _IS_WIN:
+        exe_path.chmod(exe_stat.st_mode | 0o755)
+        lines.append("\nMade executable with chmod +x")
+
+    # Emit the summary in a single write
+    sys.stdout.write('\n'.join(lines) + '\n')
 
     return True
 
 def fix_dependencies():
     """Fix dependency issues before building."""
     print("🔧 Checking and fixing dependencies...")
+    output = io.StringIO()
     try:
-        import subprocess
-        result = subprocess.run([
-            sys.executable, "fix_dependencies.py"
-        ], check=True, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        # Run in-process to avoid starting another Python interpreter. Build
+        # mode makes it skip its BAML import test, which would otherwise load
+        # the stale generated client into this interpreter before it is
+        # regenerated.
+        os.environ.update(BUILD_ENV)
+        import fix_dependencies as dependency_fixer
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            success = dependency_fixer.main()
+        if not success:
+            print(f"❌ Dependency fix failed: {output.getvalue()}")
+            return False
         print("✅ Dependencies verified")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Dependency fix failed: {e.stderr}")
-        return False
     except Exception as e:
         print(f"⚠️  Could not run dependency fix: {e}")
         print("Continuing build anyway...")
@@ -209,12 +528,13 @@ def fix_dependencies():
 
 def run_baml_generation():
     """Run BAML generation before building."""
-    if generate_baml is None:
+    try:
+        from baml_init import generate_baml
+    except ImportError:
         print("⚠️  BAML generation not available. Please ensure baml_init.py is present.")
         return True  # Continue with build anyway
     
-    debug_mode = os.environ.get('BUILD_DEBUG', '').lower() in ['1', 'true', 'yes']
-    if not debug_mode:
+    if not DEBUG_MODE:
         print("🔧 Generating BAML client...")
     else:
         print("🔧 Running BAML generation...")
@@ -228,30 +548,62 @@ def main():
     """Main build function."""
     print("🚀 Starting build process...")
     
+    # Skip the build entirely if nothing changed since the last successful one
+    exe_name = get_exe_name()
+    previous_signature = read_build_signature()
+    signature = get_build_signature()
+    if not FORCE_CLEAN and previous_signature == signature and (Path('dist') / exe_name).exists():
+        print("✅ Build is up-to-date, nothing to do.")
+        return
+    
+    # Keep build/ so PyInstaller can reuse its cache, unless a clean build
+    # was requested (FORCE_CLEAN=1 or --clean)
+    incremental = not FORCE_CLEAN
+    
     # Fix dependencies first
     if not fix_dependencies():
         print("💥 Dependency issues detected. Please run 'python fix_dependencies.py' first.")
         exit(1)
     
-    # Run BAML generation
-    if not run_baml_generation():
+    # fix_dependencies may have upgraded packages, so only now is it known
+    # which versions the executable will bundle
+    signature['dependencies'] = compute_dependency_signature()
+    
+    # Reuse an executable built earlier from identical inputs
+    artifact_key = compute_artifact_key(signature['dependencies'])
+    if not FORCE_CLEAN and restore_cached_executable(artifact_key, exe_name):
+        write_build_signature(signature)
+        print(f"✅ Restored {exe_name} from build cache ({ARTIFACT_CACHE_DIR / artifact_key})")
+        return
+    
+    # Run BAML generation and clean up previous builds concurrently;
+    # the two tasks touch unrelated files
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        baml_future = executor.submit(run_baml_generation)
+        clean_future = executor.submit(clean_build_dirs, keep_work_dir=incremental)
+        baml_success = baml_future.result()
+        clean_future.result()
+    
+    if not baml_success:
         print("💥 BAML generation failed. Please run 'python baml_init.py' manually.")
         exit(1)
     
-    # Clean up previous builds
-    clean_build_dirs()
-    
     # Build the executable
-    success = build_executable()
+    success = build_executable(exe_name, incremental=incremental)
     
     if success:
-        print("\n📦 Build process complete!")
+        write_build_signature(signature)
+        store_cached_executable(artifact_key, exe_name)
+        lines = ["\n📦 Build process complete!"]
         # Only show distribution instructions if not running from installer
         if not os.environ.get('RULECTL_INSTALLER'):
-            print("\nTo distribute the executable:")
-            print(f"1. Copy the executable from {Path('dist').absolute()}")
-            print("2. The executable is self-contained and can run directly")
-            print("3. No Python installation required on the target machine")
+            lines.extend([
+                "\nTo distribute the executable:",
+                f"1. Copy the executable from {Path('dist').absolute()}",
+                "2. The executable is self-contained and can run directly",
+                "3. No Python installation required on the target machine",
+            ])
+        sys.stdout.write('\n'.join(lines) + '\n')
     else:
         print("\n💥 Build process failed!")
         exit(1)
@@ -3,26 +3,44 @@
 Script to fix dependency issues before building.
 """
 
+import shlex
 import subprocess
 import sys
 import os
+from collections import deque
 
-# Fix Unicode output on Windows
-if sys.platform == "win32":
+# Fix Unicode output on Windows (build.py already does this when importing us)
+if sys.platform == "win32" and __name__ == "__main__":
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.detach(), encoding='utf-8', errors='replace')
 
+# Skip prompts and pip's self-version check (an HTTPS request per invocation)
+PIP_INSTALL = f"{shlex.quote(sys.executable)} -m pip install --no-input --disable-pip-version-check"
+
 def run_command(cmd, description):
-    """Run a command and handle errors."""
+    """Run a command and handle errors.
+
+    Output is streamed line by line; only warnings and errors are echoed,
+    plus the last lines of output if the command fails.
+    """
     print(f"🔧 {description}...")
+    tail = deque(maxlen=20)
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        with subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                tail.append(line)
+                lowered = line.lower()
+                if 'error' in lowered or 'warning' in lowered:
+                    print(line, end='')
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
         print(f"✅ {description} completed")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed: {e}")
-        print(f"Error output: {e.stderr}")
+        print(f"Error output: {''.join(tail)}")
         return False
 
 def main():
@@ -30,10 +48,10 @@ def main():
     print("🔍 Fixing dependency compatibility issues...")
     
     # Upgrade pip first
-    if not run_command(f"{sys.executable} -m pip install --upgrade pip", "Upgrading pip"):
+    if not run_command(f"{PIP_INSTALL} --upgrade pip", "Upgrading pip"):
         return False
     
-    # Install/upgrade critical packages in order
+    # Install/upgrade critical packages in a single resolver pass
     critical_packages = [
         "typing_extensions>=4.8.0",
         "pydantic>=2.6.0", 
@@ -41,12 +59,12 @@ def main():
         "baml-py>=0.202.1"
     ]
     
-    for package in critical_packages:
-        if not run_command(f'{sys.executable} -m pip install --upgrade "{package}"', f"Installing/upgrading {package}"):
-            return False
+    packages = " ".join(shlex.quote(package) for package in critical_packages)
+    if not run_command(f"{PIP_INSTALL} --upgrade {packages}", "Installing/upgrading critical packages"):
+        return False
     
     # Install all requirements
-    if not run_command(f"{sys.executable} -m pip install -r requirements.txt", "Installing all requirements"):
+    if not run_command(f"{PIP_INSTALL} -r requirements.txt", "Installing all requirements"):
         return False
     
     # Test BAML import (optional during build process)
@@ -2,20 +2,49 @@
 Rulectl - A tool for analyzing and creating cursor rules in repositories.
 """
 
-from importlib.metadata import version, PackageNotFoundError
-
-try:
-    __version__ = version("rulectl")
-except PackageNotFoundError:
-    # Package is not installed, read from version.py
-    import os
-    import sys
-    parent_dir = os.path.dirname(os.path.dirname(__file__))
-    sys.path.insert(0, parent_dir)
+__author__ = "Rulectl Team & Contributors"
+
+# Submodules are imported on first attribute access (e.g. rulectl.analyzer)
+_SUBMODULES = (
+    "analyzer",
+    "cli",
+    "git_utils",
+    "rate_limiter",
+    "token_tracker",
+    "utils",
+)
+
+__all__ = ["__version__", "__author__"]
+
+
+def __getattr__(name):
+    """Resolve __version__ and submodules lazily so importing the package stays cheap."""
+    if name in _SUBMODULES:
+        import importlib
+        return importlib.import_module(f"{__name__}.{name}")
+
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib.metadata import version, PackageNotFoundError
+
     try:
-        from version import VERSION
-        __version__ = VERSION
-    except ImportError:
-        __version__ = "0.0.0"  # Fallback version
+        package_version = version("rulectl")
+    except PackageNotFoundError:
+        # Package is not installed, read from version.py
+        import os
+        import sys
+        parent_dir = os.path.dirname(os.path.dirname(__file__))
+        sys.path.insert(0, parent_dir)
+        try:
+            from version import VERSION
+            package_version = VERSION
+        except ImportError:
+            package_version = "0.0.0"  # Fallback version
+
+    globals()["__version__"] = package_version
+    return package_version
+
 
-__author__ = "Rulectl Team & Contributors" 
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
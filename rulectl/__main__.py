@@ -3,7 +3,12 @@
 Main entry point for the Rulectl CLI when run as a module.
 """
 
-from rulectl.cli import main
+
+def _entry():
+    """Import the CLI only once we're actually running it."""
+    from rulectl.cli import main
+    main()
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    _entry()
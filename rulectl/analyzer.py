@@ -6,12 +6,19 @@ This module handles the intelligent analysis of repositories to generate Cursor
 
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Set, Optional, NamedTuple
+from typing import Dict, List, Any, Tuple, Set, Optional, NamedTuple, AsyncIterator, Union
+import codecs
 import json
 import re
 import yaml
+import functools
+import hashlib
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import islice
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from dataclasses import dataclass
 try:
     from baml_client.async_client import b
@@ -24,6 +31,7 @@ except ImportError as e:
     print("  pip install --upgrade pydantic>=2.6.0 typing_extensions>=4.8.0 baml-py>=0.202.1")
     sys.exit(1)
 import pathspec
+from pathspec.util import normalize_file
 import mimetypes
 import logging
 import asyncio
@@ -41,21 +49,520 @@ except ImportError:
 
 # Import rate limiter
 try:
-    from .rate_limiter import RateLimiter, RateLimitConfig, RateLimitStrategy
+    from .rate_limiter import RateLimiter, RateLimitConfig, RateLimitStrategy, is_rate_limit_error
 except ImportError:
     try:
-        from rulectl.rate_limiter import RateLimiter, RateLimitConfig, RateLimitStrategy
+        from rulectl.rate_limiter import RateLimiter, RateLimitConfig, RateLimitStrategy, is_rate_limit_error
     except ImportError:
         RateLimiter = None
         RateLimitConfig = None
         RateLimitStrategy = None
+        is_rate_limit_error = None
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as YamlSafeLoader, CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader, SafeDumper as YamlSafeDumper
+
 # Maximum number of lines a file can have to be analyzed
 MAX_ANALYZABLE_LINES = 2000
 
+# Files larger than this are rejected from their size alone, without reading them
+MAX_ANALYZABLE_BYTES = MAX_ANALYZABLE_LINES * 200
+
+# Number of leading bytes inspected by the binary/encoding heuristics
+PROBE_BYTES = 4096
+
+# Number of files probed concurrently while scanning the repository
+PROBE_WORKERS = 16
+
+# Probe results persisted between runs, one file per repository. Kept in the
+# user's cache directory so scanning never writes into the repository itself
+PROBE_CACHE_DIR = Path(os.path.expanduser('~')) / '.cache' / 'rulectl' / 'probe'
+
+# Cached probe results are only reused when the probe's limits still match
+PROBE_CACHE_SIGNATURE = f"1:{MAX_ANALYZABLE_LINES}:{MAX_ANALYZABLE_BYTES}:{PROBE_BYTES}"
+
+# EXTREMELY AGGRESSIVE CONFIG FILE SKIPPING - skip by default, AI can review later
+CONFIG_EXTENSIONS = frozenset({
+    '.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf',
+    '.xml', '.plist', '.properties', '.env',
+    '.gradle', '.maven', '.sbt', '.cmake', '.make', '.mk',
+    '.dockerfile', '.containerfile'
+})
+
+# Comprehensive binary extensions - VERY aggressive skipping
+BINARY_EXTENSIONS = frozenset({
+    # ===== IMAGES =====
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.icns', '.tiff', '.tif',
+    '.webp', '.svg', '.psd', '.ai', '.eps', '.raw', '.cr2', '.nef', '.dng',
+    '.heic', '.avif', '.jfif', '.jp2', '.jpx', '.j2k', '.j2c',
+
+    # ===== AUDIO =====
+    '.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a', '.opus',
+    '.aiff', '.au', '.mid', '.midi', '.ra', '.rm', '.3gp',
+
+    # ===== VIDEO =====
+    '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v',
+    '.3gp', '.ogv', '.asf', '.rm', '.swf', '.f4v', '.vob', '.ts',
+
+    # ===== DOCUMENTS =====
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.odt', '.ods', '.odp', '.rtf', '.pages', '.numbers', '.key',
+    '.epub', '.mobi', '.azw', '.azw3', '.djvu', '.cbr', '.cbz',
+
+    # ===== ARCHIVES =====
+    '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar', '.arj',
+    '.cab', '.msi', '.deb', '.rpm', '.dmg', '.pkg', '.snap',
+    '.tgz', '.tbz2', '.txz', '.lzma', '.ace', '.alz',
+
+    # ===== EXECUTABLES =====
+    '.exe', '.dll', '.so', '.dylib', '.app', '.deb', '.rpm', '.msi',
+    '.com', '.bat', '.cmd', '.scr', '.gadget', '.application',
+
+    # ===== COMPILED CODE =====
+    '.pyc', '.pyo', '.pyd', '.class', '.jar', '.war', '.ear',
+    '.beam', '.plt', '.rlib', '.rmeta', '.wasm',
+    '.o', '.obj', '.a', '.lib', '.out', '.pdb', '.ilk', '.exp',
+
+    # ===== DATABASES =====
+    '.db', '.sqlite', '.sqlite3', '.mdb', '.accdb', '.dbf',
+    '.frm', '.myd', '.myi', '.ibd', '.fdb', '.gdb',
+
+    # ===== FONTS =====
+    '.ttf', '.otf', '.woff', '.woff2', '.eot', '.fon', '.fnt',
+    '.pfb', '.pfm', '.afm', '.bdf', '.pcf', '.snf',
+
+    # ===== BINARY DATA =====
+    '.bin', '.dat', '.dump', '.img', '.iso', '.toast', '.vcd',
+    '.crx', '.xpi', '.oex', '.ipa', '.apk', '.appx',
+
+    # ===== CERTIFICATES =====
+    '.pem', '.key', '.cert', '.crt', '.cer', '.der', '.p12',
+    '.pfx', '.jks', '.keystore', '.truststore',
+
+    # ===== GENERATED/MINIFIED FILES =====
+    '.min.js', '.min.css', '.bundle.js', '.bundle.css',
+    '.chunk.js', '.chunk.css', '.map',
+
+    # ===== BACKUP/TEMP =====
+    '.bak', '.backup', '.tmp', '.temp', '.swp', '.swo',
+    '.orig', '.rej', '~',
+
+    # ===== DOCUMENTATION WE SKIP =====
+    '.txt', '.rtf',  # Plain text files - usually not code patterns
+})
+
+# Known text extensions that we DO want to analyze
+TEXT_EXTENSIONS = frozenset({
+    # ===== SOURCE CODE =====
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.vue', '.svelte',  # Modern web
+    '.html', '.htm', '.css', '.scss', '.sass', '.less', '.styl',  # Web styling
+    '.c', '.cpp', '.cc', '.cxx', '.h', '.hpp', '.hxx',  # C/C++
+    '.java', '.kt', '.scala', '.groovy',  # JVM languages
+    '.rs', '.go', '.zig', '.nim', '.d',  # Systems languages
+    '.rb', '.php', '.perl', '.pl', '.lua', '.r',  # Scripting
+    '.swift', '.m', '.mm',  # Apple
+    '.cs', '.vb', '.fs',  # .NET
+    '.dart', '.elm', '.clj', '.cljs', '.ex', '.exs',  # Functional/modern
+    '.ml', '.mli', '.hs', '.lhs',  # Functional
+
+    # Config/build files skipped by default (AI can review them later)
+
+    # ===== SHELL/SCRIPTS =====
+    '.sh', '.bash', '.zsh', '.fish', '.csh', '.tcsh',
+    '.ps1', '.psm1', '.psd1',  # PowerShell
+    '.bat', '.cmd',  # Windows batch (though these can be binary)
+
+    # ===== DATABASE =====
+    '.sql', '.hql', '.cql',
+
+    # ===== MARKUP =====
+    '.md', '.rst', '.tex', '.adoc', '.org',  # Keep these for code docs
+    '.svg',  # SVG can contain code patterns
+
+    # ===== SPECIAL FILES =====
+    '.gitignore', '.gitattributes', '.editorconfig',
+    '.eslintrc', '.prettierrc', '.babelrc',
+})
+
+# Comprehensive default ignore patterns for safety - be VERY aggressive
+DEFAULT_IGNORE_PATTERNS = (
+    # ===== EXECUTABLE AND BINARY FILES =====
+    '*.exe', '*.dll', '*.so', '*.dylib', '*.bin', '*.com', '*.bat',  # Executables
+    '*.o', '*.obj', '*.a', '*.lib', '*.out', '*.app',  # Object/compiled files
+    '*.pyc', '*.pyo', '*.pyd', '__pycache__/',  # Python compiled
+    '*.class', '*.jar', '*.war', '*.ear',  # Java compiled
+    '*.beam', '*.plt',  # Erlang/Elixir compiled
+    '*.rlib', '*.rmeta',  # Rust compiled
+    '*.wasm',  # WebAssembly
+
+    # ===== ARCHIVES AND PACKAGES =====
+    '*.zip', '*.tar', '*.gz', '*.bz2', '*.xz', '*.7z', '*.rar', '*.arj',
+    '*.cab', '*.msi', '*.deb', '*.rpm', '*.dmg', '*.pkg', '*.snap',
+    '*.tgz', '*.tbz2', '*.txz',  # Compressed archives
+    '*.iso', '*.img', '*.vdi', '*.vmdk',  # Disk images
+
+    # ===== MEDIA FILES =====
+    # Images (all common formats)
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.ico', '*.icns',
+    '*.svg', '*.webp', '*.tiff', '*.tif', '*.psd', '*.ai', '*.eps',
+    '*.raw', '*.cr2', '*.nef', '*.dng', '*.heic', '*.avif',
+    # Audio
+    '*.mp3', '*.wav', '*.flac', '*.aac', '*.ogg', '*.wma', '*.m4a',
+    '*.opus', '*.aiff', '*.au', '*.mid', '*.midi',
+    # Video
+    '*.mp4', '*.avi', '*.mov', '*.wmv', '*.flv', '*.webm', '*.mkv',
+    '*.m4v', '*.3gp', '*.ogv', '*.asf', '*.rm', '*.swf',
+
+    # ===== FONTS =====
+    '*.ttf', '*.otf', '*.woff', '*.woff2', '*.eot', '*.fon', '*.fnt',
+
+    # ===== DOCUMENTS AND OFFICE FILES =====
+    '*.pdf', '*.doc', '*.docx', '*.xls', '*.xlsx', '*.ppt', '*.pptx',
+    '*.odt', '*.ods', '*.odp', '*.rtf', '*.pages', '*.numbers', '*.key',
+    '*.epub', '*.mobi', '*.azw', '*.azw3',
+
+    # ===== DATABASES =====
+    '*.db', '*.sqlite', '*.sqlite3', '*.mdb', '*.accdb', '*.dbf',
+    '*.frm', '*.myd', '*.myi', '*.ibd',
+
+    # ===== CERTIFICATES AND SECURITY =====
+    '*.pem', '*.key', '*.cert', '*.crt', '*.cer', '*.der', '*.p12',
+    '*.pfx', '*.jks', '*.keystore', '*.truststore',
+
+    # ===== ENVIRONMENT AND SECRETS =====
+    '.env', '.env.*', '.environment',  # Environment files
+    '*password*', '*secret*', '*credential*', '*api*key*',  # Potential secrets
+    '*.secrets', '.aws/', '.ssh/', '.gnupg/',  # Config directories
+
+    # ===== VERSION CONTROL =====
+    '.git/', '.svn/', '.hg/', '.bzr/', '.fossil-settings/',
+
+    # ===== BUILD OUTPUT AND DEPENDENCIES =====
+    # JavaScript/Node
+    'node_modules/', 'bower_components/', 'jspm_packages/',
+    'dist/', 'build/', 'out/', 'public/', 'static/',
+    '.next/', '.nuxt/', '.vuepress/', '.svelte-kit/',
+    'coverage/', '.nyc_output/',
+    # Python
+    '__pycache__/', '*.egg-info/', 'dist/', 'build/',
+    '.eggs/', '.pytest_cache/', '.coverage', '.tox/',
+    'venv/', 'env/', '.venv/', '.env/',
+    # Ruby
+    'vendor/', 'Gemfile.lock',
+    # Go
+    'vendor/', 'go.sum',
+    # Rust
+    'target/', 'Cargo.lock',
+    # Java/Maven/Gradle
+    'target/', '.gradle/', 'build/', 'gradle-wrapper.jar',
+    # .NET
+    'bin/', 'obj/', 'packages/', '*.user', '*.suo',
+    # C/C++
+    'Debug/', 'Release/', 'x64/', 'x86/', '.vs/',
+
+    # ===== IDE AND EDITOR FILES =====
+    '.idea/', '.vscode/', '.eclipse/', '.settings/',
+    '*.swp', '*.swo', '*.tmp', '*~', '.#*', '#*#',
+    '*.orig', '*.rej', '*.bak', '*.backup',
+    '.project', '.classpath', '.factorypath',
+    'Desktop.ini', 'ehthumbs.db',
+
+    # ===== OS FILES =====
+    '.DS_Store', '.DS_Store?', '._*', '.Spotlight-V100',
+    '.Trashes', 'Thumbs.db', 'thumbs.db', 'ehthumbs.db',
+
+    # ===== LOG AND TEMPORARY FILES =====
+    '*.log', '*.log.*', '*.logs', 'logs/',
+    '*.tmp', '*.temp', 'tmp/', 'temp/', 'cache/',
+    '.cache/', '.tmp/', '.temp/',
+
+    # ===== GENERATED/COMPILED FRONTEND ASSETS =====
+    '*.min.js', '*.min.css', '*.bundle.js', '*.bundle.css',
+    '*.chunk.js', '*.chunk.css', '*.map', '*.gz.js', '*.gz.css',
+
+    # ===== TOOL-SPECIFIC =====
+    '.cursor/rules.mdc', '.cursor/rules/',  # Our rules file
+    '.rulectl/*', '.rulectl/',  # Our analysis files
+    '.terraform/', 'terraform.tfstate', '*.tfstate',
+    '.vagrant/', 'Vagrantfile.local',
+    '.docker/', 'docker-compose.override.yml',
+
+    # ===== DOCUMENTATION THAT WE SHOULD SKIP =====
+    # Often these are not code patterns but just text
+    '*.txt', '*.rtf', 'README*', 'CHANGELOG*', 'LICENSE*',
+    'CONTRIBUTING*', 'AUTHORS*', 'CREDITS*', 'COPYING*',
+    'INSTALL*', 'NEWS*', 'TODO*', 'HISTORY*',
+
+    # ===== PACKAGE MANAGER LOCKS AND METADATA =====
+    'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml',
+    'Pipfile.lock', 'poetry.lock', 'Gemfile.lock',
+    'composer.lock', 'mix.lock', 'rebar.lock',
+
+    # ===== TEST FIXTURES AND MOCK DATA =====
+    'fixtures/', 'mocks/', 'test-data/', 'mock-data/',
+    '*.fixtures', '*.mocks', 'dummy.*', 'sample.*',
+
+    # ===== CONFIGURATION THAT'S NOT CODE =====
+    '.editorconfig', '.gitattributes', '.gitmodules',
+    'robots.txt', 'sitemap.xml', 'favicon.ico',
+    '.htaccess', '.nginx.conf', 'web.config',
+)
+def compile_ignore_regex(spec: pathspec.PathSpec) -> "re.Pattern[str]":
+    """Union the patterns of a PathSpec into one compiled regex.
+
+    PathSpec.match_file tries every pattern's regex in turn; a single
+    alternation lets the regex engine do that in one call. Only valid for
+    specs without negated patterns, which rulectl never loads.
+
+    Args:
+        spec: Spec made of gitwildmatch patterns
+
+    Returns:
+        re.Pattern: Matches a normalized path exactly when spec.match_file would
+    """
+    alternatives = []
+    for pattern in spec.patterns:
+        if pattern.include is None:
+            continue  # Blank line or comment
+        if not pattern.include:
+            raise ValueError("Negated patterns cannot be merged into a single regex")
+        # Every pattern names its directory-marker group the same way, which
+        # a union can't contain; the groups aren't needed for a yes/no match
+        alternatives.append(f"(?:{re.sub(r'[(][?]P<[^>]+>', '(?:', pattern.regex.pattern)})")
+    return re.compile('|'.join(alternatives) if alternatives else '(?!)')
+
+# Compiled once and shared by every RepoAnalyzer. The list above repeats some
+# patterns across ecosystems (dist/, build/, vendor/, ...), so drop duplicates
+# while keeping the order
+DEFAULT_IGNORE_SPEC = pathspec.PathSpec.from_lines('gitwildmatch', dict.fromkeys(DEFAULT_IGNORE_PATTERNS))
+DEFAULT_IGNORE_REGEX = compile_ignore_regex(DEFAULT_IGNORE_SPEC)
+# Plain 'name/' patterns match a directory of that name at any depth, so any
+# path with one of these as a parent is ignored without running the matcher
+DEFAULT_IGNORED_DIRS = frozenset(
+    pattern[:-1] for pattern in DEFAULT_IGNORE_PATTERNS
+    if pattern.endswith('/') and not any(c in pattern[:-1] for c in '/*?[!')
+)
+
+# Semantic keyword groups used to cluster candidate rules, in priority order
+_CLUSTER_KEYWORD_GROUPS = {
+    'pathlib-usage': ['pathlib', 'path', 'os.path', 'file-path', 'directory'],
+    'git-operations': ['git', 'repository', 'branch', 'commit', 'repo'],
+    'error-handling': ['error', 'exception', 'handle', 'catch', 'try-except'],
+    'api-management': ['api', 'key', 'credential', 'authentication', 'token'],
+    'baml-integration': ['baml', 'client', 'gpt', 'llm', 'generate'],
+    'build-process': ['build', 'compile', 'executable', 'platform', 'pyinstaller'],
+    'testing-patterns': ['test', 'mock', 'fixture', 'temporary', 'temp'],
+    'configuration': ['config', 'setup', 'env', 'environment', 'dotenv'],
+    'file-operations': ['file', 'read', 'write', 'analyze', 'text', 'binary'],
+    'validation': ['validate', 'check', 'verify', 'ensure', 'confirm'],
+    'data-structures': ['dataclass', 'class', 'structure', 'type', 'schema'],
+    'cli-patterns': ['cli', 'command', 'entry-point', 'main', 'console'],
+    'package-management': ['package', 'dependency', 'install', 'requirements', 'setup'],
+    'code-style': ['naming', 'convention', 'format', 'style', 'pattern'],
+}
+
+# General descriptions for rules merged from several rules of a cluster
+_CLUSTER_DESCRIPTIONS = {
+    'pathlib-usage': 'Use pathlib for file and path operations instead of os.path',
+    'git-operations': 'Follow consistent patterns for git repository operations',
+    'error-handling': 'Implement proper error handling and exception management',
+    'api-management': 'Manage API keys and credentials securely',
+    'baml-integration': 'Use BAML client patterns for LLM integration',
+    'build-process': 'Follow consistent build and compilation patterns',
+    'testing-patterns': 'Use consistent testing patterns and utilities',
+    'configuration': 'Handle configuration and environment variables properly',
+    'file-operations': 'Follow consistent patterns for file analysis and processing',
+    'validation': 'Implement proper validation and verification patterns',
+    'data-structures': 'Use appropriate data structures and class definitions',
+    'cli-patterns': 'Follow consistent CLI patterns and entry points',
+    'package-management': 'Handle package dependencies and setup consistently',
+    'code-style': 'Follow consistent naming and style conventions',
+}
+
+# One alternation per group, so each group is checked with a single regex
+# search. Groups are still tried in order, since the first matching group wins
+# regardless of where in the text its keyword appears
+_CLUSTER_PATTERNS = tuple(
+    (group_name, re.compile('|'.join(map(re.escape, keywords))))
+    for group_name, keywords in _CLUSTER_KEYWORD_GROUPS.items()
+)
+
+# Patterns for RepoAnalyzer._slugify, compiled once
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+
+# Values that PyYAML writes as plain scalars, so format_front_matter can emit
+# them directly. Anything else, including words YAML would read as booleans or
+# null, goes through the YAML dumper instead
+_FRONT_MATTER_PLAIN_RE = re.compile(r"[A-Za-z](?:[A-Za-z0-9 _.,()/'+-]*[A-Za-z0-9_.,()/'+-])?")
+_FRONT_MATTER_GLOB_RE = re.compile(r"[A-Za-z_/][A-Za-z0-9_.*/-]*")
+_FRONT_MATTER_QUOTED_GLOB_RE = re.compile(r"\*[A-Za-z0-9_.*/-]*")
+_YAML_KEYWORDS = frozenset({'yes', 'no', 'true', 'false', 'on', 'off', 'null'})
+
+@functools.lru_cache(maxsize=1024)
+def _slugify_text(text: str) -> str:
+    """Convert text to kebab-case slug, cached since audited rules often repeat descriptions."""
+    # Remove special characters and replace with hyphens
+    return _SLUG_DASH.sub('-', _SLUG_STRIP.sub('', text.lower())).strip('-')
+
+def format_front_matter(description: str, globs: List[str]) -> str:
+    """Format the YAML front matter of an .mdc rule file (without the --- markers).
+
+    Common descriptions and globs are written directly, producing exactly what
+    yaml.dump would; anything that might need quoting, escaping or line
+    wrapping falls back to the YAML dumper.
+    """
+    if (globs
+            and len(description) <= 66  # Longer lines may be wrapped by the dumper
+            and _FRONT_MATTER_PLAIN_RE.fullmatch(description)
+            and '  ' not in description
+            and description.lower() not in _YAML_KEYWORDS):
+        glob_lines = []
+        for glob in globs:
+            if len(glob) > 70:
+                break
+            if _FRONT_MATTER_QUOTED_GLOB_RE.fullmatch(glob):
+                # A leading * would start a YAML alias
+                glob_lines.append(f"- '{glob}'")
+            elif _FRONT_MATTER_GLOB_RE.fullmatch(glob) and glob.lower() not in _YAML_KEYWORDS:
+                glob_lines.append(f"- {glob}")
+            else:
+                break
+        else:
+            glob_lines_text = '\n'.join(glob_lines)
+            return f"description: {description}\nglobs:\n{glob_lines_text}\ntype: autoAttached"
+
+    front_matter = {
+        'description': description,
+        'globs': globs,
+        'type': 'autoAttached'
+    }
+    return yaml.dump(front_matter, Dumper=YamlSafeDumper, default_flow_style=False).strip()
+
+def _file_suffix(file_path: str) -> str:
+    """Return the same suffix as Path(file_path).suffix without building a Path."""
+    name = file_path[file_path.rfind(os.sep) + 1:]
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
+
+@functools.lru_cache(maxsize=512)
+def _guess_mime_type_for_ext(ext: str) -> Optional[str]:
+    """Guess the MIME type for a file extension.
+
+    Only the extension decides the result, so lookups are cached per
+    extension. The mimetypes database is loaded on first use.
+    """
+    mime_type, _ = mimetypes.guess_type(f"file{ext}")
+    return mime_type
+
+def _probe_file(file_path: Union[str, Path], file_size: Optional[int] = None, *,
+                allow_config: bool = False) -> Tuple[bool, str]:
+    """Classify a file as analyzable text or give the reason it isn't.
+
+    Module-level and free of analyzer state, so it can be mapped over any
+    executor.
+
+    Args:
+        file_path: Path to the file to check; scans pass plain strings so no
+            Path object is built per file
+        file_size: The file's size, if the caller has already stat'd it
+        allow_config: Don't skip config files, for ones the AI review picked
+
+    Returns:
+        Tuple[bool, str]: (is_analyzable, reason_if_not)
+    """
+    ext = _file_suffix(os.fspath(file_path)).lower()
+    if ext in CONFIG_EXTENSIONS and not allow_config:
+        return False, "config_file"
+
+    # Check extension first
+    if ext in BINARY_EXTENSIONS:
+        return False, "binary"
+    if ext in TEXT_EXTENSIONS:
+        # Still verify content for text extensions
+        pass
+    else:
+        # For unknown extensions, check MIME type
+        mime_type = _guess_mime_type_for_ext(ext)
+        if mime_type:
+            # If we have a mime type and it's not text-based, skip
+            if not (mime_type.startswith('text/') or
+                   mime_type in ['application/json', 'application/javascript',
+                               'application/xml', 'application/x-yaml',
+                               'application/x-typescript']):
+                return False, "binary"
+
+    # Reject oversized files from their size alone
+    if file_size is None:
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
+            return False, "unreadable"
+    if file_size > MAX_ANALYZABLE_BYTES:
+        return False, "too_large"
+
+    # Only a prefix is needed for the binary heuristics; the rest of the
+    # file is scanned in binary for the line count
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(PROBE_BYTES)
+            newlines = head.count(b'\n')
+            while newlines < MAX_ANALYZABLE_LINES:
+                chunk = f.read(65536)
+                if not chunk:
+                    break
+                newlines += chunk.count(b'\n')
+    except OSError:
+        return False, "unreadable"
+
+    if newlines >= MAX_ANALYZABLE_LINES:
+        return False, "too_large"
+
+    # Look for null bytes or a high concentration of non-ASCII
+    if b'\0' in head[:1024]:
+        return False, "binary"
+
+    try:
+        # The prefix may end in the middle of a multi-byte character
+        text = codecs.getincrementaldecoder('utf-8')().decode(head)
+    except UnicodeDecodeError:
+        # Readable with latin-1 but not utf-8 means it's probably binary
+        return False, "binary"
+
+    # Encoding to ASCII with errors='ignore' drops exactly the non-ASCII
+    # characters, so the length difference counts them at C speed
+    sample = text[:1024]
+    non_ascii = len(sample) - len(sample.encode('ascii', 'ignore'))
+    if non_ascii > 512:  # More than 50% non-ASCII in first 1KB
+        return False, "binary"
+
+    return True, ""
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_config(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML config file, cached until the file's mtime changes.
+
+    Callers must treat the result as read-only, since it is shared.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=YamlSafeLoader)
+
+@functools.lru_cache(maxsize=256)
+def parse_front_matter(front_matter: str) -> Any:
+    """Parse the YAML front matter of an .mdc rule file.
+
+    The CLI parses the same rules' front matter several times while
+    reviewing them, so results are cached. Callers must treat the result as
+    read-only, since it is shared.
+    """
+    return yaml.load(front_matter, Loader=YamlSafeLoader)
+
 @dataclass
 class CandidateRule:
     """Represents a candidate rule with enriched metadata."""
@@ -82,9 +589,11 @@ class RuleCluster:
         self.key = key
         self.rules: List[CandidateRule] = []
         self.meta: Optional[RuleClusterMeta] = None
+        self._canonical: Optional[CandidateRule] = None  # Set by RepoAnalyzer._choose_canonical
 
     def add_rule(self, rule: CandidateRule):
         self.rules.append(rule)
+        self._canonical = None
 
     def calculate_meta(self):
         """Calculate metadata for this cluster."""
@@ -157,6 +666,12 @@ class RepoAnalyzer:
         self.skipped_large = set()   # Files skipped because they're too large
         self.skipped_unreadable = set()  # Files that couldn't be read
         self.skipped_config = set()  # Files skipped because they're config files
+        self._skipped_by_reason = {
+            "binary": self.skipped_binary,
+            "too_large": self.skipped_large,
+            "unreadable": self.skipped_unreadable,
+            "config_file": self.skipped_config,
+        }
 
         # Check for .gitignore existence first
         self.gitignore_exists = (self.repo_path / '.gitignore').exists()
@@ -164,11 +679,17 @@ class RepoAnalyzer:
         # Load patterns
         self.ignore_spec = None
         self.default_ignore_spec = None
+        self.ignore_regex = None
+        self.default_ignore_regex = None
+        self._should_analyze_cache: Dict[str, bool] = {}
+        self._scan_cache: Optional[List[Tuple[str, List[str], List[str]]]] = None
+        self._probe_cache: Optional[Dict[str, list]] = None
+        self._file_sizes: Dict[str, int] = {}  # Sizes seen while probing, reused by create_batches
+        # Git history is parsed at most once per run
+        self._git_stats_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._importance_weights_cache: Optional[Dict[str, float]] = None
         self.load_gitignore()
 
-        # Initialize mimetypes
-        mimetypes.init()
-
     def _load_rate_limit_config(self) -> RateLimitConfig:
         """Load rate limiting configuration from config file or environment variables."""
         config = RateLimitConfig()
@@ -177,8 +698,7 @@ class RepoAnalyzer:
         config_path = Path(__file__).parent.parent / "config" / "rate_limiting.yaml"
         if config_path.exists():
             try:
-                with open(config_path) as f:
-                    yaml_config = yaml.safe_load(f)
+                yaml_config = _load_yaml_config(str(config_path), config_path.stat().st_mtime_ns)
 
                 # Load provider-specific settings
                 if 'rate_limits' in yaml_config:
@@ -215,6 +735,7 @@ class RepoAnalyzer:
 
                     config.exponential_multiplier = strategy_config.get('exponential_multiplier', 2.0)
                     config.jitter_ms = strategy_config.get('jitter_ms', 100)
+                    config.max_retries = strategy_config.get('max_retries', 3)
 
                 # Load batching settings
                 if 'batching' in yaml_config:
@@ -222,6 +743,7 @@ class RepoAnalyzer:
                     config.enable_batching = batching_config.get('enabled', True)
                     config.max_batch_size = batching_config.get('max_batch_size', 3)
                     config.batch_delay_ms = batching_config.get('delay_between_batches_ms', 2000)
+                    config.max_concurrency = batching_config.get('max_concurrency', 3)
 
                 # Load fallback settings
                 if 'fallback' in yaml_config:
@@ -266,130 +788,9 @@ class RepoAnalyzer:
         """Load .gitignore patterns."""
         gitignore_path = self.repo_path / '.gitignore'
 
-        # Load comprehensive default patterns for safety - be VERY aggressive
-        default_patterns = [
-            # ===== EXECUTABLE AND BINARY FILES =====
-            '*.exe', '*.dll', '*.so', '*.dylib', '*.bin', '*.com', '*.bat',  # Executables
-            '*.o', '*.obj', '*.a', '*.lib', '*.out', '*.app',  # Object/compiled files
-            '*.pyc', '*.pyo', '*.pyd', '__pycache__/',  # Python compiled
-            '*.class', '*.jar', '*.war', '*.ear',  # Java compiled
-            '*.beam', '*.plt',  # Erlang/Elixir compiled
-            '*.rlib', '*.rmeta',  # Rust compiled
-            '*.wasm',  # WebAssembly
-
-            # ===== ARCHIVES AND PACKAGES =====
-            '*.zip', '*.tar', '*.gz', '*.bz2', '*.xz', '*.7z', '*.rar', '*.arj',
-            '*.cab', '*.msi', '*.deb', '*.rpm', '*.dmg', '*.pkg', '*.snap',
-            '*.tgz', '*.tbz2', '*.txz',  # Compressed archives
-            '*.iso', '*.img', '*.vdi', '*.vmdk',  # Disk images
-
-            # ===== MEDIA FILES =====
-            # Images (all common formats)
-            '*.png', '*.jpg', '*.jpeg', '*.gif', '*.bmp', '*.ico', '*.icns',
-            '*.svg', '*.webp', '*.tiff', '*.tif', '*.psd', '*.ai', '*.eps',
-            '*.raw', '*.cr2', '*.nef', '*.dng', '*.heic', '*.avif',
-            # Audio
-            '*.mp3', '*.wav', '*.flac', '*.aac', '*.ogg', '*.wma', '*.m4a',
-            '*.opus', '*.aiff', '*.au', '*.mid', '*.midi',
-            # Video
-            '*.mp4', '*.avi', '*.mov', '*.wmv', '*.flv', '*.webm', '*.mkv',
-            '*.m4v', '*.3gp', '*.ogv', '*.asf', '*.rm', '*.swf',
-
-            # ===== FONTS =====
-            '*.ttf', '*.otf', '*.woff', '*.woff2', '*.eot', '*.fon', '*.fnt',
-
-            # ===== DOCUMENTS AND OFFICE FILES =====
-            '*.pdf', '*.doc', '*.docx', '*.xls', '*.xlsx', '*.ppt', '*.pptx',
-            '*.odt', '*.ods', '*.odp', '*.rtf', '*.pages', '*.numbers', '*.key',
-            '*.epub', '*.mobi', '*.azw', '*.azw3',
-
-            # ===== DATABASES =====
-            '*.db', '*.sqlite', '*.sqlite3', '*.mdb', '*.accdb', '*.dbf',
-            '*.frm', '*.myd', '*.myi', '*.ibd',
-
-            # ===== CERTIFICATES AND SECURITY =====
-            '*.pem', '*.key', '*.cert', '*.crt', '*.cer', '*.der', '*.p12',
-            '*.pfx', '*.jks', '*.keystore', '*.truststore',
-
-            # ===== ENVIRONMENT AND SECRETS =====
-            '.env', '.env.*', '.environment',  # Environment files
-            '*password*', '*secret*', '*credential*', '*api*key*',  # Potential secrets
-            '*.secrets', '.aws/', '.ssh/', '.gnupg/',  # Config directories
-
-            # ===== VERSION CONTROL =====
-            '.git/', '.svn/', '.hg/', '.bzr/', '.fossil-settings/',
-
-            # ===== BUILD OUTPUT AND DEPENDENCIES =====
-            # JavaScript/Node
-            'node_modules/', 'bower_components/', 'jspm_packages/',
-            'dist/', 'build/', 'out/', 'public/', 'static/',
-            '.next/', '.nuxt/', '.vuepress/', '.svelte-kit/',
-            'coverage/', '.nyc_output/',
-            # Python
-            '__pycache__/', '*.egg-info/', 'dist/', 'build/',
-            '.eggs/', '.pytest_cache/', '.coverage', '.tox/',
-            'venv/', 'env/', '.venv/', '.env/',
-            # Ruby
-            'vendor/', 'Gemfile.lock',
-            # Go
-            'vendor/', 'go.sum',
-            # Rust
-            'target/', 'Cargo.lock',
-            # Java/Maven/Gradle
-            'target/', '.gradle/', 'build/', 'gradle-wrapper.jar',
-            # .NET
-            'bin/', 'obj/', 'packages/', '*.user', '*.suo',
-            # C/C++
-            'Debug/', 'Release/', 'x64/', 'x86/', '.vs/',
-
-            # ===== IDE AND EDITOR FILES =====
-            '.idea/', '.vscode/', '.eclipse/', '.settings/',
-            '*.swp', '*.swo', '*.tmp', '*~', '.#*', '#*#',
-            '*.orig', '*.rej', '*.bak', '*.backup',
-            '.project', '.classpath', '.factorypath',
-            'Desktop.ini', 'ehthumbs.db',
-
-            # ===== OS FILES =====
-            '.DS_Store', '.DS_Store?', '._*', '.Spotlight-V100',
-            '.Trashes', 'Thumbs.db', 'thumbs.db', 'ehthumbs.db',
-
-            # ===== LOG AND TEMPORARY FILES =====
-            '*.log', '*.log.*', '*.logs', 'logs/',
-            '*.tmp', '*.temp', 'tmp/', 'temp/', 'cache/',
-            '.cache/', '.tmp/', '.temp/',
-
-            # ===== GENERATED/COMPILED FRONTEND ASSETS =====
-            '*.min.js', '*.min.css', '*.bundle.js', '*.bundle.css',
-            '*.chunk.js', '*.chunk.css', '*.map', '*.gz.js', '*.gz.css',
-
-            # ===== TOOL-SPECIFIC =====
-            '.cursor/rules.mdc', '.cursor/rules/',  # Our rules file
-            '.rulectl/*', '.rulectl/',  # Our analysis files
-            '.terraform/', 'terraform.tfstate', '*.tfstate',
-            '.vagrant/', 'Vagrantfile.local',
-            '.docker/', 'docker-compose.override.yml',
-
-            # ===== DOCUMENTATION THAT WE SHOULD SKIP =====
-            # Often these are not code patterns but just text
-            '*.txt', '*.rtf', 'README*', 'CHANGELOG*', 'LICENSE*',
-            'CONTRIBUTING*', 'AUTHORS*', 'CREDITS*', 'COPYING*',
-            'INSTALL*', 'NEWS*', 'TODO*', 'HISTORY*',
-
-            # ===== PACKAGE MANAGER LOCKS AND METADATA =====
-            'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml',
-            'Pipfile.lock', 'poetry.lock', 'Gemfile.lock',
-            'composer.lock', 'mix.lock', 'rebar.lock',
-
-            # ===== TEST FIXTURES AND MOCK DATA =====
-            'fixtures/', 'mocks/', 'test-data/', 'mock-data/',
-            '*.fixtures', '*.mocks', 'dummy.*', 'sample.*',
-
-            # ===== CONFIGURATION THAT'S NOT CODE =====
-            '.editorconfig', '.gitattributes', '.gitmodules',
-            'robots.txt', 'sitemap.xml', 'favicon.ico',
-            '.htaccess', '.nginx.conf', 'web.config',
-        ]
-        self.default_ignore_spec = pathspec.PathSpec.from_lines('gitwildmatch', default_patterns)
+        # Default patterns are always applied for safety
+        self.default_ignore_spec = DEFAULT_IGNORE_SPEC
+        self.default_ignore_regex = DEFAULT_IGNORE_REGEX
 
         # Add patterns from .gitignore if it exists
         if self.gitignore_exists:
@@ -404,6 +805,7 @@ class RepoAnalyzer:
                             continue
                         patterns.append(line)
                 self.ignore_spec = pathspec.PathSpec.from_lines('gitwildmatch', patterns)
+                self.ignore_regex = compile_ignore_regex(self.ignore_spec)
 
     def has_gitignore(self) -> bool:
         """Check if .gitignore exists in the repository."""
@@ -416,172 +818,26 @@ class RepoAnalyzer:
             file_path: Path to the file to check
 
         Returns:
-            Tuple[bool, str, Optional[str]]: (is_analyzable, reason_if_not, content_if_analyzable)
+            Tuple[bool, str, Optional[str]]: (is_analyzable, reason_if_not, None). Content
+            is never returned; use read_analyzable_content for files that pass.
         """
-        # EXTREMELY AGGRESSIVE CONFIG FILE SKIPPING - skip by default, AI can review later
-        config_extensions = {
-            '.json', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf',
-            '.xml', '.plist', '.properties', '.env',
-            '.gradle', '.maven', '.sbt', '.cmake', '.make', '.mk',
-            '.dockerfile', '.containerfile'
-        }
+        is_analyzable, reason = _probe_file(file_path)
+        return is_analyzable, reason, None
 
-        if file_path.suffix.lower() in config_extensions:
-            return False, "config_file", None
-
-        # Comprehensive binary extensions - VERY aggressive skipping
-        binary_extensions = {
-            # ===== IMAGES =====
-            '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.icns', '.tiff', '.tif',
-            '.webp', '.svg', '.psd', '.ai', '.eps', '.raw', '.cr2', '.nef', '.dng',
-            '.heic', '.avif', '.jfif', '.jp2', '.jpx', '.j2k', '.j2c',
-
-            # ===== AUDIO =====
-            '.mp3', '.wav', '.flac', '.aac', '.ogg', '.wma', '.m4a', '.opus',
-            '.aiff', '.au', '.mid', '.midi', '.ra', '.rm', '.3gp',
-
-            # ===== VIDEO =====
-            '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm', '.mkv', '.m4v',
-            '.3gp', '.ogv', '.asf', '.rm', '.swf', '.f4v', '.vob', '.ts',
-
-            # ===== DOCUMENTS =====
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.odt', '.ods', '.odp', '.rtf', '.pages', '.numbers', '.key',
-            '.epub', '.mobi', '.azw', '.azw3', '.djvu', '.cbr', '.cbz',
-
-            # ===== ARCHIVES =====
-            '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.rar', '.arj',
-            '.cab', '.msi', '.deb', '.rpm', '.dmg', '.pkg', '.snap',
-            '.tgz', '.tbz2', '.txz', '.lzma', '.ace', '.alz',
-
-            # ===== EXECUTABLES =====
-            '.exe', '.dll', '.so', '.dylib', '.app', '.deb', '.rpm', '.msi',
-            '.com', '.bat', '.cmd', '.scr', '.gadget', '.application',
-
-            # ===== COMPILED CODE =====
-            '.pyc', '.pyo', '.pyd', '.class', '.jar', '.war', '.ear',
-            '.beam', '.plt', '.rlib', '.rmeta', '.wasm',
-            '.o', '.obj', '.a', '.lib', '.out', '.pdb', '.ilk', '.exp',
-
-            # ===== DATABASES =====
-            '.db', '.sqlite', '.sqlite3', '.mdb', '.accdb', '.dbf',
-            '.frm', '.myd', '.myi', '.ibd', '.fdb', '.gdb',
-
-            # ===== FONTS =====
-            '.ttf', '.otf', '.woff', '.woff2', '.eot', '.fon', '.fnt',
-            '.pfb', '.pfm', '.afm', '.bdf', '.pcf', '.snf',
-
-            # ===== BINARY DATA =====
-            '.bin', '.dat', '.dump', '.img', '.iso', '.toast', '.vcd',
-            '.crx', '.xpi', '.oex', '.ipa', '.apk', '.appx',
-
-            # ===== CERTIFICATES =====
-            '.pem', '.key', '.cert', '.crt', '.cer', '.der', '.p12',
-            '.pfx', '.jks', '.keystore', '.truststore',
-
-            # ===== GENERATED/MINIFIED FILES =====
-            '.min.js', '.min.css', '.bundle.js', '.bundle.css',
-            '.chunk.js', '.chunk.css', '.map',
-
-            # ===== BACKUP/TEMP =====
-            '.bak', '.backup', '.tmp', '.temp', '.swp', '.swo',
-            '.orig', '.rej', '~',
-
-            # ===== DOCUMENTATION WE SKIP =====
-            '.txt', '.rtf',  # Plain text files - usually not code patterns
-        }
+    def read_analyzable_content(self, file_path: Path) -> Optional[str]:
+        """Read the full content of a file that passed is_analyzable_text_file.
 
-        # Known text extensions that we DO want to analyze
-        text_extensions = {
-            # ===== SOURCE CODE =====
-            '.py', '.js', '.ts', '.jsx', '.tsx', '.vue', '.svelte',  # Modern web
-            '.html', '.htm', '.css', '.scss', '.sass', '.less', '.styl',  # Web styling
-            '.c', '.cpp', '.cc', '.cxx', '.h', '.hpp', '.hxx',  # C/C++
-            '.java', '.kt', '.scala', '.groovy',  # JVM languages
-            '.rs', '.go', '.zig', '.nim', '.d',  # Systems languages
-            '.rb', '.php', '.perl', '.pl', '.lua', '.r',  # Scripting
-            '.swift', '.m', '.mm',  # Apple
-            '.cs', '.vb', '.fs',  # .NET
-            '.dart', '.elm', '.clj', '.cljs', '.ex', '.exs',  # Functional/modern
-            '.ml', '.mli', '.hs', '.lhs',  # Functional
-
-            # Config/build files skipped by default (AI can review them later)
-
-            # ===== SHELL/SCRIPTS =====
-            '.sh', '.bash', '.zsh', '.fish', '.csh', '.tcsh',
-            '.ps1', '.psm1', '.psd1',  # PowerShell
-            '.bat', '.cmd',  # Windows batch (though these can be binary)
-
-            # ===== DATABASE =====
-            '.sql', '.hql', '.cql',
-
-            # ===== MARKUP =====
-            '.md', '.rst', '.tex', '.adoc', '.org',  # Keep these for code docs
-            '.svg',  # SVG can contain code patterns
-
-            # ===== SPECIAL FILES =====
-            '.gitignore', '.gitattributes', '.editorconfig',
-            '.eslintrc', '.prettierrc', '.babelrc',
-        }
+        Args:
+            file_path: Path to the file to read
 
-        # Check extension first
-        ext = file_path.suffix.lower()
-        if ext in binary_extensions:
-            return False, "binary", None
-        if ext in text_extensions:
-            # Still verify content for text extensions
-            pass
-        else:
-            # For unknown extensions, check MIME type
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if mime_type:
-                # If we have a mime type and it's not text-based, skip
-                if not (mime_type.startswith('text/') or
-                       mime_type in ['application/json', 'application/javascript',
-                                   'application/xml', 'application/x-yaml',
-                                   'application/x-typescript']):
-                    return False, "binary", None
-
-        # Try to read and validate the file
+        Returns:
+            Optional[str]: The file content, or None if it isn't valid UTF-8 or can't be read
+        """
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                try:
-                    # Read first chunk to check encoding
-                    content = f.read()
-
-                    # Check line count
-                    line_count = content.count('\n') + 1
-                    if line_count > MAX_ANALYZABLE_LINES:
-                        return False, "too_large", None
-
-                    # Additional binary check: look for null bytes or high concentration of non-ASCII
-                    if '\0' in content[:1024]:  # Check first 1KB for null bytes
-                        return False, "binary", None
-
-                    non_ascii = sum(1 for c in content[:1024] if ord(c) > 127)
-                    if non_ascii > 512:  # More than 50% non-ASCII in first 1KB
-                        return False, "binary", None
-
-                    return True, "", content
-
-                except UnicodeDecodeError:
-                    # If UTF-8 fails, try with a more permissive encoding
-                    try:
-                        with open(file_path, 'r', encoding='latin-1') as f2:
-                            content = f2.read()
-
-                            # Check line count
-                            line_count = content.count('\n') + 1
-                            if line_count > MAX_ANALYZABLE_LINES:
-                                return False, "too_large", None
-
-                            # If we can read it with latin-1 but not utf-8, it's probably binary
-                            return False, "binary", None
-                    except:
-                        return False, "unreadable", None
-
-        except Exception as e:
-            return False, "unreadable", None
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
 
     def should_analyze_file(self, file_path: str) -> bool:
         """Check if a file should be analyzed based on .gitignore patterns."""
@@ -593,19 +849,164 @@ class RepoAnalyzer:
             except ValueError:
                 return False
 
-        # Convert to string for pathspec
-        rel_path = str(path)
+        # Cheap check for files under directories that are always ignored
+        if not DEFAULT_IGNORED_DIRS.isdisjoint(path.parts[:-1]):
+            return False
+
+        return self._is_path_included(str(path))
+
+    def _is_path_included(self, rel_path: str) -> bool:
+        """Check a relative path against the ignore patterns, remembering the verdict."""
+        # Every scan visits the same paths, so cache the result
+        result = self._should_analyze_cache.get(rel_path)
+        if result is None:
+            result = self._match_ignore_specs(rel_path)
+            self._should_analyze_cache[rel_path] = result
+        return result
+
+    def _match_ignore_specs(self, rel_path: str) -> bool:
+        """Run the ignore pattern matchers for a path relative to the repository."""
+        # Same normalization PathSpec.match_file applies
+        norm_path = normalize_file(rel_path)
 
         # Always check against default patterns for safety
-        if self.default_ignore_spec.match_file(rel_path):
+        if self.default_ignore_regex.match(norm_path):
             return False
 
         # Only check against .gitignore patterns if they exist
-        if self.gitignore_exists and self.ignore_spec.match_file(rel_path):
+        if self.gitignore_exists and self.ignore_regex.match(norm_path):
             return False
 
         return True
 
+    def _record_skip(self, file_path: str, reason: str) -> None:
+        """Add a file to the skipped set matching the reason it isn't analyzable."""
+        skipped = self._skipped_by_reason.get(reason)
+        if skipped is not None:
+            skipped.add(file_path)
+
+    def _probe_files(self, file_paths: List[str]) -> List[Tuple[bool, str]]:
+        """Run is_analyzable_text_file over many files concurrently.
+
+        Probing is dominated by small file reads, so a thread pool keeps many
+        of them in flight at once. The probe itself runs mostly in C (byte
+        counting and a 4 KB decode), so threads are not held back by the GIL.
+
+        Results are cached in ~/.cache/rulectl/probe keyed by each file's
+        mtime and size, so unchanged files are not read again on later runs.
+
+        Args:
+            file_paths: Paths relative to the repository
+
+        Returns:
+            List of (is_analyzable, reason_if_not), in the same order as file_paths
+        """
+        cache = self._load_probe_cache()
+        fresh: Dict[str, list] = {}
+        repo_prefix = os.path.join(str(self.repo_path), '')
+
+        def probe(file_path: str) -> Tuple[bool, str]:
+            full_path = repo_prefix + file_path
+            try:
+                st = os.stat(full_path)
+            except OSError:
+                # Let the probe decide how to report it, but don't cache it
+                return _probe_file(full_path)
+
+            self._file_sizes[file_path] = st.st_size
+            cached = cache.get(file_path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2], cached[3]
+
+            is_analyzable, reason = _probe_file(full_path, st.st_size)
+            fresh[file_path] = [st.st_mtime_ns, st.st_size, is_analyzable, reason]
+            return is_analyzable, reason
+
+        with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+            results = list(executor.map(probe, file_paths))
+
+        # Keep only this scan's files, so deleted and renamed files don't pile up
+        cache.update(fresh)
+        live = {file_path: cache[file_path] for file_path in file_paths if file_path in cache}
+        if fresh or len(live) != len(cache):
+            self._probe_cache = live
+            self._save_probe_cache()
+        return results
+
+    def _probe_cache_file(self) -> Path:
+        """Get the probe cache file for this repository."""
+        cache_key = hashlib.blake2b(str(self.repo_path).encode()).hexdigest()[:16]
+        return PROBE_CACHE_DIR / f"{cache_key}.json"
+
+    def _load_probe_cache(self) -> Dict[str, list]:
+        """Load the persisted probe results, or start empty if they're missing or stale."""
+        if self._probe_cache is None:
+            self._probe_cache = {}
+            try:
+                with open(self._probe_cache_file(), encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("signature") == PROBE_CACHE_SIGNATURE:
+                    self._probe_cache = data["files"]
+            except (OSError, ValueError, KeyError, AttributeError):
+                pass
+        return self._probe_cache
+
+    def _save_probe_cache(self) -> None:
+        """Write the probe results back to disk; caching is best effort only."""
+        cache_file = self._probe_cache_file()
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"signature": PROBE_CACHE_SIGNATURE, "files": self._probe_cache}, f,
+                          separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not save probe cache: {e}")
+
+    def _scan_tree(self) -> List[Tuple[str, List[str], List[str]]]:
+        """Walk the repository once, skipping ignored directories entirely.
+
+        The result is cached, so counting, structure analysis and file listing
+        all share a single traversal.
+
+        Returns:
+            List of (directory relative to repo, subdirectory names, names of
+            files that pass the ignore patterns)
+        """
+        if self._scan_cache is not None:
+            return self._scan_cache
+
+        scan = []
+        # Relative paths are sliced off os.walk's root strings rather than
+        # computed with Path.relative_to, keeping the loop free of Path objects
+        repo_prefix = os.path.join(str(self.repo_path), '')
+        for root, dirs, files in os.walk(self.repo_path):
+            rel_root = root[len(repo_prefix):]
+            prefix = rel_root + os.sep if rel_root else ''
+            subdirs = list(dirs)
+
+            # Prune ignored directories in place so os.walk never descends into them
+            dirs[:] = [
+                d for d in dirs
+                if d not in DEFAULT_IGNORED_DIRS and self._match_ignore_specs(f"{prefix}{d}/")
+            ]
+
+            # Files under always-ignored directories were pruned above
+            filtered_files = [f for f in files if self._is_path_included(prefix + f)]
+            scan.append((rel_root or '.', subdirs, filtered_files))
+
+        self._scan_cache = scan
+        return scan
+
+    def _candidate_files(self) -> List[str]:
+        """List the files that pass the ignore patterns, relative to the repository."""
+        candidates = []
+        for rel_path, _, files in self._scan_tree():
+            prefix = '' if rel_path == '.' else rel_path + os.sep
+            candidates.extend(prefix + file for file in files)
+        return candidates
+
     def count_analyzable_files(self) -> Tuple[int, Dict[str, int]]:
         """Count files and categorize them by status.
 
@@ -614,39 +1015,20 @@ class RepoAnalyzer:
             - Total count of files to analyze
             - Dictionary of extension counts for files to analyze
         """
-        total_count = 0
-        extension_counts = {}
-
-        for root, _, files in os.walk(self.repo_path):
-            rel_path = Path(root).relative_to(self.repo_path)
-            for file in files:
-                file_path = str(rel_path / file)
-                full_path = self.repo_path / file_path
-
-                # First check gitignore patterns
-                if not self.should_analyze_file(file_path):
-                    continue
-
-                # Then check if it's a text file
-                is_analyzable, reason, _ = self.is_analyzable_text_file(full_path)
-                if not is_analyzable:
-                    if reason == "binary":
-                        self.skipped_binary.add(file_path)
-                    elif reason == "too_large":
-                        self.skipped_large.add(file_path)
-                    elif reason == "unreadable":
-                        self.skipped_unreadable.add(file_path)
-                    elif reason == "config_file":
-                        self.skipped_config.add(file_path)
-                    continue
-
-                # If we get here, the file is analyzable
-                total_count += 1
-                ext = Path(file).suffix
-                if ext:  # Only count if extension exists
-                    extension_counts[ext] = extension_counts.get(ext, 0) + 1
-
-        return total_count, extension_counts
+        analyzable_files = []
+
+        candidates = self._candidate_files()
+        for file_path, (is_analyzable, reason) in zip(candidates, self._probe_files(candidates)):
+            if not is_analyzable:
+                self._record_skip(file_path, reason)
+                continue
+
+            # If we get here, the file is analyzable
+            analyzable_files.append(file_path)
+
+        # Only count files that have an extension
+        extension_counts = Counter(ext for ext in map(_file_suffix, analyzable_files) if ext)
+        return len(analyzable_files), dict(extension_counts)
 
     def analyze_structure(self) -> Dict[str, Any]:
         """Analyze the repository structure and create a map."""
@@ -657,23 +1039,18 @@ class RepoAnalyzer:
             "dependencies": {}
         }
 
-        # Walk the repository
-        for root, dirs, files in os.walk(self.repo_path):
-            rel_path = Path(root).relative_to(self.repo_path)
-
-            # Filter files based on gitignore
-            filtered_files = [f for f in files if self.should_analyze_file(str(rel_path / f))]
-
+        # Reuse the walk made when counting files
+        file_types = Counter()
+        for rel_path, subdirs, filtered_files in self._scan_tree():
             if filtered_files:  # Only add directory if it has files to analyze
-                structure["directories"][str(rel_path)] = {
+                structure["directories"][rel_path] = {
                     "files": filtered_files,
-                    "subdirs": dirs
+                    "subdirs": subdirs
                 }
 
                 # Analyze file types
-                for file in filtered_files:
-                    ext = Path(file).suffix
-                    structure["file_types"][ext] = structure["file_types"].get(ext, 0) + 1
+                file_types.update(map(_file_suffix, filtered_files))
+        structure["file_types"] = dict(file_types)
 
         self.findings["repository"]["structure"] = structure
         return structure
@@ -690,21 +1067,32 @@ class RepoAnalyzer:
         current_batch_size = 0
         max_batch_content = 500000  # 500KB total content per batch
 
+        # Helper to look up a file's size, reusing the one recorded while probing
+        def get_file_size(file_path: str) -> Optional[int]:
+            file_size = self._file_sizes.get(file_path)
+            if file_size is None:
+                try:
+                    file_size = (self.repo_path / file_path).stat().st_size
+                except OSError:
+                    return None
+            return file_size
+
         # Helper to check if adding a file would exceed limits
-        def would_exceed_limits(file_path: Path, current_size: int) -> Tuple[bool, int]:
-            try:
-                file_size = file_path.stat().st_size
-                return (current_size + file_size > max_batch_content), file_size
-            except OSError:
+        def would_exceed_limits(file_size: Optional[int], current_size: int) -> Tuple[bool, int]:
+            if file_size is None:
                 return True, 0
+            return (current_size + file_size > max_batch_content), file_size
 
         # Group files by directory for now
-        for dir_info in self.findings["repository"]["structure"]["directories"].values():
+        for dir_path, dir_info in self.findings["repository"]["structure"]["directories"].items():
+            # Directory entries list bare file names; sizes and batches use
+            # paths relative to the repository
+            prefix = '' if dir_path == '.' else dir_path + os.sep
             for file in dir_info["files"]:
-                file_path = self.repo_path / file
+                file_path = prefix + file
 
                 # Check if adding this file would exceed batch limits
-                would_exceed, file_size = would_exceed_limits(file_path, current_batch_size)
+                would_exceed, file_size = would_exceed_limits(get_file_size(file_path), current_batch_size)
 
                 # If this file would exceed limits, start a new batch
                 if would_exceed or len(current_batch) >= self.max_batch_size:
@@ -713,7 +1101,7 @@ class RepoAnalyzer:
                         current_batch = []
                         current_batch_size = 0
 
-                current_batch.append(file)
+                current_batch.append(file_path)
                 current_batch_size += file_size
 
                 # If this single file filled a batch, add it
@@ -736,57 +1124,42 @@ class RepoAnalyzer:
         """
         analyzable_files = []
 
-        for root, _, files in os.walk(self.repo_path):
-            rel_path = Path(root).relative_to(self.repo_path)
-            for file in files:
-                file_path = str(rel_path / file)
-                full_path = self.repo_path / file_path
-
-                # First check gitignore patterns
-                if not self.should_analyze_file(file_path):
-                    continue
-
-                # Then check if it's a text file
-                is_analyzable, reason, _ = self.is_analyzable_text_file(full_path)
-                if not is_analyzable:
-                    if reason == "binary":
-                        self.skipped_binary.add(file_path)
-                    elif reason == "too_large":
-                        self.skipped_large.add(file_path)
-                    elif reason == "unreadable":
-                        self.skipped_unreadable.add(file_path)
-                    elif reason == "config_file":
-                        self.skipped_config.add(file_path)
-                    continue
-
-                analyzable_files.append(file_path)
+        candidates = self._candidate_files()
+        for file_path, (is_analyzable, reason) in zip(candidates, self._probe_files(candidates)):
+            if not is_analyzable:
+                self._record_skip(file_path, reason)
+                continue
+
+            analyzable_files.append(file_path)
 
         return analyzable_files
 
-    async def analyze_file(self, file_path: str) -> Optional[StaticAnalysisResult]:
+    async def analyze_file(self, file_path: str, *, already_validated: bool = False) -> Optional[StaticAnalysisResult]:
         """Analyze a single file using LLM through BAML.
 
         Args:
             file_path: Path to the file to analyze (relative to repo)
+            already_validated: Skip the ignore pattern and text file checks,
+                for files that came from get_all_analyzable_files()
 
         Returns:
             StaticAnalysisResult if analysis succeeds, None if file should be skipped
         """
         full_path = self.repo_path / file_path
-        if not full_path.exists() or not self.should_analyze_file(str(file_path)):
-            return None
+        if already_validated:
+            is_analyzable, reason = True, ""
+        else:
+            if not full_path.exists() or not self.should_analyze_file(str(file_path)):
+                return None
+            is_analyzable, reason, _ = self.is_analyzable_text_file(full_path)
 
-        is_analyzable, reason, content = self.is_analyzable_text_file(full_path)
+        content = self.read_analyzable_content(full_path) if is_analyzable else None
+        if is_analyzable and content is None:
+            # Invalid UTF-8 past the probed prefix
+            is_analyzable, reason = False, "binary"
 
         if not is_analyzable:
-            if reason == "binary":
-                self.skipped_binary.add(file_path)
-            elif reason == "too_large":
-                self.skipped_large.add(file_path)
-            elif reason == "unreadable":
-                self.skipped_unreadable.add(file_path)
-            elif reason == "config_file":
-                self.skipped_config.add(file_path)
+            self._record_skip(file_path, reason)
             return None
 
         # Create FileInfo object
@@ -796,8 +1169,9 @@ class RepoAnalyzer:
             extension=full_path.suffix
         )
 
-        # Analyze individual file with rate limiting and token tracking
-        baml_options = self.token_tracker.get_baml_options() if self.token_tracker else {}
+        # Analyze individual file with rate limiting and token tracking. Analyses
+        # overlap, so each call gets its own collector to read its usage from
+        baml_options = self.token_tracker.get_baml_options(per_call=True) if self.token_tracker else {}
 
         try:
             if self.rate_limiter:
@@ -813,34 +1187,42 @@ class RepoAnalyzer:
 
         except Exception as e:
             # Handle rate limit errors specifically
-            error_str = str(e).lower()
-            if "rate_limit" in error_str or "429" in error_str or "too many requests" in error_str:
-                logger.warning(f"Rate limit hit while analyzing {file_path}: {e}")
+            if is_rate_limit_error and is_rate_limit_error(e):
+                logger.warning("Rate limit hit while analyzing %s: %s", file_path, e)
 
-                # If we have a rate limiter, wait and retry
+                # If we have a rate limiter, back off and retry
                 if self.rate_limiter:
-                    logger.info("Waiting for rate limit to reset...")
-                    await asyncio.sleep(60)  # Wait 1 minute
-                    try:
-                        analysis = await self.rate_limiter.execute_with_rate_limiting(
-                            self._analyze_file_internal,
-                            file_info,
-                            baml_options
-                        )
-                    except Exception as retry_error:
-                        logger.error(f"Retry failed for {file_path}: {retry_error}")
+                    analysis = None
+                    error = e
+                    for attempt in range(self.rate_limiter.config.max_retries):
+                        delay = self.rate_limiter.get_retry_delay(error, attempt)
+                        logger.info("Waiting %.2f seconds for rate limit to reset...", delay)
+                        await asyncio.sleep(delay)
+                        try:
+                            analysis = await self.rate_limiter.execute_with_rate_limiting(
+                                self._analyze_file_internal,
+                                file_info,
+                                baml_options
+                            )
+                            break
+                        except Exception as retry_error:
+                            error = retry_error
+                            if not is_rate_limit_error(retry_error):
+                                break
+                    if analysis is None:
+                        logger.error("Retry failed for %s: %s", file_path, error)
                         return None
                 else:
-                    logger.error(f"Rate limit error and no rate limiter available for {file_path}")
+                    logger.error("Rate limit error and no rate limiter available for %s", file_path)
                     return None
             else:
                 # Other types of errors
-                logger.error(f"Error analyzing {file_path}: {e}")
+                logger.error("Error analyzing %s: %s", file_path, e)
                 return None
 
         # Track token usage from this call
         if self.token_tracker:
-            self.token_tracker.track_call_from_collector('file_analysis', 'claude-sonnet-4-20250514')
+            self.token_tracker.track_call_from_collector('file_analysis', 'claude-sonnet-4-20250514', baml_options)
 
         # Store the serialized version in findings
         self.findings["batches"].append(analysis.model_dump())
@@ -851,6 +1233,79 @@ class RepoAnalyzer:
         """Internal method to analyze a file - used by rate limiter."""
         return await self.client.AnalyzeFileForConventions(file=file_info, baml_options=baml_options)
 
+    async def analyze_files_concurrently(
+        self, file_paths: List[str], *, already_validated: bool = False
+    ) -> AsyncIterator[Tuple[int, str, Optional[StaticAnalysisResult]]]:
+        """Analyze files with several requests in flight, yielding as each finishes.
+
+        The number of concurrent analyses follows the rate limiter's adaptive
+        concurrency window, which widens while requests succeed and narrows on
+        rate limit errors. Without a rate limiter files are analyzed one at a time.
+
+        Args:
+            file_paths: List of file paths to analyze (relative to repo)
+            already_validated: Passed on to analyze_file()
+
+        Yields:
+            (index into file_paths, file path, result of analyze_file) in completion order
+
+        Raises:
+            Exception: The first error raised by analyze_file; the analyses
+                still in flight are cancelled
+        """
+        outcomes = self._analyze_files_windowed(file_paths, already_validated=already_validated)
+        async with aclosing(outcomes):
+            async for index, file_path, result, error in outcomes:
+                if error is not None:
+                    raise error
+                yield index, file_path, result
+
+    async def _analyze_files_windowed(
+        self, file_paths: List[str], *, already_validated: bool = False
+    ) -> AsyncIterator[Tuple[int, str, Optional[StaticAnalysisResult], Optional[Exception]]]:
+        """Run analyze_file over files, keeping the rate limiter's concurrency window full.
+
+        Errors are yielded instead of raised, so callers decide whether one
+        failed file stops the rest.
+
+        Args:
+            file_paths: List of file paths to analyze (relative to repo)
+            already_validated: Passed on to analyze_file()
+
+        Yields:
+            (index into file_paths, file path, result, error) in completion order
+        """
+        async def analyze_one(file_path: str):
+            try:
+                return await self.analyze_file(file_path, already_validated=already_validated), None
+            except Exception as e:
+                return None, e
+
+        pending = iter(enumerate(file_paths))
+        in_flight: Dict[asyncio.Task, Tuple[int, str]] = {}
+        try:
+            while True:
+                limit = self.rate_limiter.concurrency if self.rate_limiter else 1
+                while len(in_flight) < limit:
+                    next_file = next(pending, None)
+                    if next_file is None:
+                        break
+                    in_flight[asyncio.ensure_future(analyze_one(next_file[1]))] = next_file
+                if not in_flight:
+                    return
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, file_path = in_flight.pop(task)
+                    yield (index, file_path, *task.result())
+        finally:
+            # Don't leave analyses running if the caller stops early, and wait
+            # for them to finish cancelling so their outcomes are collected
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
     # Keep the batch method for backward compatibility, but mark it as deprecated
     async def analyze_batch(self, batch: List[str]) -> List[StaticAnalysisResult]:
         """Analyze a batch of files using LLM through BAML.
@@ -865,13 +1320,30 @@ class RepoAnalyzer:
         """
         results = []
 
-        for file_path in batch:
-            result = await self.analyze_file(file_path)
+        for result, error in await self._analyze_files_bounded(batch):
+            if error is not None:
+                raise error
             if result:
                 results.append(result)
 
         return results
 
+    async def _analyze_files_bounded(
+        self, file_paths: List[str]
+    ) -> List[Tuple[Optional[StaticAnalysisResult], Optional[Exception]]]:
+        """Analyze files in parallel within the rate limiter's concurrency window.
+
+        Args:
+            file_paths: List of file paths to analyze
+
+        Returns:
+            (result, error) for each file, in the same order as file_paths
+        """
+        outcomes = [(None, None)] * len(file_paths)
+        async for index, _, result, error in self._analyze_files_windowed(file_paths):
+            outcomes[index] = (result, error)
+        return outcomes
+
     async def analyze_files_with_rate_limiting(self, file_paths: List[str]) -> List[StaticAnalysisResult]:
         """Analyze multiple files with intelligent rate limiting and batching.
 
@@ -901,27 +1373,27 @@ class RepoAnalyzer:
             batch_size = self.rate_limiter.config.max_batch_size
             for i in range(0, len(file_paths), batch_size):
                 batch = file_paths[i:i + batch_size]
-                logger.info(f"Processing batch {i//batch_size + 1}/{(len(file_paths) + batch_size - 1)//batch_size} ({len(batch)} files)")
+                logger.info("Processing batch %d/%d (%d files)",
+                            i//batch_size + 1, (len(file_paths) + batch_size - 1)//batch_size, len(batch))
 
-                # Process this batch
+                # Process this batch, analyzing its files in parallel
                 batch_results = []
-                for file_path in batch:
-                    try:
-                        result = await self.analyze_file(file_path)
-                        if result:
-                            batch_results.append(result)
-                        else:
-                            failed_files.append((file_path, "Analysis returned None"))
-                    except Exception as e:
-                        logger.error(f"Failed to analyze {file_path}: {e}")
-                        failed_files.append((file_path, str(e)))
+                outcomes = await self._analyze_files_bounded(batch)
+                for file_path, (result, error) in zip(batch, outcomes):
+                    if error is not None:
+                        logger.error("Failed to analyze %s: %s", file_path, error)
+                        failed_files.append((file_path, str(error)))
+                    elif result:
+                        batch_results.append(result)
+                    else:
+                        failed_files.append((file_path, "Analysis returned None"))
 
                 results.extend(batch_results)
 
                 # Add delay between batches if not the last batch
                 if i + batch_size < len(file_paths):
                     delay = self.rate_limiter.config.batch_delay_ms / 1000.0
-                    logger.info(f"Batch completed. Waiting {delay:.2f} seconds before next batch...")
+                    logger.info("Batch completed. Waiting %.2f seconds before next batch...", delay)
                     await asyncio.sleep(delay)
         else:
             # Fall back to individual file processing
@@ -934,14 +1406,14 @@ class RepoAnalyzer:
                     else:
                         failed_files.append((file_path, "Analysis returned None"))
                 except Exception as e:
-                    logger.error(f"Failed to analyze {file_path}: {e}")
+                    logger.error("Failed to analyze %s: %s", file_path, e)
                     failed_files.append((file_path, str(e)))
 
         # Log summary
         if failed_files:
             logger.warning(f"Failed to analyze {len(failed_files)} files:")
             for file_path, reason in failed_files[:5]:  # Show first 5 failures
-                logger.warning(f"  - {file_path}: {reason}")
+                logger.warning("  - %s: %s", file_path, reason)
             if len(failed_files) > 5:
                 logger.warning(f"  ... and {len(failed_files) - 5} more failures")
 
@@ -962,22 +1434,30 @@ class RepoAnalyzer:
         if not GitAnalyzer or not get_file_importance_weights:
             return {}
 
-        try:
-            all_weights = get_file_importance_weights(str(self.repo_path))
-
-            # Filter to only analyzed files if provided
-            if analyzed_files is not None:
-                analyzed_set = set(analyzed_files)
-                filtered_weights = {
-                    path: weight for path, weight in all_weights.items()
-                    if path in analyzed_set
+        if self._importance_weights_cache is None:
+            try:
+                self._importance_weights_cache = get_file_importance_weights(str(self.repo_path))
+            except GitError:
+                # If git analysis fails, use empty weights (all files equal importance)
+                self._importance_weights_cache = {}
+        all_weights = self._importance_weights_cache
+
+        # Filter to only analyzed files if provided, looping over whichever
+        # side is smaller (git history can be far larger than the analysis)
+        if analyzed_files is not None:
+            analyzed_set = set(analyzed_files)
+            if len(analyzed_set) < len(all_weights):
+                return {
+                    path: all_weights[path] for path in analyzed_files
+                    if path in all_weights
                 }
-                return filtered_weights
+            filtered_weights = {
+                path: weight for path, weight in all_weights.items()
+                if path in analyzed_set
+            }
+            return filtered_weights
 
-            return all_weights
-        except GitError:
-            # If git analysis fails, return empty weights (all files equal importance)
-            return {}
+        return dict(all_weights)
 
     def apply_importance_weights(self, analyses: List[StaticAnalysisResult],
                                importance_weights: Dict[str, float]) -> List[Tuple[StaticAnalysisResult, float]]:
@@ -1001,10 +1481,7 @@ class RepoAnalyzer:
 
     def _slugify(self, text: str) -> str:
         """Convert text to kebab-case slug."""
-        # Remove special characters and replace with hyphens
-        slug = re.sub(r'[^\w\s-]', '', text.lower())
-        slug = re.sub(r'[-\s]+', '-', slug)
-        return slug.strip('-')
+        return _slugify_text(text)
 
     def _convert_to_candidate_rules(self, analyses: List[StaticAnalysisResult],
                                   git_stats: Dict[str, Dict[str, Any]]) -> List[CandidateRule]:
@@ -1016,8 +1493,8 @@ class RepoAnalyzer:
             edit_count = file_stats.get('total', 0)
             last_edit = file_stats.get('last_edit')
 
-            for rule in analysis.rules:
-                candidate_rule = CandidateRule(
+            candidate_rules.extend([
+                CandidateRule(
                     slug=rule.slug,
                     description=rule.description,
                     scope_glob=rule.scope_glob,
@@ -1027,7 +1504,8 @@ class RepoAnalyzer:
                     edit_count=edit_count,
                     last_edit=last_edit
                 )
-                candidate_rules.append(candidate_rule)
+                for rule in analysis.rules
+            ])
 
         return candidate_rules
 
@@ -1035,31 +1513,13 @@ class RepoAnalyzer:
         """Cluster rules by slug/description similarity using semantic keywords."""
         clusters = {}
 
-        # Define semantic keyword groups for clustering
-        keyword_groups = {
-            'pathlib-usage': ['pathlib', 'path', 'os.path', 'file-path', 'directory'],
-            'git-operations': ['git', 'repository', 'branch', 'commit', 'repo'],
-            'error-handling': ['error', 'exception', 'handle', 'catch', 'try-except'],
-            'api-management': ['api', 'key', 'credential', 'authentication', 'token'],
-            'baml-integration': ['baml', 'client', 'gpt', 'llm', 'generate'],
-            'build-process': ['build', 'compile', 'executable', 'platform', 'pyinstaller'],
-            'testing-patterns': ['test', 'mock', 'fixture', 'temporary', 'temp'],
-            'configuration': ['config', 'setup', 'env', 'environment', 'dotenv'],
-            'file-operations': ['file', 'read', 'write', 'analyze', 'text', 'binary'],
-            'validation': ['validate', 'check', 'verify', 'ensure', 'confirm'],
-            'data-structures': ['dataclass', 'class', 'structure', 'type', 'schema'],
-            'cli-patterns': ['cli', 'command', 'entry-point', 'main', 'console'],
-            'package-management': ['package', 'dependency', 'install', 'requirements', 'setup'],
-            'code-style': ['naming', 'convention', 'format', 'style', 'pattern'],
-        }
-
         def get_cluster_key(rule: CandidateRule) -> str:
             """Determine the best cluster key for a rule based on semantic similarity."""
             text = f"{rule.slug} {rule.description}".lower()
 
             # Check against keyword groups
-            for group_name, keywords in keyword_groups.items():
-                if any(keyword in text for keyword in keywords):
+            for group_name, pattern in _CLUSTER_PATTERNS:
+                if pattern.search(text):
                     return group_name
 
             # Fallback: try to extract common patterns from slug
@@ -1087,86 +1547,67 @@ class RepoAnalyzer:
         return clusters
 
     def _choose_canonical(self, cluster: RuleCluster) -> CandidateRule:
-        """Choose the canonical rule variant for a cluster."""
+        """Choose the canonical rule variant for a cluster.
+
+        The result is cached on the cluster until another rule is added, so
+        ranking, synthesis and fallback content all share one merge.
+        """
+        if cluster._canonical is not None:
+            return cluster._canonical
         if not cluster.rules:
             raise ValueError("Empty cluster")
 
         def avg_line(rule: CandidateRule) -> float:
             return sum(rule.evidence_lines) / len(rule.evidence_lines) if rule.evidence_lines else 0
 
-        # Sort by: most bullets first, then lowest average line number
-        sorted_rules = sorted(cluster.rules,
-                            key=lambda r: (-len(r.bullets), avg_line(r)))
-
-        canonical = sorted_rules[0]
+        # Pick the rule with the most bullets, then the lowest average line
+        # number; min() keeps the first of equal rules, like a stable sort would
+        canonical = min(cluster.rules, key=lambda r: (-len(r.bullets), avg_line(r)))
 
         # If we have multiple rules in this cluster, create a merged description
         if len(cluster.rules) > 1:
-            # Create a more general description for the cluster
-            cluster_descriptions = {
-                'pathlib-usage': 'Use pathlib for file and path operations instead of os.path',
-                'git-operations': 'Follow consistent patterns for git repository operations',
-                'error-handling': 'Implement proper error handling and exception management',
-                'api-management': 'Manage API keys and credentials securely',
-                'baml-integration': 'Use BAML client patterns for LLM integration',
-                'build-process': 'Follow consistent build and compilation patterns',
-                'testing-patterns': 'Use consistent testing patterns and utilities',
-                'configuration': 'Handle configuration and environment variables properly',
-                'file-operations': 'Follow consistent patterns for file analysis and processing',
-                'validation': 'Implement proper validation and verification patterns',
-                'data-structures': 'Use appropriate data structures and class definitions',
-                'cli-patterns': 'Follow consistent CLI patterns and entry points',
-                'package-management': 'Handle package dependencies and setup consistently',
-                'code-style': 'Follow consistent naming and style conventions',
-            }
-
-            if cluster.key in cluster_descriptions:
-                canonical.description = cluster_descriptions[cluster.key]
+            # Use the general description for the cluster when there is one
+            if cluster.key in _CLUSTER_DESCRIPTIONS:
+                canonical.description = _CLUSTER_DESCRIPTIONS[cluster.key]
             else:
                 # Fallback: use the most descriptive rule's description
                 canonical.description = max(cluster.rules, key=lambda r: len(r.description)).description
 
         # Merge bullets from all rules in cluster, dedupe and limit to 5
-        all_bullets = []
-        seen_bullets = set()
-
-        for rule in cluster.rules:
-            for bullet in rule.bullets:
-                # Trim to 120 chars and dedupe
-                trimmed = bullet[:120].strip()
-                if trimmed and trimmed not in seen_bullets:
-                    all_bullets.append(trimmed)
-                    seen_bullets.add(trimmed)
-                    if len(all_bullets) >= 5:
-                        break
-            if len(all_bullets) >= 5:
-                break
-
-        # Create canonical rule with merged bullets
-        canonical.bullets = all_bullets[:5]  # Ensure max 5 bullets
-
-        # Handle scope glob - find the most common scope pattern
-        glob_counts = {}
-        for rule in cluster.rules:
-            glob_counts[rule.scope_glob] = glob_counts.get(rule.scope_glob, 0) + 1
-
-        # Use the most common scope glob, or create a general one
-        if glob_counts:
-            most_common_glob = max(glob_counts.items(), key=lambda x: x[1])[0]
-            canonical.scope_glob = most_common_glob
-        else:
-            canonical.scope_glob = "**/*"
+        def unique_bullets():
+            seen_bullets = set()
+            for rule in cluster.rules:
+                for bullet in rule.bullets:
+                    # Trim to 120 chars and dedupe
+                    trimmed = bullet[:120].strip()
+                    if trimmed and trimmed not in seen_bullets:
+                        seen_bullets.add(trimmed)
+                        yield trimmed
+
+        # Create canonical rule with merged bullets; islice stops the
+        # generator as soon as the fifth bullet is found
+        canonical.bullets = list(islice(unique_bullets(), 5))
+
+        # Handle scope glob - use the most common scope pattern, or a general one
+        glob_counts = Counter(rule.scope_glob for rule in cluster.rules)
+        canonical.scope_glob = glob_counts.most_common(1)[0][0] if glob_counts else "**/*"
 
         # Create a better slug for merged rules
         if len(cluster.rules) > 1:
             canonical.slug = cluster.key  # Use the cluster key as the slug
 
+        cluster._canonical = canonical
         return canonical
 
     def _get_git_file_stats(self) -> Dict[str, Dict[str, Any]]:
-        """Get git statistics for files including edit counts and last edit dates."""
+        """Get git statistics for files including edit counts and last edit dates.
+
+        The result is cached on the analyzer; callers must treat it as read-only.
+        """
         if not GitAnalyzer:
             return {}
+        if self._git_stats_cache is not None:
+            return self._git_stats_cache
 
         try:
             analyzer = GitAnalyzer(str(self.repo_path))
@@ -1177,12 +1618,13 @@ class RepoAnalyzer:
             for file_path, stat_dict in stats.items():
                 file_stats[file_path] = {
                     'total': stat_dict.get('total', 0),
-                    'last_edit': datetime.now()  # TODO: Get actual last edit date from git
+                    'last_edit': datetime.fromtimestamp(stat_dict['last_edit']) if stat_dict.get('last_edit') else datetime.now()
                 }
-
-            return file_stats
         except GitError:
-            return {}
+            file_stats = {}
+
+        self._git_stats_cache = file_stats
+        return file_stats
 
     async def _synthesize_with_llm(self, clusters: List[RuleCluster]) -> str:
         """Use LLM to synthesize final .mdc content from rule clusters."""
@@ -1203,6 +1645,10 @@ class RepoAnalyzer:
                 "totalEdits": cluster.meta.total_edits
             })
 
+        # Pretty-printing a large cluster set is CPU heavy, so keep it off the
+        # event loop while other analyses may be waiting on it
+        cluster_json = await asyncio.to_thread(json.dumps, cluster_data, indent=2)
+
         # LLM prompt for synthesis
         prompt = f"""You are "Cursor-Rule-Synthesizer", an expert at turning candidate coding-standards
 into final .mdc rule files. Output **ONLY** valid Markdown (.mdc) with YAML
@@ -1221,7 +1667,7 @@ Return the files concatenated, separated by:
 
 Here is the JSON array of merged candidate rules:
 
-{json.dumps(cluster_data, indent=2)}"""
+{cluster_json}"""
 
         # Use BAML client to call LLM
         # Note: This is a simplified approach - in practice you might want a dedicated BAML function
@@ -1244,13 +1690,7 @@ Here is the JSON array of merged candidate rules:
             canonical = self._choose_canonical(cluster)
 
             # Create YAML front matter
-            front_matter = {
-                'description': canonical.description,
-                'globs': [canonical.scope_glob],
-                'type': 'autoAttached'
-            }
-
-            yaml_content = yaml.dump(front_matter, default_flow_style=False).strip()
+            yaml_content = format_front_matter(canonical.description, [canonical.scope_glob])
             bullets_content = '\n'.join(f"- {bullet}" for bullet in canonical.bullets)
 
             mdc_content = f"""---
@@ -1308,14 +1748,18 @@ Here is the JSON array of merged candidate rules:
         ]
 
         # Sort by score (highest first)
-        filtered_clusters.sort(key=lambda c: c.meta.score if c.meta else 0, reverse=True)
+        filtered_clusters.sort(key=lambda c: c.meta.score, reverse=True)
 
         # Step 5: Audit and improve merged rules using LLM
         if not filtered_clusters:
             return [], clustering_stats
 
-        improved_rules = []
-        for cluster in filtered_clusters:
+        # Clusters are audited independently, so overlap their LLM calls,
+        # keeping at most max_concurrency in flight
+        max_concurrency = self.rate_limiter.config.max_concurrency if self.rate_limiter else 1
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def audit_cluster(cluster: RuleCluster) -> StaticAnalysisRule:
             try:
                 # Get the canonical (merged) rule
                 canonical = self._choose_canonical(cluster)
@@ -1342,26 +1786,28 @@ Here is the JSON array of merged candidate rules:
 
                 # Only audit if we have multiple rules in the cluster
                 if len(cluster.rules) > 1:
-                    # Use LLM to audit and improve the merged rule
-                    baml_options = self.token_tracker.get_baml_options() if self.token_tracker else {}
-                    audited_rule = await self.client.AuditMergedRule(
-                        cluster_key=cluster.key,
-                        merged_rule=merged_rule,
-                        original_rules=original_rules,
-                        baml_options=baml_options
-                    )
+                    # Use LLM to audit and improve the merged rule. Audits overlap,
+                    # so each call gets its own collector to read its usage from
+                    baml_options = self.token_tracker.get_baml_options(per_call=True) if self.token_tracker else {}
+                    async with semaphore:
+                        audited_rule = await self.client.AuditMergedRule(
+                            cluster_key=cluster.key,
+                            merged_rule=merged_rule,
+                            original_rules=original_rules,
+                            baml_options=baml_options
+                        )
 
                     # Track token usage from this call
                     if self.token_tracker:
-                        self.token_tracker.track_call_from_collector('rule_auditing', 'claude-sonnet-4-20250514')
-                    improved_rules.append(audited_rule)
+                        self.token_tracker.track_call_from_collector('rule_auditing', 'claude-sonnet-4-20250514', baml_options)
+                    return audited_rule
                 else:
                     # Single rule clusters don't need auditing
-                    improved_rules.append(merged_rule)
+                    return merged_rule
 
             except Exception as e:
                 # If auditing fails, fall back to the canonical rule
-                logger.warning(f"Failed to audit cluster {cluster.key}: {e}")
+                logger.warning("Failed to audit cluster %s: %s", cluster.key, e)
                 canonical = self._choose_canonical(cluster)
                 fallback_rule = StaticAnalysisRule(
                     slug=canonical.slug,
@@ -1370,20 +1816,18 @@ Here is the JSON array of merged candidate rules:
                     bullets=canonical.bullets,
                     evidence_lines=canonical.evidence_lines
                 )
-                improved_rules.append(fallback_rule)
+                return fallback_rule
+
+        improved_rules = await asyncio.gather(*(audit_cluster(cluster) for cluster in filtered_clusters))
 
         # Step 6: Convert improved rules to .mdc format
         mdc_files = []
         for rule in improved_rules:
             try:
                 # Create YAML front matter
-                front_matter = {
-                    'description': rule.description,
-                    'globs': [rule.scope_glob] if rule.scope_glob else ["**/*"],
-                    'type': 'autoAttached'
-                }
-
-                yaml_content = yaml.dump(front_matter, default_flow_style=False).strip()
+                yaml_content = format_front_matter(
+                    rule.description, [rule.scope_glob] if rule.scope_glob else ["**/*"]
+                )
                 bullets_content = '\n'.join(f"- {bullet}" for bullet in rule.bullets)
 
                 mdc_content = f"""---
@@ -1394,7 +1838,7 @@ Here is the JSON array of merged candidate rules:
 
                 mdc_files.append(mdc_content)
             except Exception as e:
-                logger.warning(f"Failed to create .mdc for rule {rule.slug}: {e}")
+                logger.warning("Failed to create .mdc for rule %s: %s", rule.slug, e)
                 continue
 
         # Add final statistics
@@ -1404,15 +1848,15 @@ Here is the JSON array of merged candidate rules:
             'avg_commits_per_file': avg_commits_per_file,
             'project_maturity': 'greenfield' if SCORE_THRESHOLD == 1.5 else 'developing' if SCORE_THRESHOLD == 2.0 else 'mature',
             'final_rule_files': len(mdc_files),
-            'audited_rules': len([cluster for cluster in filtered_clusters if len(cluster.rules) > 1]),
+            'audited_rules': sum(1 for cluster in filtered_clusters if len(cluster.rules) > 1),
             'top_clusters': [
                 {
                     'key': cluster.key,
-                    'score': cluster.meta.score if cluster.meta else 0,
-                    'support_files': cluster.meta.support_files if cluster.meta else 0,
+                    'score': cluster.meta.score,
+                    'support_files': cluster.meta.support_files,
                     'rule_count': len(cluster.rules)
                 }
-                for cluster in filtered_clusters[:10]  # Top 10 clusters
+                for cluster in filtered_clusters[:10]  # Top 10 clusters, already sorted by score
             ]
         })
 
@@ -1469,6 +1913,9 @@ Here is the JSON array of merged candidate rules:
             List of created file paths
         """
         created_files = []
+        # Names already taken, listed once rather than probed with exists() per attempt
+        with os.scandir(rules_dir) as entries:
+            taken_names = {entry.name for entry in entries}
 
         for i, content in enumerate(mdc_contents):
             if not content.strip():
@@ -1480,7 +1927,7 @@ Here is the JSON array of merged candidate rules:
                 yaml_end = content.find('---', 3)  # Find second ---
                 if yaml_end > 0:
                     front_matter = content[3:yaml_end].strip()
-                    parsed = yaml.safe_load(front_matter)
+                    parsed = parse_front_matter(front_matter)
                     description = parsed.get('description', f'rule-{i}')
                     filename = self._slugify(description) + '.mdc'
                 else:
@@ -1488,17 +1935,16 @@ Here is the JSON array of merged candidate rules:
             except:
                 filename = f'rule-{i}.mdc'
 
-            file_path = rules_dir / filename
-
             # Ensure we don't overwrite files by adding numbers
+            base_name = filename[:-len('.mdc')]
             counter = 1
-            while file_path.exists():
-                base_name = filename.replace('.mdc', '')
+            while filename in taken_names:
                 filename = f'{base_name}-{counter}.mdc'
-                file_path = rules_dir / filename
                 counter += 1
+            taken_names.add(filename)
 
             # Write the file
+            file_path = rules_dir / filename
             file_path.write_text(content, encoding='utf-8')
             created_files.append(str(file_path.relative_to(self.repo_path)))
 
@@ -1531,32 +1977,30 @@ Here is the JSON array of merged candidate rules:
         """Log detailed information about the rule clustering process."""
 
         # Count raw rules per file
-        rules_per_file = {}
-        for rule in candidate_rules:
-            if rule.file not in rules_per_file:
-                rules_per_file[rule.file] = 0
-            rules_per_file[rule.file] += 1
-
-        # Analyze clusters
-        cluster_stats = []
-        for key, cluster in clusters.items():
-            if cluster.meta:
-                cluster_stats.append({
+        rules_per_file = Counter(rule.file for rule in candidate_rules)
+
+        # Analyze clusters, most important first
+        cluster_stats = sorted(
+            (
+                {
                     'key': key,
                     'rule_count': len(cluster.rules),
                     'support_files': cluster.meta.support_files,
                     'total_edits': cluster.meta.total_edits,
                     'score': cluster.meta.score,
-                    'files': list(set(rule.file for rule in cluster.rules))
-                })
-
-        # Sort by score
-        cluster_stats.sort(key=lambda x: x['score'], reverse=True)
+                    'files': sorted({rule.file for rule in cluster.rules})
+                }
+                for key, cluster in clusters.items()
+                if cluster.meta is not None
+            ),
+            key=itemgetter('score'),
+            reverse=True
+        )
 
         return {
             'total_raw_rules': len(candidate_rules),
             'total_clusters': len(clusters),
-            'rules_per_file': rules_per_file,
+            'rules_per_file': dict(rules_per_file),
             'cluster_stats': cluster_stats,
             'files_with_rules': len(rules_per_file)
         }
@@ -1588,21 +2032,24 @@ Here is the JSON array of merged candidate rules:
         # Limit to reasonable number for AI review
         files_to_review = skipped_files[:20]  # Review max 20 files
 
-        # Prepare file info for AI
-        file_infos = []
-        for file_path in files_to_review:
+        def read_head(file_path: str) -> Optional[Dict[str, str]]:
             full_path = self.repo_path / file_path
             try:
                 with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
                     content = f.read(500)  # Truncate to first 500 chars
-
-                file_infos.append({
-                    'path': file_path,
-                    'extension': full_path.suffix,
-                    'content': content
-                })
             except (IOError, UnicodeDecodeError):
-                continue
+                return None
+            return {
+                'path': file_path,
+                'extension': full_path.suffix,
+                'content': content
+            }
+
+        # Prepare file info for AI, reading the files off the event loop
+        heads = await asyncio.gather(
+            *(asyncio.to_thread(read_head, file_path) for file_path in files_to_review)
+        )
+        file_infos = [head for head in heads if head is not None]
 
         if not file_infos:
             return [], "No readable config files found"
@@ -1641,4 +2088,28 @@ Here is the JSON array of merged candidate rules:
 
         except Exception as e:
             logger.error(f"Failed to review skipped files: {e}")
-            return [], f"AI review failed: {e}"
\ No newline at end of file
+            return [], f"AI review failed: {e}"
+
+    def validate_reviewed_files(self, file_paths: List[str]) -> List[str]:
+        """Check the config files recommended by review_skipped_files before analyzing them.
+
+        Only files that were skipped as config files are accepted, and they
+        still have to pass the binary and size checks every other file goes
+        through.
+
+        Args:
+            file_paths: Paths relative to the repository, as returned by review_skipped_files
+
+        Returns:
+            The files that can be passed to analyze_file with already_validated=True
+        """
+        accepted = []
+        for file_path in dict.fromkeys(file_paths):
+            if file_path not in self.skipped_config:
+                continue
+            is_analyzable, reason = _probe_file(self.repo_path / file_path, allow_config=True)
+            if is_analyzable:
+                accepted.append(file_path)
+            else:
+                self._record_skip(file_path, reason)
+        return accepted
\ No newline at end of file
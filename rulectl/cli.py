@@ -5,14 +5,10 @@ Main CLI module for the Rulectl tool.
 
 import click
 import sys
-import asyncio
 from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
 import json
 import os
-import subprocess
-import yaml
 
 def get_openai_api_key() -> Optional[str]:
     """Get OpenAI API key from environment or fallback file."""
@@ -93,6 +89,8 @@ def mask_api_key(key: str) -> str:
 
 def ensure_api_keys() -> dict:
     """Ensure we have required API keys, prompting user if needed."""
+    from dotenv import load_dotenv
+    
     # Load environment variables with override to ensure .env takes precedence
     load_dotenv(override=True)
     
@@ -337,6 +335,8 @@ def start(verbose: bool, force: bool, rate_limit: Optional[int], batch_size: Opt
     --no-batching: Disable batch processing (process files one by one)
     --strategy: Rate limiting strategy (constant, exponential, adaptive)
     """
+    import asyncio
+    
     try:
         # Run the async main function
         asyncio.run(async_start(verbose, force, rate_limit, batch_size, delay_ms, no_batching, strategy, directory))
@@ -347,6 +347,9 @@ def start(verbose: bool, force: bool, rate_limit: Optional[int], batch_size: Opt
 async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], batch_size: Optional[int],
                      delay_ms: Optional[int], no_batching: bool, strategy: Optional[str], directory: str):
     """Async implementation of the start command."""
+    # Only the start command needs this, so keep it out of CLI startup
+    import subprocess
+    
     # Convert directory to absolute path
     directory = str(Path(directory).resolve())
     
@@ -446,16 +449,16 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
     
     # Now that BAML is initialized, import BAML-dependent modules
     try:
-        from rulectl.analyzer import RepoAnalyzer, MAX_ANALYZABLE_LINES
+        from rulectl.analyzer import RepoAnalyzer, MAX_ANALYZABLE_LINES, format_front_matter, parse_front_matter
     except ImportError:
         try:
-            from .analyzer import RepoAnalyzer, MAX_ANALYZABLE_LINES
+            from .analyzer import RepoAnalyzer, MAX_ANALYZABLE_LINES, format_front_matter, parse_front_matter
         except ImportError:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             parent_dir = os.path.dirname(current_dir)
             if parent_dir not in sys.path:
                 sys.path.insert(0, parent_dir)
-            from rulectl.analyzer import RepoAnalyzer, MAX_ANALYZABLE_LINES
+            from rulectl.analyzer import RepoAnalyzer, MAX_ANALYZABLE_LINES, format_front_matter, parse_front_matter
 
     # Initialize analyzer with the specified directory
     analyzer = RepoAnalyzer(directory)
@@ -487,6 +490,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
     # Optional: Review skipped config files with AI to expand analysis
     skipped_configs = analyzer.get_skipped_config_files()
     ai_reviewed_configs = False
+    additional_files = []
     
     if skipped_configs and not force:
         click.echo(f"\n🤖 Found {len(skipped_configs)} config files that were skipped by default")
@@ -500,7 +504,12 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
             ai_reviewed_configs = True
             click.echo("🔍 AI is reviewing skipped config files...")
             try:
-                additional_files, reasoning = await analyzer.review_skipped_files(skipped_configs)
+                recommended_files, reasoning = await analyzer.review_skipped_files(skipped_configs)
+                # Recommended files still have to pass the size and binary checks
+                additional_files = analyzer.validate_reviewed_files(recommended_files)
+                if len(additional_files) < len(recommended_files):
+                    click.echo(f"\n⚠️  Ignoring {len(recommended_files) - len(additional_files)} recommended files "
+                               "that are too large, unreadable or weren't among the skipped config files")
                 if additional_files:
                     click.echo(f"\n🎯 AI recommends also analyzing {len(additional_files)} config files:")
                     for file_path in additional_files:
@@ -522,6 +531,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
                 click.echo(f"⚠️  AI review failed: {e}")
                 click.echo("Continuing with original file list...")
                 ai_reviewed_configs = False
+                additional_files = []
     
     # Display analysis plan
     click.echo(f"\n📊 Analysis Plan:")
@@ -573,8 +583,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
     all_files = analyzer.get_all_analyzable_files()
     
     # Add any AI-recommended files from the earlier review
-    if 'additional_files' in locals():
-        all_files.extend(additional_files)
+    all_files.extend(additional_files)
     
     if verbose:
         click.echo(f"\n📋 Final analysis list: {len(all_files)} files")
@@ -583,8 +592,6 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
     click.echo("\n🔎 Analyzing files...")
     
     # Progress bar with rate limiting and token tracking
-    all_static_analyses = []
-    
     def get_progress_info(file_path):
         if not file_path:
             return ""
@@ -605,21 +612,24 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
         
         return f"Current: {file_path}{token_info}{rate_info}"
     
+    # Results are collected by position so their order doesn't depend on
+    # which concurrent analysis finishes first
+    results_by_index = {}
     with click.progressbar(
-        all_files,
+        length=len(all_files),
         label="Analyzing files",
         item_show_func=get_progress_info,
         show_eta=True,
         show_percent=True,
         show_pos=True,
-        length=len(all_files),
         bar_template='%(label)s  [%(bar)s]  %(info)s'
     ) as bar:
-        for file_path in bar:
-            # Analyze individual file with rate limiting
-            result = await analyzer.analyze_file(file_path)
-            if result:  # Only add successful analyses
-                all_static_analyses.append(result)
+        # Analyze files concurrently with rate limiting. Every file was already
+        # probed by get_all_analyzable_files or validate_reviewed_files, so
+        # analyze_file only has to read them
+        async for index, file_path, result in analyzer.analyze_files_concurrently(all_files, already_validated=True):
+            results_by_index[index] = result
+            bar.update(1, file_path)
             
             if verbose:
                 status = "✓" if result else "⚠"
@@ -631,6 +641,11 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
                     current_cost = analyzer.token_tracker.total_cost
                     token_info = f" | 📊 {current_tokens:,} tokens (${current_cost:.2f})"
     
+    # Only keep successful analyses
+    all_static_analyses = [
+        results_by_index[index] for index in sorted(results_by_index) if results_by_index[index]
+    ]
+    
     # Display file analysis results with token tracking
     if analyzer.token_tracker:
         token_summary = analyzer.token_tracker.get_current_summary()
@@ -742,7 +757,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
                         yaml_end = content.find('---', 3)
                         if yaml_end > 0:
                             front_matter = content[3:yaml_end].strip()
-                            parsed = yaml.safe_load(front_matter)
+                            parsed = parse_front_matter(front_matter)
                             description = parsed.get('description', f'Rule {i+1}')
                             click.echo(f"  • {description}")
                     except:
@@ -826,7 +841,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
                     return -1  # Fallback for unparseable rules
                 
                 front_matter = mdc_content[3:yaml_end].strip()
-                parsed = yaml.safe_load(front_matter)
+                parsed = parse_front_matter(front_matter)
                 
                 # Extract bullets to match against clusters
                 content_after_yaml = mdc_content[yaml_end + 3:].strip()
@@ -896,7 +911,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
                 yaml_end = mdc_content.find('---', 3)
                 if yaml_end > 0:
                     front_matter = mdc_content[3:yaml_end].strip()
-                    parsed = yaml.safe_load(front_matter)
+                    parsed = parse_front_matter(front_matter)
                     description = parsed.get('description', 'No description')
                     globs = parsed.get('globs', [])
                     
@@ -1071,7 +1086,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
                         yaml_end = remaining_content.find('---', 3)
                         if yaml_end > 0:
                             front_matter = remaining_content[3:yaml_end].strip()
-                            parsed = yaml.safe_load(front_matter)
+                            parsed = parse_front_matter(front_matter)
                             bullets = [line.strip('- ').strip() for line in remaining_content[yaml_end + 3:].strip().split('\n') if line.strip().startswith('-')]
                             
                             # Find corresponding cluster for this rule
@@ -1119,7 +1134,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
                         yaml_end = mdc_content.find('---', 3)
                         if yaml_end > 0:
                             front_matter = mdc_content[3:yaml_end].strip()
-                            parsed = yaml.safe_load(front_matter)
+                            parsed = parse_front_matter(front_matter)
                             description = parsed.get('description', 'No description')
                             globs = parsed.get('globs', ['**/*'])
                             
@@ -1170,11 +1185,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
                                 continue
                                 
                             # Create combined .mdc content for this category
-                            front_matter = {
-                                'description': category.description,
-                                'globs': list(set(rule.scope_glob for rule in category.rules if rule.scope_glob)),
-                                'type': 'autoAttached'
-                            }
+                            globs = list(set(rule.scope_glob for rule in category.rules if rule.scope_glob))
                             
                             # Combine all bullets from rules in this category
                             all_bullets = []
@@ -1189,7 +1200,7 @@ async def async_start(verbose: bool, force: bool, rate_limit: Optional[int], bat
                                     seen.add(bullet)
                                     unique_bullets.append(bullet)
                             
-                            yaml_content = yaml.dump(front_matter, default_flow_style=False).strip()
+                            yaml_content = format_front_matter(category.description, globs)
                             bullets_content = '\n'.join(f"- {bullet}" for bullet in unique_bullets)
                             
                             category_content = f"""---
@@ -178,7 +178,9 @@ class GitAnalyzer:
             branch: Branch to analyze (defaults to main branch)
             
         Returns:
-            Dictionary mapping file paths to statistics (added, modified, deleted counts)
+            Dictionary mapping file paths to statistics (added, modified, deleted
+            counts, and last_edit as the Unix time of the newest commit touching
+            the file)
             
         Raises:
             GitError: If git command fails
@@ -187,11 +189,12 @@ class GitAnalyzer:
             branch = self._main_branch
         
         try:
-            # Use git log with --name-status to get file status (A/M/D)
+            # Use git log with --name-status to get file status (A/M/D); each
+            # commit's file list is preceded by a line with its commit time
             result = subprocess.run([
                 'git', 'log',
                 '--name-status',
-                '--pretty=format:',
+                '--pretty=format:%ct',
                 branch,
                 '--'
             ],
@@ -201,7 +204,8 @@ class GitAnalyzer:
             text=True
             )
             
-            file_stats = defaultdict(lambda: {'added': 0, 'modified': 0, 'deleted': 0, 'total': 0})
+            file_stats = defaultdict(lambda: {'added': 0, 'modified': 0, 'deleted': 0, 'total': 0, 'last_edit': 0})
+            commit_time = 0
             
             for line in result.stdout.splitlines():
                 line = line.strip()
@@ -211,6 +215,9 @@ class GitAnalyzer:
                 # Parse git status format: "M filename" or "A filename" etc.
                 parts = line.split('\t', 1)
                 if len(parts) != 2:
+                    # Commit header line carrying the commit time
+                    if line.isdigit():
+                        commit_time = int(line)
                     continue
                 
                 status, filepath = parts
@@ -235,6 +242,7 @@ class GitAnalyzer:
                 # Update total for any recognized status
                 if status[0] in 'AMDRCTX':
                     file_stats[filepath]['total'] += 1
+                    file_stats[filepath]['last_edit'] = max(file_stats[filepath]['last_edit'], commit_time)
             
             return dict(file_stats)
             
@@ -6,6 +6,9 @@ with configurable delays, exponential backoff, and fallback strategies.
 """
 
 import asyncio
+import math
+import random
+import re
 import time
 import logging
 from typing import Optional, Dict, Any, Callable, Awaitable
@@ -14,6 +17,23 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Fallback for errors that don't carry an HTTP status code
+_RATE_LIMIT_RE = re.compile(r"rate[_ ]?limit|\b429\b|too many requests", re.IGNORECASE)
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an API error means the rate limit was hit.
+    
+    The HTTP status code is used when the error exposes one (directly, as
+    BAML's HTTP errors do, or on an httpx-style response); otherwise the
+    error message is searched.
+    """
+    status_code = getattr(error, 'status_code', None)
+    if status_code is None:
+        status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status_code == 429:
+        return True
+    return bool(_RATE_LIMIT_RE.search(str(error)))
+
 class RateLimitStrategy(Enum):
     """Rate limiting strategies."""
     CONSTANT = "constant"
@@ -29,6 +49,7 @@ class RateLimitConfig:
     exponential_multiplier: float = 2.0
     jitter_ms: int = 100
     strategy: RateLimitStrategy = RateLimitStrategy.ADAPTIVE
+    max_retries: int = 3  # Retries for a request that hits a rate limit
     
     # Fallback configuration
     enable_fallback: bool = True
@@ -38,17 +59,25 @@ class RateLimitConfig:
     enable_batching: bool = True
     max_batch_size: int = 3
     batch_delay_ms: int = 2000  # 2 second delay between batches
+    
+    # Concurrent requests
+    max_concurrency: int = 3  # Upper bound for the adaptive concurrency window
 
 class RateLimiter:
     """
     Intelligent rate limiter for API calls with multiple strategies.
     
     Features:
-    - Configurable rate limits per minute
-    - Multiple delay strategies (constant, exponential, adaptive)
+    - Configurable rate limits per minute, enforced with a token bucket that
+      refills continuously and allows bursts up to the per-minute limit
+    - Retry delays taken from Retry-After when the error carries it
+    - Retry delays following the configured strategy (constant, exponential,
+      adaptive) when Retry-After is absent
     - Automatic fallback to cheaper models when rate limited
     - Batch processing to reduce API calls
     - Jitter to prevent thundering herd problems
+    - Adaptive concurrency: the number of requests allowed in flight grows by
+      one per success and halves on rate limit errors
     """
     
     def __init__(self, config: Optional[RateLimitConfig] = None):
@@ -64,57 +93,105 @@ class RateLimiter:
         self.window_start = time.time()
         self.consecutive_failures = 0
         self.current_delay = self.config.base_delay_ms
+        self.concurrency = 1
+        self.tokens = float(self._bucket_capacity())
+        self.last_refill = time.monotonic()
+        
+    def _bucket_capacity(self) -> int:
+        """Maximum number of requests that can be sent in a burst."""
+        return max(1, self.config.requests_per_minute)
+        
+    def _refill_tokens(self) -> None:
+        """Add the tokens accrued since the last refill, up to the bucket capacity."""
+        now = time.monotonic()
+        refill_rate = self._bucket_capacity() / 60.0
+        self.tokens = min(self._bucket_capacity(), self.tokens + (now - self.last_refill) * refill_rate)
+        self.last_refill = now
         
     def _reset_window(self):
         """Reset the rate limiting window."""
         self.window_start = time.time()
         self.request_count = 0
         
-    def _should_rate_limit(self) -> bool:
-        """Check if we should rate limit based on current usage."""
-        current_time = time.time()
-        
-        # Reset window if more than 1 minute has passed
-        if current_time - self.window_start >= 60:
-            self._reset_window()
-            return False
-            
-        # Check if we're at the limit
-        return self.request_count >= self.config.requests_per_minute
+    def _calculate_delay(self, backoff_steps: int) -> float:
+        """Calculate the delay needed based on the current strategy.
         
-    def _calculate_delay(self) -> float:
-        """Calculate the delay needed based on the current strategy."""
-        if self.consecutive_failures == 0:
+        Args:
+            backoff_steps: How many times in a row the request has already
+                been delayed; 0 gives the base delay
+        """
+        if backoff_steps == 0:
             # No failures, use base delay
             delay = self.config.base_delay_ms
         elif self.config.strategy == RateLimitStrategy.CONSTANT:
             delay = self.config.base_delay_ms
         elif self.config.strategy == RateLimitStrategy.EXPONENTIAL:
             delay = min(
-                self.config.base_delay_ms * (self.config.exponential_multiplier ** self.consecutive_failures),
+                self.config.base_delay_ms * (self.config.exponential_multiplier ** backoff_steps),
                 self.config.max_delay_ms
             )
         else:  # ADAPTIVE
             # Start with exponential, but cap it
             delay = min(
-                self.config.base_delay_ms * (self.config.exponential_multiplier ** min(self.consecutive_failures, 3)),
+                self.config.base_delay_ms * (self.config.exponential_multiplier ** min(backoff_steps, 3)),
                 self.config.max_delay_ms
             )
             
         # Add jitter to prevent thundering herd
-        import random
         jitter = random.randint(-self.config.jitter_ms, self.config.jitter_ms)
         delay = max(0, delay + jitter)
         
         return delay / 1000.0  # Convert to seconds
         
     async def wait_if_needed(self) -> None:
-        """Wait if rate limiting is needed."""
-        if self._should_rate_limit():
-            delay = self._calculate_delay()
-            logger.info(f"Rate limit reached. Waiting {delay:.2f} seconds...")
+        """Wait until a request token is available, then take it."""
+        refill_rate = self._bucket_capacity() / 60.0
+        while True:
+            self._refill_tokens()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            delay = (1 - self.tokens) / refill_rate
+            logger.info("Rate limit reached. Waiting %.2f seconds...", delay)
             await asyncio.sleep(delay)
-            self._reset_window()
+            
+    def get_retry_delay(self, error: Exception, attempt: int) -> float:
+        """Get how long to wait before retrying a rate limited request.
+        
+        Uses the Retry-After header when the error exposes one (capped at
+        max_delay_ms, or a minute if that is longer), otherwise
+        backs off following the configured strategy: a constant delay,
+        exponential backoff capped at max_delay_ms, or (adaptive) exponential
+        backoff limited to three doublings that also counts the failures of
+        other requests. Jitter is added in every case.
+        
+        Args:
+            error: The rate limit error
+            attempt: Number of retries already made for this request
+            
+        Returns:
+            Delay in seconds
+        """
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None) or getattr(error, 'headers', None)
+        if headers:
+            try:
+                retry_after = float(headers.get('Retry-After') or headers.get('retry-after'))
+            except (TypeError, ValueError):
+                # Missing, or an HTTP date rather than a number of seconds
+                retry_after = None
+            if retry_after is not None and not math.isnan(retry_after):
+                # Don't let a huge or bogus value stall the request indefinitely
+                max_retry_after = max(self.config.max_delay_ms / 1000.0, 60.0)
+                delay = min(max(0.0, retry_after), max_retry_after)
+                # Jitter only ever lengthens the wait the server asked for
+                return delay + random.randint(0, self.config.jitter_ms) / 1000.0
+                
+        backoff_steps = attempt
+        if self.config.strategy == RateLimitStrategy.ADAPTIVE:
+            # record_failure has already counted this request's failure
+            backoff_steps = max(attempt, self.consecutive_failures - 1)
+        return self._calculate_delay(backoff_steps)
             
     def record_request(self) -> None:
         """Record that a request was made."""
@@ -131,23 +208,25 @@ class RateLimiter:
         """Record a successful request."""
         self.consecutive_failures = 0
         self.current_delay = self.config.base_delay_ms
+        self.concurrency = min(self.concurrency + 1, max(1, self.config.max_concurrency))
         
     def record_failure(self, error: Exception) -> None:
         """Record a failed request and adjust strategy."""
         self.consecutive_failures += 1
         
         # Check if it's a rate limit error
-        error_str = str(error).lower()
-        if "rate_limit" in error_str or "429" in error_str or "too many requests" in error_str:
-            logger.warning(f"Rate limit error detected: {error}")
+        if is_rate_limit_error(error):
+            logger.warning("Rate limit error detected: %s", error)
             # Increase delay more aggressively for rate limit errors
             self.current_delay = min(
                 self.current_delay * 2,
                 self.config.max_delay_ms
             )
+            # Back off on the number of requests in flight as well
+            self.concurrency = max(1, self.concurrency // 2)
         else:
             # Regular error, use normal backoff
-            self.current_delay = self._calculate_delay() * 1000  # Convert back to ms
+            self.current_delay = self._calculate_delay(self.consecutive_failures) * 1000  # Convert back to ms
             
     async def execute_with_rate_limiting(
         self, 
@@ -171,8 +250,10 @@ class RateLimiter:
         """
         try:
             await self.wait_if_needed()
-            result = await func(*args, **kwargs)
+            # Count the request before awaiting it, so concurrent callers see
+            # the slot as taken
             self.record_request()
+            result = await func(*args, **kwargs)
             self.record_success()
             return result
         except Exception as e:
@@ -224,13 +305,14 @@ class RateLimiter:
             # Add delay between batches if not the last batch
             if i + batch_size < len(items):
                 delay = self.config.batch_delay_ms / 1000.0
-                logger.info(f"Batch completed. Waiting {delay:.2f} seconds before next batch...")
+                logger.info("Batch completed. Waiting %.2f seconds before next batch...", delay)
                 await asyncio.sleep(delay)
                 
         return results
         
     def get_status(self) -> Dict[str, Any]:
         """Get current rate limiter status."""
+        self._refill_tokens()
         current_time = time.time()
         window_remaining = max(0, 60 - (current_time - self.window_start))
         
@@ -240,8 +322,10 @@ class RateLimiter:
             "window_remaining_seconds": window_remaining,
             "consecutive_failures": self.consecutive_failures,
             "current_delay_ms": self.current_delay,
+            "concurrency": self.concurrency,
             "last_request_time": self.last_request_time,
-            "rate_limited": self._should_rate_limit()
+            "tokens_available": self.tokens,
+            "rate_limited": self.tokens < 1
         }
         
     def reset(self) -> None:
@@ -251,3 +335,6 @@ class RateLimiter:
         self.window_start = time.time()
         self.consecutive_failures = 0
         self.current_delay = self.config.base_delay_ms
+        self.concurrency = 1
+        self.tokens = float(self._bucket_capacity())
+        self.last_refill = time.monotonic()
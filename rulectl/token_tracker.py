@@ -49,6 +49,9 @@ class TokenTracker:
     
     Thread Safety:
         This class is not thread-safe. Create separate instances for concurrent usage.
+        Calls that overlap on one event loop must each use their own collector:
+        pass get_baml_options(per_call=True) to the call and the same options to
+        track_call_from_collector().
     """
     
     def __init__(self):
@@ -76,11 +79,13 @@ class TokenTracker:
         self.total_cost = 0.0
         self.call_count = 0
         self.collector = None
+        self._collector_class = None
         
         # Initialize BAML Collector if available
         try:
             from baml_py import Collector
             self.collector = Collector(name="rulectl-tracker")
+            self._collector_class = Collector
         except ImportError:
             # Fallback if Collector not available
             self.collector = None
@@ -188,7 +193,7 @@ class TokenTracker:
             '_default': 'claude-sonnet-4-20250514'
         }
     
-    def get_baml_options(self):
+    def get_baml_options(self, per_call: bool = False):
         """Get BAML options dictionary for API calls with collector integration.
         
         Returns the appropriate options dictionary to pass to BAML API calls
@@ -200,6 +205,12 @@ class TokenTracker:
             result = await client.AnalyzeFile(file=file_info, baml_options=baml_options)
             tracker.track_call_from_collector('file_analysis')
         
+        Args:
+            per_call (bool, optional): Use a new collector for this call instead
+                of the shared one. Needed when calls run concurrently, since the
+                shared collector's last call may belong to another request. Pass
+                the returned options to track_call_from_collector().
+        
         Returns:
             dict: BAML options dictionary. Contains:
                 - {"collector": collector_instance} if collector available
@@ -213,11 +224,14 @@ class TokenTracker:
         Note:
             Always returns a dictionary (never None) for safe unpacking in API calls.
         """
+        if per_call and self._collector_class:
+            return {"collector": self._collector_class(name="rulectl-call")}
         if self.collector:
             return {"collector": self.collector}
         return {}
     
-    def track_call_from_collector(self, phase: str, model: str = "claude-sonnet-4-20250514"):
+    def track_call_from_collector(self, phase: str, model: str = "claude-sonnet-4-20250514",
+                                  baml_options: dict = None):
         """Extract token usage from BAML Collector and update tracking with intelligent fallback.
         
         This is the primary method for tracking token usage after BAML API calls.
@@ -241,6 +255,9 @@ class TokenTracker:
             model (str, optional): Model identifier for cost calculation.
                 Must match a model in the pricing configuration.
                 Defaults to 'claude-sonnet-4-20250514'.
+            baml_options (dict, optional): The options the call was made with.
+                Their collector is read instead of the shared one, which is
+                required for options from get_baml_options(per_call=True).
         
         Behavior:
             1. If BAML Collector available and has usage data:
@@ -264,14 +281,15 @@ class TokenTracker:
             This method never raises exceptions. All errors trigger fallback estimation
             to ensure robust operation in production environments.
         """
-        if not self.collector or not hasattr(self.collector, 'last'):
+        collector = baml_options.get("collector") if baml_options else self.collector
+        if not collector or not hasattr(collector, 'last'):
             # Fallback: estimate token usage if collector not available
             self.add_estimated_usage(phase, model)
             return
         
         try:
             # Get usage from the last call
-            last_call = self.collector.last
+            last_call = collector.last
             if hasattr(last_call, 'usage') and last_call.usage:
                 input_tokens = getattr(last_call.usage, 'input_tokens', 0)
                 output_tokens = getattr(last_call.usage, 'output_tokens', 0)
@@ -55,7 +55,7 @@ setup(
             "mypy>=1.0.0",
         ],
         "build": [
-            "PyInstaller>=5.13.0",
+            "PyInstaller>=6.6.0",
         ],
     },
     entry_points={
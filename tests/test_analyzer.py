@@ -0,0 +1,305 @@
+"""
+Regression tests for the file probe, ignore matching, front matter and rule
+file helpers in rulectl.analyzer.
+
+These need the generated BAML client; run `python baml_init.py` first.
+"""
+
+import asyncio
+import itertools
+import json
+import random
+
+import pathspec
+import pytest
+import yaml
+from pathspec.util import normalize_file
+
+from rulectl import analyzer
+from rulectl.analyzer import (
+    DEFAULT_IGNORE_REGEX,
+    DEFAULT_IGNORE_SPEC,
+    MAX_ANALYZABLE_BYTES,
+    MAX_ANALYZABLE_LINES,
+    PROBE_BYTES,
+    RepoAnalyzer,
+    YamlSafeDumper,
+    YamlSafeLoader,
+    _probe_file,
+    compile_ignore_regex,
+    format_front_matter,
+)
+from rulectl.rate_limiter import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def probe_cache_dir(tmp_path, monkeypatch):
+    """Keep probe caches out of the real user cache directory."""
+    cache_dir = tmp_path / "probe-cache"
+    monkeypatch.setattr(analyzer, "PROBE_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+# ===== File probe =====
+
+PROBE_FIXTURES = {
+    # name: (content, expected verdict)
+    "main.py": (b"print('hello')\n", (True, "")),
+    "empty.py": (b"", (True, "")),
+    "settings.json": (b'{"a": 1}\n', (False, "config_file")),
+    "logo.png": (b"\x89PNG\r\n", (False, "binary")),
+    "nulls.py": (b"abc\0def\n", (False, "binary")),
+    "latin1.py": ("café\n".encode("latin-1"), (False, "binary")),
+    "mostly_non_ascii.md": (("é" * 600 + "\n").encode("utf-8"), (False, "binary")),
+    "last_allowed.py": (b"x\n" * (MAX_ANALYZABLE_LINES - 1), (True, "")),
+    "too_many_lines.py": (b"x\n" * MAX_ANALYZABLE_LINES, (False, "too_large")),
+    "too_many_bytes.py": (b"x" * (MAX_ANALYZABLE_BYTES + 1), (False, "too_large")),
+    # A multi-byte character split by the end of the probed prefix is fine
+    "split_char.py": (b"x" * (PROBE_BYTES - 1) + "é".encode("utf-8"), (True, "")),
+}
+
+
+@pytest.fixture
+def probe_tree(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for name, (content, _) in PROBE_FIXTURES.items():
+        (repo / name).write_bytes(content)
+    return repo
+
+
+@pytest.mark.parametrize("name", sorted(PROBE_FIXTURES))
+def test_probe_verdicts(probe_tree, name):
+    path = probe_tree / name
+    expected = PROBE_FIXTURES[name][1]
+    assert _probe_file(path) == expected
+    assert _probe_file(str(path), path.stat().st_size) == expected
+
+
+def test_probe_missing_file_is_unreadable(tmp_path):
+    assert _probe_file(tmp_path / "missing.py") == (False, "unreadable")
+
+
+def test_probe_allow_config_still_checks_size(probe_tree):
+    assert _probe_file(probe_tree / "settings.json", allow_config=True) == (True, "")
+    big_config = probe_tree / "big.yaml"
+    big_config.write_bytes(b"a: 1\n" * MAX_ANALYZABLE_LINES)
+    assert _probe_file(big_config, allow_config=True) == (False, "too_large")
+
+
+def test_read_analyzable_content_rejects_invalid_utf8_past_prefix(tmp_path):
+    path = tmp_path / "late_binary.py"
+    path.write_bytes(b"x" * (PROBE_BYTES * 2) + b"\xff\n")
+    repo_analyzer = RepoAnalyzer(str(tmp_path))
+    assert _probe_file(path) == (True, "")
+    assert repo_analyzer.read_analyzable_content(path) is None
+
+
+def test_count_analyzable_files_records_skips(probe_tree):
+    repo_analyzer = RepoAnalyzer(str(probe_tree))
+    total, extension_counts = repo_analyzer.count_analyzable_files()
+    accepted = sorted(name for name, (_, verdict) in PROBE_FIXTURES.items() if verdict[0])
+    assert total == len(accepted)
+    assert sorted(repo_analyzer.get_all_analyzable_files()) == accepted
+    assert repo_analyzer.skipped_config == {"settings.json"}
+    assert repo_analyzer.skipped_large == {"too_many_lines.py", "too_many_bytes.py"}
+    # logo.png is dropped by the default ignore patterns before probing
+    assert repo_analyzer.skipped_binary == {"nulls.py", "latin1.py", "mostly_non_ascii.md"}
+
+
+# ===== Probe cache =====
+
+def test_probe_cache_is_reused_and_kept_out_of_the_repo(probe_tree, probe_cache_dir, monkeypatch):
+    first = RepoAnalyzer(str(probe_tree)).get_all_analyzable_files()
+    assert not (probe_tree / ".rulectl").exists()
+    assert len(list(probe_cache_dir.glob("*.json"))) == 1
+
+    # Unchanged files are answered from the cache without probing
+    def fail_probe(*args, **kwargs):
+        raise AssertionError("file was probed again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(analyzer, "_probe_file", fail_probe)
+        assert RepoAnalyzer(str(probe_tree)).get_all_analyzable_files() == first
+
+    # A changed file is probed again
+    (probe_tree / "main.py").write_bytes(b"x\n" * MAX_ANALYZABLE_LINES)
+    assert "main.py" not in RepoAnalyzer(str(probe_tree)).get_all_analyzable_files()
+
+
+def test_probe_cache_drops_deleted_files(probe_tree, probe_cache_dir):
+    RepoAnalyzer(str(probe_tree)).get_all_analyzable_files()
+    (probe_tree / "empty.py").unlink()
+    (probe_tree / "main.py").rename(probe_tree / "renamed.py")
+    RepoAnalyzer(str(probe_tree)).get_all_analyzable_files()
+
+    (cache_file,) = probe_cache_dir.glob("*.json")
+    cached = set(json.loads(cache_file.read_text(encoding="utf-8"))["files"])
+    assert "empty.py" not in cached
+    assert "main.py" not in cached
+    assert "renamed.py" in cached
+
+
+# ===== Ignore patterns =====
+
+PATH_SEGMENTS = [
+    "src", "lib", "node_modules", "build", "dist", "vendor", ".git", ".rulectl",
+    ".cursor", "rules", "__pycache__", "Debug", "fixtures", "logs", "docs", "a",
+]
+FILE_NAMES = [
+    "main.py", "app.min.js", "style.css", ".env", ".env.local", "README.md",
+    "notes.txt", "secret_config.py", "api_key.js", "server.log", "x.pyc",
+    "sample.py", "dummy.rs", "Cargo.lock", "#scratch#", "file~", "rules.mdc",
+    "index.html", "go.sum", "Thumbs.db", "image.PNG", "data.sqlite3",
+]
+
+
+def _candidate_paths():
+    for depth in range(3):
+        for dirs in itertools.product(PATH_SEGMENTS, repeat=depth):
+            prefix = "/".join(dirs)
+            for name in FILE_NAMES:
+                yield f"{prefix}/{name}" if prefix else name
+            if prefix:
+                yield prefix + "/"
+
+
+def test_default_ignore_regex_matches_pathspec():
+    for path in _candidate_paths():
+        expected = DEFAULT_IGNORE_SPEC.match_file(path)
+        assert bool(DEFAULT_IGNORE_REGEX.match(normalize_file(path))) == expected, path
+
+
+def test_custom_ignore_regex_matches_pathspec():
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", [
+        "# comment", "", "*.py[cod]", "/build", "docs/**/*.md", "a/**/main.py",
+        "**/logs", "lib/*", "*.css", "src/", "?ummy.*", "[Tt]humbs.db",
+    ])
+    regex = compile_ignore_regex(spec)
+    for path in _candidate_paths():
+        assert bool(regex.match(normalize_file(path))) == spec.match_file(path), path
+
+
+def test_compile_ignore_regex_rejects_negation():
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", ["*.log", "!keep.log"])
+    with pytest.raises(ValueError):
+        compile_ignore_regex(spec)
+
+
+def test_empty_spec_matches_nothing():
+    regex = compile_ignore_regex(pathspec.PathSpec.from_lines("gitwildmatch", []))
+    assert not regex.match("anything.py")
+
+
+# ===== Front matter =====
+
+def _dump_front_matter(description, globs, **kwargs):
+    front_matter = {
+        'description': description,
+        'globs': globs,
+        'type': 'autoAttached'
+    }
+    return yaml.dump(front_matter, default_flow_style=False, **kwargs).strip()
+
+
+FRONT_MATTER_CASES = [
+    ("Use pathlib for file and path operations", ["**/*.py"]),
+    ("Prefer f-strings", ["src/**/*.py", "*.py", "tests/*"]),
+    ("Handle errors (and log them)", ["**/*"]),
+    ("yes", ["*.py"]),
+    ("Null", ["null"]),
+    ("Ends with a colon:", ["*.js"]),
+    ("Contains: a colon", ["*.js"]),
+    ("# not a comment", ["*.ts"]),
+    ("Trailing space ", ["*.ts"]),
+    ("Two  spaces", ["*.ts"]),
+    ("- leading dash", ["*.ts"]),
+    ("quotes 'inside'", ["'*.py'"]),
+    ("123", ["*.py"]),
+    ("Unicode café", ["*.py"]),
+    ("A very long description that goes well past the point where the dumper wraps lines", ["*.py"]),
+    ("Short", ["src/" + "x" * 80 + "/*.py"]),
+    ("Empty globs", []),
+    ("Glob with braces", ["**/*.{ts,tsx}"]),
+    ("Glob with brackets", ["[abc].py"]),
+    ("Glob starting with !", ["!*.py"]),
+]
+
+
+@pytest.mark.parametrize("description,globs", FRONT_MATTER_CASES)
+def test_format_front_matter_matches_yaml_dump(description, globs):
+    assert format_front_matter(description, globs) == _dump_front_matter(description, globs)
+
+
+def test_format_front_matter_matches_yaml_dump_on_random_input():
+    rng = random.Random(1234)
+    description_chars = "abcXYZ019 -_.,()/'+:#*&!?\"%@é\t"
+    glob_chars = "abz09_.*/-!{}[],? '"
+    for _ in range(5000):
+        description = ''.join(rng.choice(description_chars) for _ in range(rng.randint(0, 80)))
+        globs = [
+            ''.join(rng.choice(glob_chars) for _ in range(rng.randint(0, 20)))
+            for _ in range(rng.randint(0, 3))
+        ]
+        formatted = format_front_matter(description, globs)
+        # libyaml may wrap long quoted scalars at a different column than the
+        # pure Python emitter, so compare against the dumper the writer uses
+        assert formatted == _dump_front_matter(description, globs, Dumper=YamlSafeDumper), (description, globs)
+        assert yaml.load(formatted, Loader=YamlSafeLoader) == {
+            'description': description,
+            'globs': globs,
+            'type': 'autoAttached',
+        }
+
+
+# ===== Rule files =====
+
+def test_save_mdc_files_numbers_collisions_from_the_base_name(tmp_path):
+    rules_dir = tmp_path / ".cursor" / "rules"
+    rules_dir.mkdir(parents=True)
+    (rules_dir / "a-rule.mdc").write_text("existing", encoding="utf-8")
+    (rules_dir / "a-rule-1.mdc").write_text("existing", encoding="utf-8")
+
+    content = "---\n" + format_front_matter("A rule", ["*.py"]) + "\n---\n\n- bullet"
+    created = RepoAnalyzer(str(tmp_path)).save_mdc_files(
+        [content, content, "", content, "no front matter"], rules_dir
+    )
+
+    rules_prefix = ".cursor/rules/"
+    assert created == [
+        rules_prefix + "a-rule-2.mdc",
+        rules_prefix + "a-rule-3.mdc",
+        rules_prefix + "a-rule-4.mdc",
+        rules_prefix + "rule-4.mdc",
+    ]
+    assert (rules_dir / "a-rule.mdc").read_text(encoding="utf-8") == "existing"
+    assert (rules_dir / "a-rule-2.mdc").read_text(encoding="utf-8") == content
+
+
+# ===== Concurrent analysis =====
+
+def test_analyze_files_concurrently_waits_for_cancelled_analyses(tmp_path):
+    repo_analyzer = RepoAnalyzer(str(tmp_path))
+    repo_analyzer.rate_limiter = RateLimiter()
+    repo_analyzer.rate_limiter.concurrency = 3
+    cancelled = []
+
+    async def analyze_file(file_path, already_validated=False):
+        if file_path == "fails.py":
+            await asyncio.sleep(0)
+            raise ValueError("analysis failed")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cancelled.append(file_path)
+
+    repo_analyzer.analyze_file = analyze_file
+
+    async def consume():
+        with pytest.raises(ValueError):
+            async for _ in repo_analyzer.analyze_files_concurrently(["slow1.py", "fails.py", "slow2.py"]):
+                pass
+        # The other analyses have finished cancelling by the time the error surfaces
+        assert sorted(cancelled) == ["slow1.py", "slow2.py"]
+
+    asyncio.run(consume())
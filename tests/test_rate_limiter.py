@@ -0,0 +1,206 @@
+"""
+Regression tests for the token bucket, retry backoff and rate limit error
+detection in rulectl.rate_limiter.
+"""
+
+import asyncio
+
+import pytest
+
+from rulectl import rate_limiter
+from rulectl.rate_limiter import (
+    RateLimitConfig,
+    RateLimiter,
+    RateLimitStrategy,
+    is_rate_limit_error,
+)
+
+
+class FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def _limiter(**overrides):
+    return RateLimiter(RateLimitConfig(jitter_ms=0, **overrides))
+
+
+# ===== Token bucket =====
+
+def test_bucket_allows_a_burst_up_to_the_per_minute_limit(clock):
+    limiter = _limiter(requests_per_minute=5)
+    for _ in range(5):
+        asyncio.run(limiter.wait_if_needed())
+    assert clock.sleeps == []
+    assert limiter.get_status()["rate_limited"]
+
+
+def test_bucket_waits_for_the_next_token(clock):
+    limiter = _limiter(requests_per_minute=6)
+    for _ in range(6):
+        asyncio.run(limiter.wait_if_needed())
+    asyncio.run(limiter.wait_if_needed())
+    # One token per 10 seconds at 6 requests per minute
+    assert clock.sleeps == [pytest.approx(10.0)]
+    assert limiter.tokens == pytest.approx(0.0)
+
+
+def test_bucket_refills_continuously_up_to_capacity(clock):
+    limiter = _limiter(requests_per_minute=6)
+    for _ in range(6):
+        asyncio.run(limiter.wait_if_needed())
+    clock.now += 25
+    assert limiter.get_status()["tokens_available"] == pytest.approx(2.5)
+    clock.now += 3600
+    assert limiter.get_status()["tokens_available"] == pytest.approx(6)
+
+
+def test_bucket_with_zero_limit_still_lets_requests_through(clock):
+    limiter = _limiter(requests_per_minute=0)
+    asyncio.run(limiter.wait_if_needed())
+    asyncio.run(limiter.wait_if_needed())
+    assert clock.sleeps == [pytest.approx(60.0)]
+
+
+# ===== Retry delays =====
+
+class HeaderError(Exception):
+    def __init__(self, headers):
+        super().__init__("429 Too Many Requests")
+        self.headers = headers
+
+
+class ResponseError(Exception):
+    def __init__(self, headers):
+        super().__init__("429 Too Many Requests")
+        self.response = type("Response", (), {"headers": headers})()
+
+
+@pytest.mark.parametrize("error,expected", [
+    (HeaderError({"Retry-After": "7"}), 7.0),
+    (HeaderError({"retry-after": "1.5"}), 1.5),
+    (ResponseError({"Retry-After": "12"}), 12.0),
+    (HeaderError({"Retry-After": "-3"}), 0.0),
+])
+def test_retry_delay_uses_retry_after(error, expected):
+    assert _limiter().get_retry_delay(error, attempt=2) == expected
+
+
+@pytest.mark.parametrize("retry_after", ["3600", "1e9", "inf"])
+def test_retry_delay_caps_huge_retry_after(retry_after):
+    error = HeaderError({"Retry-After": retry_after})
+    assert _limiter(max_delay_ms=20000).get_retry_delay(error, attempt=0) == 60.0
+    assert _limiter(max_delay_ms=300000).get_retry_delay(error, attempt=0) == 300.0
+
+
+def test_retry_delay_ignores_nan_retry_after():
+    error = HeaderError({"Retry-After": "nan"})
+    limiter = _limiter(strategy=RateLimitStrategy.CONSTANT, base_delay_ms=250)
+    assert limiter.get_retry_delay(error, attempt=1) == 0.25
+
+
+def test_retry_after_jitter_only_lengthens_the_wait():
+    limiter = RateLimiter(RateLimitConfig(jitter_ms=100))
+    error = HeaderError({"Retry-After": "2"})
+    delays = {limiter.get_retry_delay(error, attempt=0) for _ in range(200)}
+    assert all(2.0 <= delay <= 2.1 for delay in delays)
+    assert len(delays) > 1
+
+
+def test_retry_delay_ignores_http_date_retry_after():
+    error = HeaderError({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    limiter = _limiter(strategy=RateLimitStrategy.CONSTANT, base_delay_ms=250)
+    assert limiter.get_retry_delay(error, attempt=1) == 0.25
+
+
+@pytest.mark.parametrize("strategy,expected", [
+    (RateLimitStrategy.CONSTANT, [1.0, 1.0, 1.0, 1.0, 1.0, 1.0]),
+    (RateLimitStrategy.EXPONENTIAL, [1.0, 2.0, 4.0, 8.0, 16.0, 20.0]),
+    (RateLimitStrategy.ADAPTIVE, [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]),
+])
+def test_retry_delay_follows_strategy(strategy, expected):
+    limiter = _limiter(strategy=strategy, base_delay_ms=1000, max_delay_ms=20000)
+    error = Exception("rate limit exceeded")
+    assert [limiter.get_retry_delay(error, attempt) for attempt in range(6)] == expected
+
+
+def test_adaptive_retry_delay_counts_other_failures():
+    limiter = _limiter(strategy=RateLimitStrategy.ADAPTIVE, base_delay_ms=1000)
+    error = Exception("rate limit exceeded")
+    for _ in range(3):
+        limiter.record_failure(error)
+    assert limiter.get_retry_delay(error, attempt=0) == 4.0
+
+    exponential = _limiter(strategy=RateLimitStrategy.EXPONENTIAL, base_delay_ms=1000)
+    for _ in range(3):
+        exponential.record_failure(error)
+    assert exponential.get_retry_delay(error, attempt=0) == 1.0
+
+
+def test_retry_delay_adds_bounded_jitter():
+    limiter = RateLimiter(RateLimitConfig(
+        strategy=RateLimitStrategy.CONSTANT, base_delay_ms=1000, jitter_ms=100
+    ))
+    delays = {limiter.get_retry_delay(Exception("429"), attempt=1) for _ in range(200)}
+    assert all(0.9 <= delay <= 1.1 for delay in delays)
+    assert len(delays) > 1
+
+
+# ===== Concurrency window =====
+
+def test_concurrency_grows_on_success_and_halves_on_rate_limits():
+    limiter = _limiter(max_concurrency=4)
+    for _ in range(10):
+        limiter.record_success()
+    assert limiter.concurrency == 4
+    limiter.record_failure(Exception("429 Too Many Requests"))
+    assert limiter.concurrency == 2
+    limiter.record_failure(ValueError("bad response"))
+    assert limiter.concurrency == 2
+
+
+# ===== Rate limit errors =====
+
+class StatusError(Exception):
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class HttpxStyleError(Exception):
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.response = type("Response", (), {"status_code": status_code})()
+
+
+@pytest.mark.parametrize("error,expected", [
+    (StatusError("request failed", 429), True),
+    (HttpxStyleError("request failed", 429), True),
+    (Exception("Rate limit exceeded"), True),
+    (Exception("rate_limit_error: slow down"), True),
+    (Exception("HTTP 429"), True),
+    (Exception("Too Many Requests"), True),
+    (StatusError("Internal server error", 500), False),
+    (Exception("timeout after 4290ms"), False),
+    (Exception("context length exceeded"), False),
+])
+def test_is_rate_limit_error(error, expected):
+    assert is_rate_limit_error(error) is expected